@@ -0,0 +1,112 @@
+"""Backends that run the eval and improvement subprocesses.
+
+run_eval and improve_description only need two commands: one that answers
+a query as stream-json (so triggering can be detected), and one that reads
+a prompt on stdin and answers it, also as stream-json. ClaudeBackend runs
+the real `claude -p`; FakeBackend runs scripts/fake_claude.py, which needs
+no network and behaves deterministically, for exercising and benchmarking
+the harness.
+
+Select one with --backend: "claude" (default) or
+"fake[:key=value,...]", e.g. "fake:trigger_rate=0.3,latency=0.5".
+"""
+
+import os
+import sys
+from pathlib import Path
+
+FAKE_CLAUDE = Path(__file__).with_name("fake_claude.py")
+
+
+class ClaudeBackend:
+    name = "claude"
+    # Distinguishes cached and journaled results of stand-in backends
+    cache_tag = ""
+
+    def eval_command(self, query: str, skill_command: str, model: str | None) -> list[str]:
+        cmd = [
+            "claude",
+            "-p", query,
+            "--output-format", "stream-json",
+            "--verbose",
+            "--include-partial-messages",
+        ]
+        if model:
+            cmd.extend(["--model", model])
+        return cmd
+
+    def prompt_command(self, model: str | None) -> list[str]:
+        cmd = ["claude", "-p", "--output-format", "stream-json", "--verbose"]
+        if model:
+            cmd.extend(["--model", model])
+        return cmd
+
+    def env(self) -> dict[str, str]:
+        # Remove CLAUDECODE env var to allow nesting claude -p inside a
+        # Claude Code session. The guard is for interactive terminal conflicts;
+        # programmatic subprocess usage is safe.
+        return {k: v for k, v in os.environ.items() if k != "CLAUDECODE"}
+
+
+class FakeBackend(ClaudeBackend):
+    """Scripted stream-json emitter; see fake_claude.py for the options."""
+
+    name = "fake"
+
+    def __init__(
+        self,
+        trigger_rate: float = 0.5,
+        latency: float = 0.0,
+        event_delay: float = 0.0,
+        text_bytes: int = 2048,
+        seed: str = "0",
+        error_rate: float = 0.0,
+    ):
+        self.options = {
+            "trigger-rate": trigger_rate,
+            "latency": latency,
+            "event-delay": event_delay,
+            "text-bytes": text_bytes,
+            "seed": seed,
+        }
+        self.cache_tag = "fake:" + ",".join(f"{k}={v}" for k, v in self.options.items())
+        # Failed runs are retried, never recorded, so they don't change the tag
+        self.options["error-rate"] = error_rate
+
+    def _command(self, mode: str, model: str | None) -> list[str]:
+        cmd = [sys.executable, str(FAKE_CLAUDE), mode]
+        for option, value in self.options.items():
+            cmd.extend([f"--{option}", str(value)])
+        if model:
+            cmd.extend(["--model", model])
+        return cmd
+
+    def eval_command(self, query: str, skill_command: str, model: str | None) -> list[str]:
+        return self._command("eval", model) + ["--query", query, "--skill", skill_command]
+
+    def prompt_command(self, model: str | None) -> list[str]:
+        return self._command("improve", model)
+
+
+BACKENDS = {"claude": ClaudeBackend, "fake": FakeBackend}
+OPTION_TYPES = {
+    "trigger_rate": float, "latency": float, "event_delay": float, "text_bytes": int, "seed": str, "error_rate": float,
+}
+
+
+def get_backend(spec: str = "claude") -> ClaudeBackend:
+    """Build a backend from a "name[:key=value,...]" spec."""
+    name, _, options = spec.partition(":")
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend {name!r} (choose from: {', '.join(BACKENDS)})")
+
+    kwargs = {}
+    for option in filter(None, options.split(",")):
+        key, _, value = option.partition("=")
+        key = key.strip().replace("-", "_")
+        if key not in OPTION_TYPES or not value:
+            raise ValueError(f"Bad backend option {option!r} (known: {', '.join(OPTION_TYPES)})")
+        kwargs[key] = OPTION_TYPES[key](value)
+    if kwargs and name == "claude":
+        raise ValueError("The claude backend takes no options")
+    return BACKENDS[name](**kwargs)
@@ -0,0 +1,93 @@
+"""Append-only JSONL journal that lets run_loop resume after a crash.
+
+run_loop appends one event per finished step: the loop's configuration
+("start"), each single query run ("run"), each iteration's eval results
+("eval") and each proposed description ("improve"). Replaying the journal
+restores the history and the current description, and the recorded runs
+stand in for `claude -p` calls of the iteration that was interrupted.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from scripts.trigger_cache import TriggerCache
+
+JOURNAL_NAME = "journal.jsonl"
+
+
+class ResumeError(ValueError):
+    """The journal can't be resumed with the loop's current settings."""
+
+
+def eval_set_digest(eval_set: list[dict]) -> str:
+    return hashlib.sha256(json.dumps(eval_set, sort_keys=True).encode()).hexdigest()
+
+
+class LoopJournal:
+    """One JSON object per line, flushed and fsynced as each is written."""
+
+    def __init__(self, log_dir: Path):
+        self.path = Path(log_dir) / JOURNAL_NAME
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def load(self) -> list[dict]:
+        """Recorded events in order; a line torn by a crash mid-write is skipped."""
+        if not self.path.exists():
+            return []
+        events = []
+        for line in self.path.read_text().splitlines():
+            try:
+                events.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        return events
+
+    def append(self, event: dict):
+        with open(self.path, "a") as f:
+            f.write(json.dumps(event) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class JournaledRunCache:
+    """Run-result store for run_eval that records every run in the journal.
+
+    Lookups check runs replayed from the journal first, then the optional
+    persistent TriggerCache, so resuming works even with --no-cache.
+    """
+
+    def __init__(self, journal: LoopJournal, events: list[dict], cache: TriggerCache | None = None):
+        self.journal = journal
+        self.cache = cache
+        self.hits = 0
+        self.runs = {
+            (e["description"], e["query"], e["run_idx"]): e["triggered"]
+            for e in events if e.get("event") == "run"
+        }
+
+    def get(
+        self, skill_name: str, description: str, query: str, model: str | None, run_idx: int, backend_tag: str = "",
+    ) -> bool | None:
+        triggered = self.runs.get((description, query, run_idx))
+        if triggered is None and self.cache:
+            triggered = self.cache.get(skill_name, description, query, model, run_idx, backend_tag)
+        if triggered is not None:
+            self.hits += 1
+        return triggered
+
+    def put(
+        self, skill_name: str, description: str, query: str, model: str | None, run_idx: int, triggered: bool,
+        backend_tag: str = "",
+    ):
+        self.runs[(description, query, run_idx)] = triggered
+        self.journal.append({
+            "event": "run",
+            "description": description,
+            "query": query,
+            "run_idx": run_idx,
+            "triggered": triggered,
+        })
+        if self.cache:
+            self.cache.put(skill_name, description, query, model, run_idx, triggered, backend_tag)
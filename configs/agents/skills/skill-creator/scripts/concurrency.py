@@ -0,0 +1,80 @@
+"""Adaptive concurrency limit for eval subprocesses.
+
+A fixed --num-workers is either too low (throughput left on the table) or
+too high (rate limits and timeouts). AIMDController adjusts the number of
+runs in flight the way TCP adjusts its congestion window: it grows by one
+after each window of clean runs while latency stays near the best seen,
+and halves when a run times out or fails.
+"""
+
+import time
+
+# Runs are "stable" while the latency average is within this factor of
+# the lowest average seen.
+LATENCY_TOLERANCE = 1.5
+LATENCY_SMOOTHING = 0.2
+DECREASE_FACTOR = 0.5
+
+
+class AIMDController:
+    """Additive-increase / multiplicative-decrease limit on runs in flight.
+
+    The limit rises by one once `limit` runs in a row have succeeded with
+    stable latency, never above maximum, and is cut by DECREASE_FACTOR on a
+    failure, never below minimum. Failures of runs started before the last
+    cut don't cut again: they reflect the old limit, which was already
+    reduced.
+    """
+
+    def __init__(self, initial: int, maximum: int, minimum: int = 1):
+        self.minimum = minimum
+        self.maximum = max(maximum, minimum)
+        self.limit = min(max(initial, self.minimum), self.maximum)
+        self.initial = self.limit
+        self.peak = self.limit
+        self.increases = 0
+        self.decreases = 0
+        self._successes = 0
+        self._latency_avg: float | None = None
+        self._latency_best: float | None = None
+        self._last_decrease = float("-inf")
+
+    def on_success(self, latency: float | None):
+        if latency is not None:
+            if self._latency_avg is None:
+                self._latency_avg = latency
+            else:
+                self._latency_avg += LATENCY_SMOOTHING * (latency - self._latency_avg)
+            if self._latency_best is None or self._latency_avg < self._latency_best:
+                self._latency_best = self._latency_avg
+            if self._latency_avg > LATENCY_TOLERANCE * self._latency_best:
+                self._successes = 0
+                return
+
+        self._successes += 1
+        if self._successes >= self.limit and self.limit < self.maximum:
+            self.limit += 1
+            self.peak = max(self.peak, self.limit)
+            self.increases += 1
+            self._successes = 0
+
+    def on_failure(self, started_at: float):
+        """Record a failed run launched at started_at (time.monotonic())."""
+        self._successes = 0
+        if started_at < self._last_decrease:
+            return
+        new_limit = max(self.minimum, int(self.limit * DECREASE_FACTOR))
+        if new_limit < self.limit:
+            self.limit = new_limit
+            self.decreases += 1
+        self._last_decrease = time.monotonic()
+
+    def stats(self) -> dict:
+        return {
+            "initial": self.initial,
+            "final": self.limit,
+            "peak": self.peak,
+            "maximum": self.maximum,
+            "increases": self.increases,
+            "decreases": self.decreases,
+        }
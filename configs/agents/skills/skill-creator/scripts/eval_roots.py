@@ -0,0 +1,76 @@
+"""Isolated per-worker project roots for trigger evals.
+
+Writing every run's command file into the real project's .claude/commands
+means each `claude -p` sees the command files of every other run in flight:
+a longer available-skills list, slower startup, and candidates competing
+with each other. Instead each worker runs in its own throwaway root that
+mirrors the project through symlinks, with a private .claude/commands
+holding the project's own commands plus the one file under test.
+"""
+
+import re
+import shutil
+import tempfile
+from pathlib import Path
+
+# Command files written by run_single_query (<skill>-skill-<8 hex>.md); left
+# behind by a crashed eval they must not leak into the mirrors.
+EVAL_COMMAND_RE = re.compile(r".+-skill-[0-9a-f]{8}\.md$")
+
+
+class IsolatedRoots:
+    """Pool of symlink-farm project roots, one per concurrent run.
+
+    acquire() hands out a free root, creating one only when all are busy,
+    so the pool grows to the peak concurrency and roots are reused for the
+    rest of the eval. cleanup() removes them all.
+    """
+
+    def __init__(self, project_root: Path):
+        self.project_root = Path(project_root).resolve()
+        self._base = Path(tempfile.mkdtemp(prefix="skill-eval-roots-"))
+        self._free: list[Path] = []
+        self._created = 0
+
+    def _mirror(self, root: Path):
+        root.mkdir()
+        for entry in self.project_root.iterdir():
+            if entry.name != ".claude":
+                (root / entry.name).symlink_to(entry)
+
+        claude_dir = root / ".claude"
+        claude_dir.mkdir()
+        project_claude = self.project_root / ".claude"
+        if project_claude.is_dir():
+            for entry in project_claude.iterdir():
+                if entry.name != "commands":
+                    (claude_dir / entry.name).symlink_to(entry)
+
+        commands_dir = claude_dir / "commands"
+        commands_dir.mkdir()
+        project_commands = project_claude / "commands"
+        if project_commands.is_dir():
+            for entry in project_commands.iterdir():
+                if not EVAL_COMMAND_RE.match(entry.name):
+                    (commands_dir / entry.name).symlink_to(entry)
+
+    def acquire(self) -> Path:
+        if self._free:
+            return self._free.pop()
+        self._created += 1
+        root = self._base / f"worker-{self._created}"
+        self._mirror(root)
+        return root
+
+    def release(self, root: Path):
+        self._free.append(root)
+
+    def cleanup(self):
+        shutil.rmtree(self._base, ignore_errors=True)
+        self._free.clear()
+
+    def __enter__(self) -> "IsolatedRoots":
+        return self
+
+    def __exit__(self, *exc):
+        self.cleanup()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Deterministic stand-in for `claude -p`, used by the "fake" backend.
+
+Speaks just enough of the CLI's output to drive run_eval and
+improve_description offline: `eval` streams stream-json events that either
+invoke the skill or answer in plain text, `improve` answers an improvement
+prompt with <new_description> tags, also as stream-json. Outcomes are a
+pure function of the inputs and --seed, so two runs with the same
+arguments print the same events; only timing depends on --latency and
+--event-delay. The exception is --error-rate, which makes a share of eval
+runs fail at random like transient rate-limit errors: half of them print
+an is_error result, the other half nothing, and both exit 1 before any
+verdict.
+
+Standalone on purpose (stdlib only, no scripts imports) because it runs as
+a subprocess from the eval's project root.
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+
+def _unit(*parts: str) -> float:
+    """Stable pseudo-random number in [0, 1) derived from parts."""
+    digest = hashlib.sha256("\0".join(parts).encode()).digest()
+    return int.from_bytes(digest[:8], "big") / 2**64
+
+
+def _emit(event: dict, delay: float):
+    sys.stdout.write(json.dumps(event) + "\n")
+    sys.stdout.flush()
+    if delay:
+        time.sleep(delay)
+
+
+def _stream(event: dict) -> dict:
+    return {"type": "stream_event", "event": event}
+
+
+def run_eval(args):
+    command_file = Path.cwd() / ".claude" / "commands" / f"{args.skill}.md"
+    description = command_file.read_text() if command_file.exists() else ""
+    triggered = _unit(args.seed, args.query, description) < args.trigger_rate
+
+    time.sleep(args.latency)
+    _emit({"type": "system", "subtype": "init", "model": args.model or "fake"}, args.event_delay)
+    if random.random() < args.error_rate:
+        if random.random() < 0.5:
+            _emit({"type": "result", "subtype": "success", "is_error": True,
+                   "result": "API Error: 429 rate_limit_error"}, 0)
+        else:
+            print("API Error: 429 rate_limit_error", file=sys.stderr)
+        sys.exit(1)
+    # Prompt size grows with the description, like the real available-skills list
+    usage = {"input_tokens": 3, "cache_read_input_tokens": 12000 + len(description) // 4}
+    _emit(_stream({"type": "message_start", "message": {"usage": usage}}), args.event_delay)
+
+    if triggered:
+        tool_input = json.dumps({"skill": args.skill})
+        _emit(_stream({"type": "content_block_start", "index": 0,
+                       "content_block": {"type": "tool_use", "name": "Skill", "input": {}}}), args.event_delay)
+        for i in range(0, len(tool_input), 8):
+            _emit(_stream({"type": "content_block_delta", "index": 0,
+                           "delta": {"type": "input_json_delta", "partial_json": tool_input[i:i + 8]}}), args.event_delay)
+        _emit(_stream({"type": "content_block_stop", "index": 0}), args.event_delay)
+        content = [{"type": "tool_use", "name": "Skill", "input": {"skill": args.skill}}]
+    else:
+        text = ("I can help with that directly. " * (args.text_bytes // 32 + 1))[:args.text_bytes]
+        _emit(_stream({"type": "content_block_start", "index": 0,
+                       "content_block": {"type": "text", "text": ""}}), args.event_delay)
+        for i in range(0, len(text), 256):
+            _emit(_stream({"type": "content_block_delta", "index": 0,
+                           "delta": {"type": "text_delta", "text": text[i:i + 256]}}), args.event_delay)
+        _emit(_stream({"type": "content_block_stop", "index": 0}), args.event_delay)
+        _emit(_stream({"type": "message_stop"}), args.event_delay)
+        content = [{"type": "text", "text": text}]
+
+    _emit({"type": "assistant", "message": {"role": "assistant", "content": content}}, args.event_delay)
+    _emit({"type": "result", "subtype": "success", "is_error": False}, 0)
+
+
+def run_improve(args):
+    prompt = sys.stdin.read()
+    time.sleep(args.latency)
+    match = re.search(r"respond with (\d+) new descriptions", prompt)
+    count = int(match.group(1)) if match else 1
+    text = ""
+    for i in range(count):
+        tag = hashlib.sha256(f"{args.seed}\0{i}\0{prompt}".encode()).hexdigest()[:8]
+        text += f"<new_description>Use this skill for fake variant {tag} of the task.</new_description>\n"
+
+    _emit({"type": "system", "subtype": "init", "model": args.model or "fake"}, args.event_delay)
+    _emit({"type": "assistant", "message": {"role": "assistant", "content": [{"type": "text", "text": text}]}},
+          args.event_delay)
+    _emit({"type": "result", "subtype": "success", "is_error": False, "result": text}, 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Deterministic offline stand-in for claude -p")
+    parser.add_argument("mode", choices=["eval", "improve"])
+    parser.add_argument("--query", default="")
+    parser.add_argument("--skill", default="", help="Command name the eval expects to be invoked")
+    parser.add_argument("--model", default=None)
+    parser.add_argument("--seed", default="0")
+    parser.add_argument("--trigger-rate", type=float, default=0.5, help="Share of (query, description) pairs that trigger")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds before the first event")
+    parser.add_argument("--event-delay", type=float, default=0.0, help="Seconds between events")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of eval runs that fail (not seeded)")
+    parser.add_argument("--text-bytes", type=int, default=2048, help="Length of the plain-text answer")
+    args = parser.parse_args()
+
+    try:
+        if args.mode == "eval":
+            run_eval(args)
+        else:
+            run_improve(args)
+    except BrokenPipeError:
+        # The harness stops reading once it has decided; that's not an error.
+        sys.stdout = None
+
+
+if __name__ == "__main__":
+    main()
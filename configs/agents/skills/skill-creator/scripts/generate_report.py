@@ -10,9 +10,26 @@ import argparse
 import html
 import json
 import sys
+from collections import Counter
 from pathlib import Path
 
 
+def latency_cell(timing: dict | None, slow_s: float | None) -> tuple[str, str]:
+    """Tooltip text and latency line for one result cell; empty without timing."""
+    decision = (timing or {}).get("decision_s") or (timing or {}).get("wall_s")
+    if not decision:
+        return "", ""
+    tooltip = [f"{timing['runs']} live runs"]
+    for key, label, unit in (("first_event_s", "first event", "s"), ("decision_s", "decision", "s"),
+                             ("wall_s", "wall", "s"), ("bytes", "streamed", " B"), ("input_tokens", "prompt", " tok")):
+        if timing.get(key):
+            tooltip.append(f"{label}: p50 {timing[key]['p50']:g}{unit}, p95 {timing[key]['p95']:g}{unit}")
+    tooltip.append(", ".join(f"{reason}: {n}" for reason, n in timing.get("exit_reasons", {}).items()))
+    slow = " latency-slow" if slow_s is not None and decision["p95"] >= slow_s else ""
+    line = f'<span class="latency{slow}">{decision["p50"]:.1f}s/{decision["p95"]:.1f}s</span>'
+    return html.escape("\n".join(tooltip), quote=True), line
+
+
 def generate_html(data: dict, auto_refresh: bool = False, skill_name: str = "") -> str:
     """Generate HTML report from loop output data. If auto_refresh is True, adds a meta refresh tag."""
     history = data.get("history", [])
@@ -118,6 +135,12 @@ def generate_html(data: dict, auto_refresh: bool = False, skill_name: str = "")
             color: #b0aea5;
             display: block;
         }
+        .latency {
+            font-size: 9px;
+            color: #b0aea5;
+            display: block;
+        }
+        .latency-slow { color: #d97706; }
         tr:hover { background: #faf9f5; }
         .score {
             display: inline-block;
@@ -148,7 +171,7 @@ def generate_html(data: dict, auto_refresh: bool = False, skill_name: str = "")
 <body>
     <h1>""" + title_prefix + """Skill Description Optimization</h1>
     <div class="explainer">
-        <strong>Optimizing your skill's description.</strong> This page updates automatically as Claude tests different versions of your skill's description. Each row is an iteration — a new description attempt. The columns show test queries: green checkmarks mean the skill triggered correctly (or correctly didn't trigger), red crosses mean it got it wrong. The "Train" score shows performance on queries used to improve the description; the "Test" score shows performance on held-out queries the optimizer hasn't seen. When it's done, Claude will apply the best-performing description to your skill.
+        <strong>Optimizing your skill's description.</strong> This page updates automatically as Claude tests different versions of your skill's description. Each row is an iteration — a new description attempt. The columns show test queries: green checkmarks mean the skill triggered correctly (or correctly didn't trigger), red crosses mean it got it wrong. The "Train" score shows performance on queries used to improve the description; the "Test" score shows performance on held-out queries the optimizer hasn't seen. Under each result is the median/95th-percentile time until triggering was decided (slowest highlighted); hover for details. When it's done, Claude will apply the best-performing description to your skill.
     </div>
 """]
 
@@ -204,9 +227,21 @@ def generate_html(data: dict, auto_refresh: bool = False, skill_name: str = "")
 
     # Find best iteration for highlighting
     if test_queries:
-        best_iter = max(history, key=lambda h: h.get("test_passed") or 0).get("iteration")
+        best_entry = max(history, key=lambda h: h.get("test_passed") or 0)
     else:
-        best_iter = max(history, key=lambda h: h.get("train_passed", h.get("passed", 0))).get("iteration")
+        best_entry = max(history, key=lambda h: h.get("train_passed", h.get("passed", 0)))
+
+    # Cells whose p95 decision time is in the slowest tenth are flagged
+    p95s = sorted(
+        t["decision_s"]["p95"]
+        for h in history
+        for r in (h.get("train_results") or h.get("results") or []) + (h.get("test_results") or [])
+        if (t := r.get("timing")) and t.get("decision_s")
+    )
+    slow_s = p95s[int(len(p95s) * 0.9)] if len(p95s) >= 10 else None
+
+    # With --beam-width > 1 an iteration has several candidate rows
+    round_sizes = Counter(h.get("iteration") for h in history)
 
     # Add rows for each iteration
     for h in history:
@@ -217,7 +252,7 @@ def generate_html(data: dict, auto_refresh: bool = False, skill_name: str = "")
         test_total = h.get("test_total")
         description = h.get("description", "")
         train_results = h.get("train_results", h.get("results", []))
-        test_results = h.get("test_results", [])
+        test_results = h.get("test_results") or []
 
         # Create lookups for results by query
         train_by_query = {r["query"]: r for r in train_results}
@@ -253,10 +288,11 @@ def generate_html(data: dict, auto_refresh: bool = False, skill_name: str = "")
         train_class = score_class(train_correct, train_runs)
         test_class = score_class(test_correct, test_runs)
 
-        row_class = "best-row" if iteration == best_iter else ""
+        row_class = "best-row" if h is best_entry else ""
+        row_label = f"{iteration}.{h.get('candidate', 0) + 1}" if round_sizes[iteration] > 1 else iteration
 
         html_parts.append(f"""            <tr class="{row_class}">
-                <td>{iteration}</td>
+                <td>{row_label}</td>
                 <td><span class="score {train_class}">{train_correct}/{train_runs}</span></td>
                 <td><span class="score {test_class}">{test_correct}/{test_runs}</span></td>
                 <td class="description">{html.escape(description)}</td>
@@ -268,11 +304,13 @@ def generate_html(data: dict, auto_refresh: bool = False, skill_name: str = "")
             did_pass = r.get("pass", False)
             triggers = r.get("triggers", 0)
             runs = r.get("runs", 0)
+            errors = f" ({r['errors']} err)" if r.get("errors") else ""
 
             icon = "✓" if did_pass else "✗"
             css_class = "pass" if did_pass else "fail"
+            tooltip, latency = latency_cell(r.get("timing"), slow_s)
 
-            html_parts.append(f'                <td class="result {css_class}">{icon}<span class="rate">{triggers}/{runs}</span></td>\n')
+            html_parts.append(f'                <td class="result {css_class}" title="{tooltip}">{icon}<span class="rate">{triggers}/{runs}{errors}</span>{latency}</td>\n')
 
         # Add result for each test query (with different background)
         for qinfo in test_queries:
@@ -280,11 +318,13 @@ def generate_html(data: dict, auto_refresh: bool = False, skill_name: str = "")
             did_pass = r.get("pass", False)
             triggers = r.get("triggers", 0)
             runs = r.get("runs", 0)
+            errors = f" ({r['errors']} err)" if r.get("errors") else ""
 
             icon = "✓" if did_pass else "✗"
             css_class = "pass" if did_pass else "fail"
+            tooltip, latency = latency_cell(r.get("timing"), slow_s)
 
-            html_parts.append(f'                <td class="result test-result {css_class}">{icon}<span class="rate">{triggers}/{runs}</span></td>\n')
+            html_parts.append(f'                <td class="result test-result {css_class}" title="{tooltip}">{icon}<span class="rate">{triggers}/{runs}{errors}</span>{latency}</td>\n')
 
         html_parts.append("            </tr>\n")
 
@@ -8,43 +8,61 @@ uses the session's Claude Code auth, no separate ANTHROPIC_API_KEY needed).
 
 import argparse
 import json
-import os
 import re
 import subprocess
 import sys
 from pathlib import Path
 
-from scripts.utils import parse_skill_md
+from scripts.backends import ClaudeBackend, get_backend
+from scripts.utils import NDJSONReader, parse_skill_md
 
 
-def _call_claude(prompt: str, model: str | None, timeout: int = 300) -> str:
+def _call_claude(
+    prompt: str,
+    model: str | None,
+    timeout: int = 300,
+    backend: ClaudeBackend | None = None,
+) -> str:
     """Run `claude -p` with the prompt on stdin and return the text response.
 
     Prompt goes over stdin (not argv) because it embeds the full SKILL.md
-    body and can easily exceed comfortable argv length.
+    body and can easily exceed comfortable argv length. Output is read as
+    stream-json with the same NDJSONReader as run_eval, so an error
+    reported in the result event is raised rather than parsed as text.
     """
-    cmd = ["claude", "-p", "--output-format", "text"]
-    if model:
-        cmd.extend(["--model", model])
-
-    # Remove CLAUDECODE env var to allow nesting claude -p inside a
-    # Claude Code session. The guard is for interactive terminal conflicts;
-    # programmatic subprocess usage is safe. Same pattern as run_eval.py.
-    env = {k: v for k, v in os.environ.items() if k != "CLAUDECODE"}
-
+    backend = backend or ClaudeBackend()
     result = subprocess.run(
-        cmd,
-        input=prompt,
+        backend.prompt_command(model),
+        input=prompt.encode(),
         capture_output=True,
-        text=True,
-        env=env,
+        env=backend.env(),
         timeout=timeout,
     )
     if result.returncode != 0:
         raise RuntimeError(
-            f"claude -p exited {result.returncode}\nstderr: {result.stderr}"
+            f"{backend.name} -p exited {result.returncode}\nstderr: {result.stderr.decode(errors='replace')}"
         )
-    return result.stdout
+
+    reader = NDJSONReader()
+    events = reader.feed(result.stdout) + reader.close()
+    for event in events:
+        if event.get("type") == "result" and isinstance(event.get("result"), str):
+            if event.get("is_error"):
+                raise RuntimeError(f"{backend.name} -p failed: {event['result']}")
+            return event["result"]
+
+    # No result event (e.g. cut short): fall back to the assistant text blocks
+    return "".join(
+        block.get("text", "")
+        for event in events if event.get("type") == "assistant"
+        for block in event.get("message", {}).get("content", [])
+        if block.get("type") == "text"
+    )
+
+
+def _parse_descriptions(text: str) -> list[str]:
+    matches = re.findall(r"<new_description>(.*?)</new_description>", text, re.DOTALL)
+    return [m.strip().strip('"') for m in matches] or [text.strip().strip('"')]
 
 
 def improve_description(
@@ -57,15 +75,49 @@ def improve_description(
     test_results: dict | None = None,
     log_dir: Path | None = None,
     iteration: int | None = None,
+    backend: ClaudeBackend | None = None,
 ) -> str:
     """Call Claude to improve the description based on eval results."""
+    return improve_descriptions(
+        skill_name=skill_name,
+        skill_content=skill_content,
+        current_description=current_description,
+        eval_results=eval_results,
+        history=history,
+        model=model,
+        test_results=test_results,
+        log_dir=log_dir,
+        iteration=iteration,
+        backend=backend,
+    )[0]
+
+
+def improve_descriptions(
+    skill_name: str,
+    skill_content: str,
+    current_description: str,
+    eval_results: dict,
+    history: list[dict],
+    model: str,
+    test_results: dict | None = None,
+    log_dir: Path | None = None,
+    iteration: int | None = None,
+    num_variants: int = 1,
+    backend: ClaudeBackend | None = None,
+) -> list[str]:
+    """Ask Claude for num_variants distinct improved descriptions in one call.
+
+    Returns at least one description and at most num_variants, without
+    duplicates (the model may return fewer than asked for).
+    """
+    # Queries whose runs all errored say nothing about the description
     failed_triggers = [
         r for r in eval_results["results"]
-        if r["should_trigger"] and not r["pass"]
+        if r["should_trigger"] and not r["pass"] and r["runs"]
     ]
     false_triggers = [
         r for r in eval_results["results"]
-        if not r["should_trigger"] and not r["pass"]
+        if not r["should_trigger"] and not r["pass"] and r["runs"]
     ]
 
     # Build scores summary
@@ -139,56 +191,66 @@ Here are some tips that we've found to work well in writing these descriptions:
 
 I'd encourage you to be creative and mix up the style in different iterations since you'll have multiple opportunities to try different approaches and we'll just grab the highest-scoring one at the end. 
 
-Please respond with only the new description text in <new_description> tags, nothing else."""
-
-    text = _call_claude(prompt, model)
+"""
+    if num_variants > 1:
+        prompt += f"""Please respond with {num_variants} new descriptions that are structurally different from each other (different framing, ordering or emphasis, not just rewording), each in its own <new_description> tags, nothing else. They will all be evaluated side by side."""
+    else:
+        prompt += """Please respond with only the new description text in <new_description> tags, nothing else."""
 
-    match = re.search(r"<new_description>(.*?)</new_description>", text, re.DOTALL)
-    description = match.group(1).strip().strip('"') if match else text.strip().strip('"')
+    text = _call_claude(prompt, model, backend=backend)
+    parsed = list(dict.fromkeys(_parse_descriptions(text)))[:num_variants]
 
     transcript: dict = {
         "iteration": iteration,
         "prompt": prompt,
         "response": text,
-        "parsed_description": description,
-        "char_count": len(description),
-        "over_limit": len(description) > 1024,
+        "variants": [],
     }
 
-    # Safety net: the prompt already states the 1024-char hard limit, but if
-    # the model blew past it anyway, make one fresh single-turn call that
-    # quotes the too-long version and asks for a shorter rewrite. (The old
-    # SDK path did this as a true multi-turn; `claude -p` is one-shot, so we
-    # inline the prior output into the new prompt instead.)
-    if len(description) > 1024:
-        shorten_prompt = (
-            f"{prompt}\n\n"
-            f"---\n\n"
-            f"A previous attempt produced this description, which at "
-            f"{len(description)} characters is over the 1024-character hard limit:\n\n"
-            f'"{description}"\n\n'
-            f"Rewrite it to be under 1024 characters while keeping the most "
-            f"important trigger words and intent coverage. Respond with only "
-            f"the new description in <new_description> tags."
-        )
-        shorten_text = _call_claude(shorten_prompt, model)
-        match = re.search(r"<new_description>(.*?)</new_description>", shorten_text, re.DOTALL)
-        shortened = match.group(1).strip().strip('"') if match else shorten_text.strip().strip('"')
-
-        transcript["rewrite_prompt"] = shorten_prompt
-        transcript["rewrite_response"] = shorten_text
-        transcript["rewrite_description"] = shortened
-        transcript["rewrite_char_count"] = len(shortened)
-        description = shortened
-
-    transcript["final_description"] = description
+    descriptions = []
+    for description in parsed:
+        variant: dict = {
+            "parsed_description": description,
+            "char_count": len(description),
+            "over_limit": len(description) > 1024,
+        }
+
+        # Safety net: the prompt already states the 1024-char hard limit, but if
+        # the model blew past it anyway, make one fresh single-turn call that
+        # quotes the too-long version and asks for a shorter rewrite. (The old
+        # SDK path did this as a true multi-turn; `claude -p` is one-shot, so we
+        # inline the prior output into the new prompt instead.)
+        if len(description) > 1024:
+            shorten_prompt = (
+                f"{prompt}\n\n"
+                f"---\n\n"
+                f"A previous attempt produced this description, which at "
+                f"{len(description)} characters is over the 1024-character hard limit:\n\n"
+                f'"{description}"\n\n'
+                f"Rewrite it to be under 1024 characters while keeping the most "
+                f"important trigger words and intent coverage. Respond with only "
+                f"the new description in <new_description> tags."
+            )
+            shorten_text = _call_claude(shorten_prompt, model, backend=backend)
+            shortened = _parse_descriptions(shorten_text)[0]
+
+            variant["rewrite_prompt"] = shorten_prompt
+            variant["rewrite_response"] = shorten_text
+            variant["rewrite_description"] = shortened
+            variant["rewrite_char_count"] = len(shortened)
+            description = shortened
+
+        variant["final_description"] = description
+        transcript["variants"].append(variant)
+        if description not in descriptions:
+            descriptions.append(description)
 
     if log_dir:
         log_dir.mkdir(parents=True, exist_ok=True)
         log_file = log_dir / f"improve_iter_{iteration or 'unknown'}.json"
         log_file.write_text(json.dumps(transcript, indent=2))
 
-    return description
+    return descriptions
 
 
 def main():
@@ -197,6 +259,8 @@ def main():
     parser.add_argument("--skill-path", required=True, help="Path to skill directory")
     parser.add_argument("--history", default=None, help="Path to history JSON (previous attempts)")
     parser.add_argument("--model", required=True, help="Model for improvement")
+    parser.add_argument("--num-variants", type=int, default=1, help="Number of distinct descriptions to propose")
+    parser.add_argument("--backend", default="claude", help="Subprocess backend: 'claude' or 'fake[:trigger_rate=0.5,latency=0,...]' for offline runs")
     parser.add_argument("--verbose", action="store_true", help="Print thinking to stderr")
     args = parser.parse_args()
 
@@ -205,6 +269,12 @@ def main():
         print(f"Error: No SKILL.md found at {skill_path}", file=sys.stderr)
         sys.exit(1)
 
+    try:
+        backend = get_backend(args.backend)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
     eval_results = json.loads(Path(args.eval_results).read_text())
     history = []
     if args.history:
@@ -217,21 +287,25 @@ def main():
         print(f"Current: {current_description}", file=sys.stderr)
         print(f"Score: {eval_results['summary']['passed']}/{eval_results['summary']['total']}", file=sys.stderr)
 
-    new_description = improve_description(
+    new_descriptions = improve_descriptions(
         skill_name=name,
         skill_content=content,
         current_description=current_description,
         eval_results=eval_results,
         history=history,
         model=args.model,
+        num_variants=args.num_variants,
+        backend=backend,
     )
 
     if args.verbose:
-        print(f"Improved: {new_description}", file=sys.stderr)
+        for new_description in new_descriptions:
+            print(f"Improved: {new_description}", file=sys.stderr)
 
     # Output as JSON with both the new description and updated history
     output = {
-        "description": new_description,
+        "description": new_descriptions[0],
+        "descriptions": new_descriptions,
         "history": history + [{
             "description": current_description,
             "passed": eval_results["summary"]["passed"],
@@ -6,17 +6,39 @@ for a set of queries. Outputs results as JSON.
 """
 
 import argparse
+import asyncio
 import json
+import math
 import os
-import select
-import subprocess
+import signal
 import sys
 import time
 import uuid
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections import Counter
 from pathlib import Path
 
-from scripts.utils import parse_skill_md
+from scripts.backends import ClaudeBackend, get_backend
+from scripts.concurrency import AIMDController
+from scripts.eval_roots import IsolatedRoots
+from scripts.trigger_cache import TriggerCache
+from scripts.utils import NDJSONReader, parse_skill_md
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+EARLY_STOP_MODES = ("exact", "sprt", "off")
+# SPRT compares a trigger rate this far above the threshold against one this
+# far below it, with these false-pass/false-fail error bounds.
+SPRT_DELTA = 0.2
+SPRT_ALPHA = 0.05
+SPRT_BETA = 0.05
+
+# Per-run measurements summarized by p50/p95 in each result's "timing"
+TIMING_METRICS = ("first_event_s", "decision_s", "wall_s", "bytes", "input_tokens")
+
+# Runs that ended without a verdict. They are retried up to MAX_RETRIES
+# times rather than counted as "not triggered", and never cached.
+ERROR_EXIT_REASONS = ("timeout", "eof", "error")
+MAX_RETRIES = 2
 
 
 def find_project_root() -> Path:
@@ -32,22 +54,107 @@ def find_project_root() -> Path:
     return current
 
 
-def run_single_query(
+class TriggerDetector:
+    """Decide from stream-json events whether the skill was triggered.
+
+    feed() returns True or False once the outcome is known and None while
+    it is still open. Uses --include-partial-messages stream events to
+    detect triggering early (content_block_start) rather than waiting for
+    the full assistant message, which only arrives after tool execution.
+    """
+
+    def __init__(self, clean_name: str):
+        self.clean_name = clean_name
+        self.pending_tool_name = None
+        self.accumulated_json = ""
+
+    def feed(self, event: dict) -> bool | None:
+        # Early detection via stream events
+        if event.get("type") == "stream_event":
+            se = event.get("event", {})
+            se_type = se.get("type", "")
+
+            if se_type == "content_block_start":
+                cb = se.get("content_block", {})
+                if cb.get("type") == "tool_use":
+                    tool_name = cb.get("name", "")
+                    if tool_name in ("Skill", "Read"):
+                        self.pending_tool_name = tool_name
+                        self.accumulated_json = ""
+                    else:
+                        return False
+
+            elif se_type == "content_block_delta" and self.pending_tool_name:
+                delta = se.get("delta", {})
+                if delta.get("type") == "input_json_delta":
+                    self.accumulated_json += delta.get("partial_json", "")
+                    if self.clean_name in self.accumulated_json:
+                        return True
+
+            elif se_type in ("content_block_stop", "message_stop"):
+                if self.pending_tool_name:
+                    return self.clean_name in self.accumulated_json
+                if se_type == "message_stop":
+                    return False
+
+        # Fallback: full assistant message
+        elif event.get("type") == "assistant":
+            message = event.get("message", {})
+            for content_item in message.get("content", []):
+                if content_item.get("type") != "tool_use":
+                    continue
+                tool_name = content_item.get("name", "")
+                tool_input = content_item.get("input", {})
+                if tool_name == "Skill" and self.clean_name in tool_input.get("skill", ""):
+                    return True
+                if tool_name == "Read" and self.clean_name in tool_input.get("file_path", ""):
+                    return True
+                return False
+
+        elif event.get("type") == "result":
+            return False
+
+        return None
+
+
+def prompt_tokens(event: dict) -> int | None:
+    """Prompt size reported by a message_start stream event, cache reads included."""
+    if event.get("type") != "stream_event" or event.get("event", {}).get("type") != "message_start":
+        return None
+    usage = event["event"].get("message", {}).get("usage")
+    if not usage:
+        return None
+    return sum(usage.get(k) or 0 for k in ("input_tokens", "cache_read_input_tokens", "cache_creation_input_tokens"))
+
+
+async def run_single_query(
     query: str,
     skill_name: str,
     skill_description: str,
     timeout: int,
     project_root: str,
     model: str | None = None,
+    backend: ClaudeBackend | None = None,
+    metrics: dict | None = None,
 ) -> bool:
     """Run a single query and return whether the skill was triggered.
 
     Creates a command file in .claude/commands/ so it appears in Claude's
-    available_skills list, then runs `claude -p` with the raw query.
-    Uses --include-partial-messages to detect triggering early from
-    stream events (content_block_start) rather than waiting for the
-    full assistant message, which only arrives after tool execution.
+    available_skills list, then runs `claude -p` (or the given backend's
+    stand-in) with the raw query and reads its stream-json output line by
+    line until TriggerDetector decides.
+
+    If a metrics dict is given it is filled in with the run's timings in
+    seconds from process start (first_event_s, decision_s, wall_s), bytes
+    read, input_tokens, returncode and exit_reason: "early_detect" (decided
+    mid-stream), "result" (decided by the final result event), "timeout",
+    "error" (an is_error result, or a non-zero exit before any verdict) or
+    "eof" (output ended undecided). The last three return False but are not
+    real verdicts; see ERROR_EXIT_REASONS.
     """
+    backend = backend or ClaudeBackend()
+    metrics = {} if metrics is None else metrics
+    metrics.update({name: None for name in TIMING_METRICS}, exit_reason=None, returncode=None)
     unique_id = uuid.uuid4().hex[:8]
     clean_name = f"{skill_name}-skill-{unique_id}"
     project_commands_dir = Path(project_root) / ".claude" / "commands"
@@ -67,118 +174,390 @@ def run_single_query(
         )
         command_file.write_text(command_content)
 
-        cmd = [
-            "claude",
-            "-p", query,
-            "--output-format", "stream-json",
-            "--verbose",
-            "--include-partial-messages",
-        ]
-        if model:
-            cmd.extend(["--model", model])
-
-        # Remove CLAUDECODE env var to allow nesting claude -p inside a
-        # Claude Code session. The guard is for interactive terminal conflicts;
-        # programmatic subprocess usage is safe.
-        env = {k: v for k, v in os.environ.items() if k != "CLAUDECODE"}
-
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.DEVNULL,
+        started = time.monotonic()
+        process = await asyncio.create_subprocess_exec(
+            *backend.eval_command(query, clean_name, model),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
             cwd=project_root,
-            env=env,
+            env=backend.env(),
         )
 
-        triggered = False
-        start_time = time.time()
-        buffer = ""
-        # Track state for stream event detection
-        pending_tool_name = None
-        accumulated_json = ""
+        detector = TriggerDetector(clean_name)
+        reader = NDJSONReader()
+
+        async def read_events() -> bool:
+            while True:
+                chunk = await process.stdout.read(STREAM_CHUNK_SIZE)
+                events = reader.feed(chunk) if chunk else reader.close()
+                if events and metrics["first_event_s"] is None:
+                    metrics["first_event_s"] = time.monotonic() - started
+                for event in events:
+                    if metrics["input_tokens"] is None:
+                        metrics["input_tokens"] = prompt_tokens(event)
+                    # API errors and rate limits end with an error result
+                    if event.get("type") == "result" and event.get("is_error"):
+                        metrics["exit_reason"] = "error"
+                        return False
+                    decided = detector.feed(event)
+                    if decided is not None:
+                        metrics["decision_s"] = time.monotonic() - started
+                        metrics["exit_reason"] = "result" if event.get("type") == "result" else "early_detect"
+                        return decided
+                if not chunk:
+                    # Output ended, so the process is exiting: reap it
+                    # rather than kill it
+                    returncode = await process.wait()
+                    metrics["exit_reason"] = "error" if returncode else "eof"
+                    return False
 
         try:
-            while time.time() - start_time < timeout:
-                if process.poll() is not None:
-                    remaining = process.stdout.read()
-                    if remaining:
-                        buffer += remaining.decode("utf-8", errors="replace")
-                    break
+            return await asyncio.wait_for(read_events(), timeout)
+        except asyncio.TimeoutError:
+            metrics["exit_reason"] = "timeout"
+            return False
+        finally:
+            # Clean up process on any exit path (return, exception, timeout,
+            # cancellation). Always reap it, even if cancelled while waiting,
+            # so the child watcher never loses track of the pid. os.kill, not
+            # process.kill(): Popen.send_signal polls first, which reaps an
+            # already exited child behind the watcher's back ("Unknown child
+            # process pid ..., will report returncode 255").
+            if process.returncode is None:
+                try:
+                    os.kill(process.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+            try:
+                await process.wait()
+            except asyncio.CancelledError:
+                await process.wait()
+                raise
+            metrics["wall_s"] = time.monotonic() - started
+            metrics["bytes"] = reader.bytes_read
+            metrics["returncode"] = process.returncode
+    finally:
+        if command_file.exists():
+            command_file.unlink()
 
-                ready, _, _ = select.select([process.stdout], [], [], 1.0)
-                if not ready:
-                    continue
 
-                chunk = os.read(process.stdout.fileno(), 8192)
-                if not chunk:
-                    break
-                buffer += chunk.decode("utf-8", errors="replace")
+def rate_decided(
+    triggers: int,
+    completed: int,
+    runs_per_query: int,
+    trigger_threshold: float,
+    early_stop: str = "exact",
+) -> bool:
+    """Whether the query's pass/fail result is settled, so no more runs are needed.
+
+    "exact" stops only once the final trigger rate is certain to land on one
+    side of the threshold, however the remaining runs turn out, so results
+    match running every run. "sprt" also stops once Wald's sequential
+    probability ratio test separates a rate SPRT_DELTA above the threshold
+    from one SPRT_DELTA below it, which decides clear-cut queries sooner at
+    a bounded error rate. "off" always does every run.
+    """
+    if completed >= runs_per_query:
+        return True
+    if early_stop == "off":
+        return False
 
-                while "\n" in buffer:
-                    line, buffer = buffer.split("\n", 1)
-                    line = line.strip()
-                    if not line:
-                        continue
+    remaining = runs_per_query - completed
+    if triggers / runs_per_query >= trigger_threshold:
+        return True
+    if (triggers + remaining) / runs_per_query < trigger_threshold:
+        return True
+
+    if early_stop == "sprt" and completed:
+        p_low = min(max(trigger_threshold - SPRT_DELTA, 0.01), 0.99)
+        p_high = min(max(trigger_threshold + SPRT_DELTA, 0.01), 0.99)
+        llr = (triggers * math.log(p_high / p_low)
+               + (completed - triggers) * math.log((1 - p_high) / (1 - p_low)))
+        if llr >= math.log((1 - SPRT_BETA) / SPRT_ALPHA):
+            return True
+        if llr <= math.log(SPRT_BETA / (1 - SPRT_ALPHA)):
+            return True
+
+    return False
 
-                    try:
-                        event = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
 
-                    # Early detection via stream events
-                    if event.get("type") == "stream_event":
-                        se = event.get("event", {})
-                        se_type = se.get("type", "")
-
-                        if se_type == "content_block_start":
-                            cb = se.get("content_block", {})
-                            if cb.get("type") == "tool_use":
-                                tool_name = cb.get("name", "")
-                                if tool_name in ("Skill", "Read"):
-                                    pending_tool_name = tool_name
-                                    accumulated_json = ""
-                                else:
-                                    return False
-
-                        elif se_type == "content_block_delta" and pending_tool_name:
-                            delta = se.get("delta", {})
-                            if delta.get("type") == "input_json_delta":
-                                accumulated_json += delta.get("partial_json", "")
-                                if clean_name in accumulated_json:
-                                    return True
-
-                        elif se_type in ("content_block_stop", "message_stop"):
-                            if pending_tool_name:
-                                return clean_name in accumulated_json
-                            if se_type == "message_stop":
-                                return False
-
-                    # Fallback: full assistant message
-                    elif event.get("type") == "assistant":
-                        message = event.get("message", {})
-                        for content_item in message.get("content", []):
-                            if content_item.get("type") != "tool_use":
-                                continue
-                            tool_name = content_item.get("name", "")
-                            tool_input = content_item.get("input", {})
-                            if tool_name == "Skill" and clean_name in tool_input.get("skill", ""):
-                                triggered = True
-                            elif tool_name == "Read" and clean_name in tool_input.get("file_path", ""):
-                                triggered = True
-                            return triggered
-
-                    elif event.get("type") == "result":
-                        return triggered
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0..100) of a non-empty list."""
+    ordered = sorted(values)
+    return ordered[max(math.ceil(q / 100 * len(ordered)) - 1, 0)]
+
+
+def summarize_timing(run_metrics: list[dict]) -> dict | None:
+    """p50/p95 of each TIMING_METRICS entry and a count of exit reasons.
+
+    None when there were no live runs (every run came from the cache).
+    """
+    if not run_metrics:
+        return None
+    timing = {"runs": len(run_metrics)}
+    for name in TIMING_METRICS:
+        values = [m[name] for m in run_metrics if m.get(name) is not None]
+        timing[name] = {"p50": round(percentile(values, 50), 3), "p95": round(percentile(values, 95), 3)} if values else None
+    timing["exit_reasons"] = dict(Counter(m.get("exit_reason") for m in run_metrics))
+    return timing
+
+
+async def run_eval_batch_async(
+    eval_set: list[dict],
+    skill_name: str,
+    descriptions: list[str],
+    num_workers: int,
+    timeout: int,
+    project_root: Path,
+    runs_per_query: int = 1,
+    trigger_threshold: float = 0.5,
+    model: str | None = None,
+    early_stop: str = "exact",
+    cache: TriggerCache | None = None,
+    backend: ClaudeBackend | None = None,
+    max_workers: int | None = None,
+) -> list[dict]:
+    """Evaluate several candidate descriptions in one scheduling pass.
+
+    Every (description, query) pair is scheduled independently from one
+    shared pool of num_workers slots. Each run executes in an isolated
+    mirror of project_root (see eval_roots) holding only its own command
+    file, so concurrent runs and candidates never see each other. Runs are
+    issued one at a time per free slot, always to the undecided pair with
+    the fewest runs started, so a pair stops consuming slots as soon as
+    rate_decided says its result is settled, and its runs still in flight
+    are cancelled. Runs found in cache are recorded without taking a slot.
+
+    Runs that time out or fail are retried (see ERROR_EXIT_REASONS); ones
+    that still fail are left out of the trigger rate and counted in the
+    result's "errors" and the summary's runs_failed. A query whose runs all
+    failed has no trigger_rate and never passes.
+
+    With max_workers set, the number of slots is adaptive: an
+    AIMDController starts at num_workers and moves between 1 and
+    max_workers. The summary's "concurrency" reports what was used.
+
+    Live runs (not cancelled, not cached) are measured; each result and
+    summary gets a "timing" from summarize_timing.
+
+    Returns one result dict per description, in the order given.
+    """
+    if early_stop not in EARLY_STOP_MODES:
+        raise ValueError(f"early_stop must be one of {EARLY_STOP_MODES}, got {early_stop!r}")
+    backend = backend or ClaudeBackend()
+    hits_before = cache.hits if cache else 0
+
+    unique_descriptions = list(dict.fromkeys(descriptions))
+    query_items: dict[str, dict] = {}
+    for item in eval_set:
+        query_items.setdefault(item["query"], item)
+    pairs = [(description, query) for description in unique_descriptions for query in query_items]
+    pair_triggers: dict[tuple[str, str], list[bool]] = {pair: [] for pair in pairs}
+    pair_metrics: dict[tuple[str, str], list[dict]] = {pair: [] for pair in pairs}
+    started = dict.fromkeys(pairs, 0)
+    decided: set[tuple[str, str]] = set()
+    retry_runs: dict[tuple[str, str], list[int]] = {pair: [] for pair in pairs}
+    attempts: Counter[tuple[str, str, int]] = Counter()
+    failed: Counter[tuple[str, str]] = Counter()
+    in_flight: dict[asyncio.Task, tuple[str, str]] = {}
+    launched_at: dict[asyncio.Task, float] = {}
+    cancelled: set[asyncio.Task] = set()
+    controller = AIMDController(num_workers, max_workers) if max_workers else None
+    roots = IsolatedRoots(project_root)
+
+    def next_pair() -> tuple[str, str] | None:
+        candidates = [
+            pair for pair in pairs
+            if pair not in decided and (started[pair] < runs_per_query or retry_runs[pair])
+        ]
+        return min(candidates, key=lambda p: started[p]) if candidates else None
+
+    def record(pair: tuple[str, str], triggered: bool):
+        if pair in decided:
+            return
+        triggers = pair_triggers[pair]
+        triggers.append(triggered)
+        if rate_decided(sum(triggers), len(triggers), runs_per_query, trigger_threshold, early_stop):
+            decided.add(pair)
+
+    async def run_one(description: str, query: str, run_idx: int) -> tuple[bool, dict, int]:
+        root = roots.acquire()
+        metrics = {}
+        try:
+            triggered = await run_single_query(
+                query,
+                skill_name,
+                description,
+                timeout,
+                str(root),
+                model,
+                backend,
+                metrics,
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Failures are not cached, so a later eval tries the run again.
+            print(f"Warning: query failed: {e}", file=sys.stderr)
+            metrics["exit_reason"] = "error"
+            return False, metrics, run_idx
         finally:
-            # Clean up process on any exit path (return, exception, timeout)
-            if process.poll() is None:
-                process.kill()
-                process.wait()
+            roots.release(root)
+        if cache and metrics["exit_reason"] not in ERROR_EXIT_REASONS:
+            cache.put(skill_name, description, query, model, run_idx, triggered, backend.cache_tag)
+        return triggered, metrics, run_idx
 
-        return triggered
+    try:
+        while True:
+            while len(in_flight) < (controller.limit if controller else num_workers):
+                pair = next_pair()
+                if pair is None:
+                    break
+                description, query = pair
+                if retry_runs[pair]:
+                    run_idx = retry_runs[pair].pop()
+                else:
+                    run_idx = started[pair]
+                    started[pair] += 1
+                    cached = cache.get(skill_name, description, query, model, run_idx, backend.cache_tag) if cache else None
+                    if cached is not None:
+                        record(pair, cached)
+                        continue
+                attempts[(description, query, run_idx)] += 1
+                task = asyncio.ensure_future(run_one(description, query, run_idx))
+                in_flight[task] = pair
+                launched_at[task] = time.monotonic()
+            if not in_flight:
+                break
+
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                pair = in_flight.pop(task)
+                task_started = launched_at.pop(task)
+                # Cancelled because its pair was settled while it ran
+                if task.cancelled():
+                    continue
+                triggered, metrics, run_idx = task.result()
+                pair_metrics[pair].append(metrics)
+                if metrics["exit_reason"] in ERROR_EXIT_REASONS:
+                    if controller:
+                        controller.on_failure(task_started)
+                    if attempts[(*pair, run_idx)] <= MAX_RETRIES:
+                        retry_runs[pair].append(run_idx)
+                    else:
+                        print(f"Warning: giving up on a run after {MAX_RETRIES} retries "
+                              f"({metrics['exit_reason']}): {pair[1][:60]}", file=sys.stderr)
+                        failed[pair] += 1
+                    continue
+                if controller:
+                    controller.on_success(metrics["decision_s"])
+                record(pair, triggered)
+
+            # Cancel each task once only: a second cancel would interrupt the
+            # kill-and-reap in run_single_query's cleanup.
+            for task, pair in in_flight.items():
+                if pair in decided and task not in cancelled:
+                    task.cancel()
+                    cancelled.add(task)
     finally:
-        if command_file.exists():
-            command_file.unlink()
+        for task in in_flight:
+            if task not in cancelled:
+                task.cancel()
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+        roots.cleanup()
+
+    outputs = {}
+    for description in unique_descriptions:
+        results = []
+        for query, item in query_items.items():
+            triggers = pair_triggers[(description, query)]
+            should_trigger = item["should_trigger"]
+            if not triggers:
+                # Every run failed: an infrastructure error, not a verdict
+                trigger_rate = None
+                did_pass = False
+            elif should_trigger:
+                trigger_rate = sum(triggers) / len(triggers)
+                did_pass = trigger_rate >= trigger_threshold
+            else:
+                trigger_rate = sum(triggers) / len(triggers)
+                did_pass = trigger_rate < trigger_threshold
+            results.append({
+                "query": query,
+                "should_trigger": should_trigger,
+                "trigger_rate": trigger_rate,
+                "triggers": sum(triggers),
+                "runs": len(triggers),
+                "errors": failed[(description, query)],
+                "pass": did_pass,
+                "timing": summarize_timing(pair_metrics[(description, query)]),
+            })
+
+        passed = sum(1 for r in results if r["pass"])
+        total = len(results)
+        runs = sum(r["runs"] for r in results)
+        runs_failed = sum(failed[(description, query)] for query in query_items)
+
+        outputs[description] = {
+            "skill_name": skill_name,
+            "description": description,
+            "results": results,
+            "summary": {
+                "total": total,
+                "passed": passed,
+                "failed": total - passed,
+                "runs": runs,
+                "runs_skipped": total * runs_per_query - runs - runs_failed,
+                "runs_failed": runs_failed,
+                "retries": sum(n - 1 for (d, _, _), n in attempts.items() if d == description),
+                "timing": summarize_timing([m for query in query_items for m in pair_metrics[(description, query)]]),
+            },
+        }
+
+    # Cache hits and concurrency are for the whole batch, not per description.
+    batch_hits = cache.hits - hits_before if cache else 0
+    concurrency = controller.stats() if controller else {
+        "initial": num_workers, "final": num_workers, "peak": num_workers, "maximum": num_workers,
+        "increases": 0, "decreases": 0,
+    }
+    for output in outputs.values():
+        output["summary"]["cache_hits"] = batch_hits
+        output["summary"]["concurrency"] = concurrency
+    return [outputs[description] for description in descriptions]
+
+
+def run_eval_batch(
+    eval_set: list[dict],
+    skill_name: str,
+    descriptions: list[str],
+    num_workers: int,
+    timeout: int,
+    project_root: Path,
+    runs_per_query: int = 1,
+    trigger_threshold: float = 0.5,
+    model: str | None = None,
+    early_stop: str = "exact",
+    cache: TriggerCache | None = None,
+    backend: ClaudeBackend | None = None,
+    max_workers: int | None = None,
+) -> list[dict]:
+    """Run the full eval set for each description; see run_eval_batch_async."""
+    return asyncio.run(run_eval_batch_async(
+        eval_set=eval_set,
+        skill_name=skill_name,
+        descriptions=descriptions,
+        num_workers=num_workers,
+        timeout=timeout,
+        project_root=project_root,
+        runs_per_query=runs_per_query,
+        trigger_threshold=trigger_threshold,
+        model=model,
+        early_stop=early_stop,
+        cache=cache,
+        backend=backend,
+        max_workers=max_workers,
+    ))
 
 
 def run_eval(
@@ -191,81 +570,49 @@ def run_eval(
     runs_per_query: int = 1,
     trigger_threshold: float = 0.5,
     model: str | None = None,
+    early_stop: str = "exact",
+    cache: TriggerCache | None = None,
+    backend: ClaudeBackend | None = None,
+    max_workers: int | None = None,
 ) -> dict:
-    """Run the full eval set and return results."""
-    results = []
-
-    with ProcessPoolExecutor(max_workers=num_workers) as executor:
-        future_to_info = {}
-        for item in eval_set:
-            for run_idx in range(runs_per_query):
-                future = executor.submit(
-                    run_single_query,
-                    item["query"],
-                    skill_name,
-                    description,
-                    timeout,
-                    str(project_root),
-                    model,
-                )
-                future_to_info[future] = (item, run_idx)
-
-        query_triggers: dict[str, list[bool]] = {}
-        query_items: dict[str, dict] = {}
-        for future in as_completed(future_to_info):
-            item, _ = future_to_info[future]
-            query = item["query"]
-            query_items[query] = item
-            if query not in query_triggers:
-                query_triggers[query] = []
-            try:
-                query_triggers[query].append(future.result())
-            except Exception as e:
-                print(f"Warning: query failed: {e}", file=sys.stderr)
-                query_triggers[query].append(False)
-
-    for query, triggers in query_triggers.items():
-        item = query_items[query]
-        trigger_rate = sum(triggers) / len(triggers)
-        should_trigger = item["should_trigger"]
-        if should_trigger:
-            did_pass = trigger_rate >= trigger_threshold
-        else:
-            did_pass = trigger_rate < trigger_threshold
-        results.append({
-            "query": query,
-            "should_trigger": should_trigger,
-            "trigger_rate": trigger_rate,
-            "triggers": sum(triggers),
-            "runs": len(triggers),
-            "pass": did_pass,
-        })
-
-    passed = sum(1 for r in results if r["pass"])
-    total = len(results)
-
-    return {
-        "skill_name": skill_name,
-        "description": description,
-        "results": results,
-        "summary": {
-            "total": total,
-            "passed": passed,
-            "failed": total - passed,
-        },
-    }
+    """Run the full eval set and return results.
+
+    All runs share one event loop; num_workers caps how many `claude -p`
+    subprocesses are in flight at once, or is the starting point when
+    max_workers makes it adaptive. See rate_decided for early_stop.
+    Pass a TriggerCache to reuse results of identical earlier runs.
+    """
+    return run_eval_batch(
+        eval_set=eval_set,
+        skill_name=skill_name,
+        descriptions=[description],
+        num_workers=num_workers,
+        timeout=timeout,
+        project_root=project_root,
+        runs_per_query=runs_per_query,
+        trigger_threshold=trigger_threshold,
+        model=model,
+        early_stop=early_stop,
+        cache=cache,
+        backend=backend,
+        max_workers=max_workers,
+    )[0]
 
 
 def main():
     parser = argparse.ArgumentParser(description="Run trigger evaluation for a skill description")
     parser.add_argument("--eval-set", required=True, help="Path to eval set JSON file")
     parser.add_argument("--skill-path", required=True, help="Path to skill directory")
-    parser.add_argument("--description", default=None, help="Override description to test")
-    parser.add_argument("--num-workers", type=int, default=10, help="Number of parallel workers")
+    parser.add_argument("--description", action="append", default=None, help="Override description to test; repeat to evaluate several candidates in one pass")
+    parser.add_argument("--num-workers", type=int, default=10, help="Number of queries run concurrently")
+    parser.add_argument("--max-workers", type=int, default=None, help="Adapt concurrency between 1 and this, starting at --num-workers (default: fixed)")
     parser.add_argument("--timeout", type=int, default=30, help="Timeout per query in seconds")
     parser.add_argument("--runs-per-query", type=int, default=3, help="Number of runs per query")
     parser.add_argument("--trigger-threshold", type=float, default=0.5, help="Trigger rate threshold")
+    parser.add_argument("--early-stop", choices=EARLY_STOP_MODES, default="exact", help="Stop running a query once its result is settled (default: exact)")
     parser.add_argument("--model", default=None, help="Model to use for claude -p (default: user's configured model)")
+    parser.add_argument("--backend", default="claude", help="Subprocess backend: 'claude' or 'fake[:trigger_rate=0.5,latency=0,...]' for offline runs")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and don't update the persistent trigger result cache")
     parser.add_argument("--verbose", action="store_true", help="Print progress to stderr")
     args = parser.parse_args()
 
@@ -276,34 +623,60 @@ def main():
         print(f"Error: No SKILL.md found at {skill_path}", file=sys.stderr)
         sys.exit(1)
 
+    try:
+        backend = get_backend(args.backend)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
     name, original_description, content = parse_skill_md(skill_path)
-    description = args.description or original_description
+    descriptions = args.description or [original_description]
     project_root = find_project_root()
 
     if args.verbose:
-        print(f"Evaluating: {description}", file=sys.stderr)
+        for description in descriptions:
+            print(f"Evaluating: {description}", file=sys.stderr)
 
-    output = run_eval(
-        eval_set=eval_set,
-        skill_name=name,
-        description=description,
-        num_workers=args.num_workers,
-        timeout=args.timeout,
-        project_root=project_root,
-        runs_per_query=args.runs_per_query,
-        trigger_threshold=args.trigger_threshold,
-        model=args.model,
-    )
+    cache = None if args.no_cache else TriggerCache()
+    try:
+        outputs = run_eval_batch(
+            eval_set=eval_set,
+            skill_name=name,
+            descriptions=descriptions,
+            num_workers=args.num_workers,
+            timeout=args.timeout,
+            project_root=project_root,
+            runs_per_query=args.runs_per_query,
+            trigger_threshold=args.trigger_threshold,
+            model=args.model,
+            early_stop=args.early_stop,
+            cache=cache,
+            backend=backend,
+            max_workers=args.max_workers,
+        )
+    finally:
+        if cache:
+            cache.close()
 
     if args.verbose:
-        summary = output["summary"]
-        print(f"Results: {summary['passed']}/{summary['total']} passed", file=sys.stderr)
-        for r in output["results"]:
-            status = "PASS" if r["pass"] else "FAIL"
-            rate_str = f"{r['triggers']}/{r['runs']}"
-            print(f"  [{status}] rate={rate_str} expected={r['should_trigger']}: {r['query'][:70]}", file=sys.stderr)
-
-    print(json.dumps(output, indent=2))
+        for output in outputs:
+            summary = output["summary"]
+            if len(outputs) > 1:
+                print(f"Description: {output['description'][:70]}", file=sys.stderr)
+            print(f"Results: {summary['passed']}/{summary['total']} passed ({summary['runs']} runs, {summary['runs_skipped']} skipped, {summary['cache_hits']} cached, {summary['retries']} retried, {summary['runs_failed']} failed)", file=sys.stderr)
+            concurrency = summary["concurrency"]
+            if concurrency["increases"] or concurrency["decreases"]:
+                print(f"Concurrency: {concurrency['initial']} -> {concurrency['final']} (peak {concurrency['peak']}, "
+                      f"{concurrency['increases']} up, {concurrency['decreases']} down)", file=sys.stderr)
+            for r in output["results"]:
+                status = "PASS" if r["pass"] else "FAIL"
+                rate_str = f"{r['triggers']}/{r['runs']}"
+                decision = (r["timing"] or {}).get("decision_s")
+                latency_str = f" p50={decision['p50']:.1f}s p95={decision['p95']:.1f}s" if decision else ""
+                print(f"  [{status}] rate={rate_str}{latency_str} expected={r['should_trigger']}: {r['query'][:70]}", file=sys.stderr)
+
+    # A single description keeps the original output shape; several give a list.
+    print(json.dumps(outputs[0] if len(outputs) == 1 else outputs, indent=2))
 
 
 if __name__ == "__main__":
@@ -15,9 +15,12 @@ import time
 import webbrowser
 from pathlib import Path
 
+from scripts.backends import ClaudeBackend, get_backend
+from scripts.checkpoint import JOURNAL_NAME, JournaledRunCache, LoopJournal, ResumeError, eval_set_digest
 from scripts.generate_report import generate_html
-from scripts.improve_description import improve_description
-from scripts.run_eval import find_project_root, run_eval
+from scripts.improve_description import improve_descriptions
+from scripts.run_eval import EARLY_STOP_MODES, find_project_root, run_eval_batch
+from scripts.trigger_cache import TriggerCache
 from scripts.utils import parse_skill_md
 
 
@@ -44,6 +47,46 @@ def split_eval_set(eval_set: list[dict], holdout: float, seed: int = 42) -> tupl
     return train_set, test_set
 
 
+def build_history_entry(
+    iteration: int,
+    candidate: int,
+    eval_output: dict,
+    train_set: list[dict],
+    test_set: list[dict],
+) -> dict:
+    """Split one description's run_eval output into a train/test history entry."""
+    # Split results back into train/test by matching queries
+    train_queries_set = {q["query"] for q in train_set}
+    train_result_list = [r for r in eval_output["results"] if r["query"] in train_queries_set]
+    test_result_list = [r for r in eval_output["results"] if r["query"] not in train_queries_set]
+
+    train_passed = sum(1 for r in train_result_list if r["pass"])
+    train_total = len(train_result_list)
+    test_passed = sum(1 for r in test_result_list if r["pass"])
+    test_total = len(test_result_list)
+
+    return {
+        "iteration": iteration,
+        "candidate": candidate,
+        "description": eval_output["description"],
+        "train_passed": train_passed,
+        "train_failed": train_total - train_passed,
+        "train_total": train_total,
+        "train_results": train_result_list,
+        "test_passed": test_passed if test_set else None,
+        "test_failed": test_total - test_passed if test_set else None,
+        "test_total": test_total if test_set else None,
+        "test_results": test_result_list if test_set else None,
+        "timing": eval_output["summary"].get("timing"),
+        "concurrency": eval_output["summary"].get("concurrency"),
+        # For backward compat with report generator
+        "passed": train_passed,
+        "failed": train_total - train_passed,
+        "total": train_total,
+        "results": train_result_list,
+    }
+
+
 def run_loop(
     eval_set: list[dict],
     skill_path: Path,
@@ -58,12 +101,63 @@ def run_loop(
     verbose: bool,
     live_report_path: Path | None = None,
     log_dir: Path | None = None,
+    early_stop: str = "exact",
+    cache: TriggerCache | None = None,
+    resume: bool = False,
+    beam_width: int = 1,
+    backend: ClaudeBackend | None = None,
+    max_workers: int | None = None,
 ) -> dict:
-    """Run the eval + improvement loop."""
+    """Run the eval + improvement loop.
+
+    Each iteration evaluates a round of candidate descriptions side by side
+    and asks for beam_width new variants of the round's best one, so with
+    beam_width > 1 the search explores several directions per round while
+    keeping all workers busy.
+
+    With log_dir set, every run, eval and proposed description is appended
+    to a journal there. resume=True replays that journal first, so only the
+    work the interrupted loop had not finished is done again.
+
+    With max_workers set, concurrency adapts during each eval (see
+    run_eval_batch_async) and each iteration starts where the last ended.
+    """
     project_root = find_project_root()
     name, original_description, content = parse_skill_md(skill_path)
     current_description = description_override or original_description
 
+    journal = LoopJournal(log_dir) if log_dir else None
+    events = []
+    config = {
+        "skill_name": name,
+        "eval_set": eval_set_digest(eval_set),
+        "holdout": holdout,
+        "runs_per_query": runs_per_query,
+        "trigger_threshold": trigger_threshold,
+        "model": model,
+        "beam_width": beam_width,
+        "backend": (backend or ClaudeBackend()).cache_tag or "claude",
+    }
+    if journal and resume:
+        events = journal.load()
+        if not events:
+            raise ResumeError(f"Nothing to resume: no journal at {journal.path}")
+        start = events[0]
+        recorded = {k: start.get(k) for k in config}
+        if start.get("event") != "start" or recorded != config:
+            changed = ", ".join(k for k in config if recorded[k] != config[k])
+            raise ResumeError(f"Cannot resume {journal.path}: recorded with different {changed or 'settings'}")
+        current_description = start["description"]
+    elif journal:
+        journal.path.unlink(missing_ok=True)
+        journal.append({"event": "start", "description": current_description, **config})
+
+    recorded_evals = {e["iteration"]: e["entries"] for e in events if e.get("event") == "eval"}
+    recorded_proposals = {e["iteration"]: e["descriptions"] for e in events if e.get("event") == "improve"}
+    run_cache = JournaledRunCache(journal, events, cache) if journal else cache
+    if verbose and events:
+        print(f"Resuming from {journal.path}: {len(recorded_evals)} iteration(s) evaluated", file=sys.stderr)
+
     # Split into train/test if holdout > 0
     if holdout > 0:
         train_set, test_set = split_eval_set(eval_set, holdout)
@@ -76,65 +170,57 @@ def run_loop(
     history = []
     exit_reason = "unknown"
 
+    candidates = [current_description]
+
     for iteration in range(1, max_iterations + 1):
         if verbose:
             print(f"\n{'='*60}", file=sys.stderr)
             print(f"Iteration {iteration}/{max_iterations}", file=sys.stderr)
-            print(f"Description: {current_description}", file=sys.stderr)
+            for description in candidates:
+                print(f"Description: {description}", file=sys.stderr)
             print(f"{'='*60}", file=sys.stderr)
 
-        # Evaluate train + test together in one batch for parallelism
-        all_queries = train_set + test_set
-        t0 = time.time()
-        all_results = run_eval(
-            eval_set=all_queries,
-            skill_name=name,
-            description=current_description,
-            num_workers=num_workers,
-            timeout=timeout,
-            project_root=project_root,
-            runs_per_query=runs_per_query,
-            trigger_threshold=trigger_threshold,
-            model=model,
-        )
-        eval_elapsed = time.time() - t0
-
-        # Split results back into train/test by matching queries
-        train_queries_set = {q["query"] for q in train_set}
-        train_result_list = [r for r in all_results["results"] if r["query"] in train_queries_set]
-        test_result_list = [r for r in all_results["results"] if r["query"] not in train_queries_set]
-
-        train_passed = sum(1 for r in train_result_list if r["pass"])
-        train_total = len(train_result_list)
-        train_summary = {"passed": train_passed, "failed": train_total - train_passed, "total": train_total}
-        train_results = {"results": train_result_list, "summary": train_summary}
-
-        if test_set:
-            test_passed = sum(1 for r in test_result_list if r["pass"])
-            test_total = len(test_result_list)
-            test_summary = {"passed": test_passed, "failed": test_total - test_passed, "total": test_total}
-            test_results = {"results": test_result_list, "summary": test_summary}
+        if iteration in recorded_evals:
+            # Evaluated before the interruption; replay it from the journal
+            entries = recorded_evals[iteration]
+            eval_elapsed = 0.0
         else:
-            test_results = None
-            test_summary = None
-
-        history.append({
-            "iteration": iteration,
-            "description": current_description,
-            "train_passed": train_summary["passed"],
-            "train_failed": train_summary["failed"],
-            "train_total": train_summary["total"],
-            "train_results": train_results["results"],
-            "test_passed": test_summary["passed"] if test_summary else None,
-            "test_failed": test_summary["failed"] if test_summary else None,
-            "test_total": test_summary["total"] if test_summary else None,
-            "test_results": test_results["results"] if test_results else None,
-            # For backward compat with report generator
-            "passed": train_summary["passed"],
-            "failed": train_summary["failed"],
-            "total": train_summary["total"],
-            "results": train_results["results"],
-        })
+            # Evaluate train + test for every candidate in one batch for parallelism
+            all_queries = train_set + test_set
+            t0 = time.time()
+            outputs = run_eval_batch(
+                eval_set=all_queries,
+                skill_name=name,
+                descriptions=candidates,
+                num_workers=num_workers,
+                timeout=timeout,
+                project_root=project_root,
+                runs_per_query=runs_per_query,
+                trigger_threshold=trigger_threshold,
+                model=model,
+                early_stop=early_stop,
+                cache=run_cache,
+                backend=backend,
+                max_workers=max_workers,
+            )
+            eval_elapsed = time.time() - t0
+            if max_workers:
+                concurrency = outputs[0]["summary"]["concurrency"]
+                num_workers = concurrency["final"]
+                if verbose:
+                    print(f"Concurrency: {concurrency['initial']} -> {concurrency['final']} (peak {concurrency['peak']}, "
+                          f"{concurrency['increases']} up, {concurrency['decreases']} down)", file=sys.stderr)
+            entries = [
+                build_history_entry(iteration, candidate, output, train_set, test_set)
+                for candidate, output in enumerate(outputs)
+            ]
+            if journal:
+                journal.append({"event": "eval", "iteration": iteration, "entries": entries})
+
+        history.extend(entries)
+        # The best candidate of the round is the one the next round builds on
+        round_best = max(entries, key=lambda h: h["train_passed"])
+        current_description = round_best["description"]
 
         # Write live report if path provided
         if live_report_path:
@@ -142,7 +228,7 @@ def run_loop(
                 "original_description": original_description,
                 "best_description": current_description,
                 "best_score": "in progress",
-                "iterations_run": len(history),
+                "iterations_run": iteration,
                 "holdout": holdout,
                 "train_size": len(train_set),
                 "test_size": len(test_set),
@@ -168,13 +254,17 @@ def run_loop(
                 for r in results:
                     status = "PASS" if r["pass"] else "FAIL"
                     rate_str = f"{r['triggers']}/{r['runs']}"
-                    print(f"  [{status}] rate={rate_str} expected={r['should_trigger']}: {r['query'][:60]}", file=sys.stderr)
+                    decision = (r.get("timing") or {}).get("decision_s")
+                    latency_str = f" p50={decision['p50']:.1f}s p95={decision['p95']:.1f}s" if decision else ""
+                    print(f"  [{status}] rate={rate_str}{latency_str} expected={r['should_trigger']}: {r['query'][:60]}", file=sys.stderr)
 
-            print_eval_stats("Train", train_results["results"], eval_elapsed)
-            if test_summary:
-                print_eval_stats("Test ", test_results["results"], 0)
+            for entry in entries:
+                suffix = f" [{entry['candidate'] + 1}/{len(entries)}]" if len(entries) > 1 else ""
+                print_eval_stats(f"Train{suffix}", entry["train_results"], eval_elapsed)
+                if entry["test_results"] is not None:
+                    print_eval_stats(f"Test {suffix}", entry["test_results"], 0)
 
-        if train_summary["failed"] == 0:
+        if round_best["train_failed"] == 0:
             exit_reason = f"all_passed (iteration {iteration})"
             if verbose:
                 print(f"\nAll train queries passed on iteration {iteration}!", file=sys.stderr)
@@ -196,22 +286,31 @@ def run_loop(
             {k: v for k, v in h.items() if not k.startswith("test_")}
             for h in history
         ]
-        new_description = improve_description(
-            skill_name=name,
-            skill_content=content,
-            current_description=current_description,
-            eval_results=train_results,
-            history=blinded_history,
-            model=model,
-            log_dir=log_dir,
-            iteration=iteration,
-        )
+        if iteration in recorded_proposals:
+            new_descriptions = recorded_proposals[iteration]
+        else:
+            train_summary = {k: round_best[f"train_{k}"] for k in ("passed", "failed", "total")}
+            new_descriptions = improve_descriptions(
+                skill_name=name,
+                skill_content=content,
+                current_description=current_description,
+                eval_results={"results": round_best["train_results"], "summary": train_summary},
+                history=blinded_history,
+                model=model,
+                log_dir=log_dir,
+                iteration=iteration,
+                num_variants=beam_width,
+                backend=backend,
+            )
+            if journal:
+                journal.append({"event": "improve", "iteration": iteration, "descriptions": new_descriptions})
         improve_elapsed = time.time() - t0
 
         if verbose:
-            print(f"Proposed ({improve_elapsed:.1f}s): {new_description}", file=sys.stderr)
+            for new_description in new_descriptions:
+                print(f"Proposed ({improve_elapsed:.1f}s): {new_description}", file=sys.stderr)
 
-        current_description = new_description
+        candidates = new_descriptions
 
     # Find the best iteration by TEST score (or train if no test set)
     if test_set:
@@ -233,7 +332,7 @@ def run_loop(
         "best_train_score": f"{best['train_passed']}/{best['train_total']}",
         "best_test_score": f"{best['test_passed']}/{best['test_total']}" if test_set else None,
         "final_description": current_description,
-        "iterations_run": len(history),
+        "iterations_run": history[-1]["iteration"],
         "holdout": holdout,
         "train_size": len(train_set),
         "test_size": len(test_set),
@@ -247,15 +346,21 @@ def main():
     parser.add_argument("--skill-path", required=True, help="Path to skill directory")
     parser.add_argument("--description", default=None, help="Override starting description")
     parser.add_argument("--num-workers", type=int, default=10, help="Number of parallel workers")
+    parser.add_argument("--max-workers", type=int, default=None, help="Adapt concurrency between 1 and this, starting at --num-workers (default: fixed)")
     parser.add_argument("--timeout", type=int, default=30, help="Timeout per query in seconds")
     parser.add_argument("--max-iterations", type=int, default=5, help="Max improvement iterations")
     parser.add_argument("--runs-per-query", type=int, default=3, help="Number of runs per query")
     parser.add_argument("--trigger-threshold", type=float, default=0.5, help="Trigger rate threshold")
+    parser.add_argument("--early-stop", choices=EARLY_STOP_MODES, default="exact", help="Stop running a query once its result is settled (default: exact)")
+    parser.add_argument("--beam-width", type=int, default=1, help="Candidate descriptions proposed and evaluated per iteration")
     parser.add_argument("--holdout", type=float, default=0.4, help="Fraction of eval set to hold out for testing (0 to disable)")
     parser.add_argument("--model", required=True, help="Model for improvement")
     parser.add_argument("--verbose", action="store_true", help="Print progress to stderr")
     parser.add_argument("--report", default="auto", help="Generate HTML report at this path (default: 'auto' for temp file, 'none' to disable)")
+    parser.add_argument("--backend", default="claude", help="Subprocess backend: 'claude' or 'fake[:trigger_rate=0.5,latency=0,...]' for offline runs")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and don't update the persistent trigger result cache")
     parser.add_argument("--results-dir", default=None, help="Save all outputs (results.json, report.html, log.txt) to a timestamped subdirectory here")
+    parser.add_argument("--resume", default=None, metavar="RUN_DIR", help="Continue an interrupted loop from its timestamped --results-dir subdirectory")
     args = parser.parse_args()
 
     eval_set = json.loads(Path(args.eval_set).read_text())
@@ -265,6 +370,12 @@ def main():
         print(f"Error: No SKILL.md found at {skill_path}", file=sys.stderr)
         sys.exit(1)
 
+    try:
+        backend = get_backend(args.backend)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
     name, _, _ = parse_skill_md(skill_path)
 
     # Set up live report path
@@ -281,7 +392,12 @@ def main():
         live_report_path = None
 
     # Determine output directory (create before run_loop so logs can be written)
-    if args.results_dir:
+    if args.resume:
+        results_dir = Path(args.resume)
+        if not (results_dir / "logs" / JOURNAL_NAME).exists():
+            print(f"Error: No {JOURNAL_NAME} to resume from in {results_dir / 'logs'}", file=sys.stderr)
+            sys.exit(1)
+    elif args.results_dir:
         timestamp = time.strftime("%Y-%m-%d_%H%M%S")
         results_dir = Path(args.results_dir) / timestamp
         results_dir.mkdir(parents=True, exist_ok=True)
@@ -290,21 +406,35 @@ def main():
 
     log_dir = results_dir / "logs" if results_dir else None
 
-    output = run_loop(
-        eval_set=eval_set,
-        skill_path=skill_path,
-        description_override=args.description,
-        num_workers=args.num_workers,
-        timeout=args.timeout,
-        max_iterations=args.max_iterations,
-        runs_per_query=args.runs_per_query,
-        trigger_threshold=args.trigger_threshold,
-        holdout=args.holdout,
-        model=args.model,
-        verbose=args.verbose,
-        live_report_path=live_report_path,
-        log_dir=log_dir,
-    )
+    cache = None if args.no_cache else TriggerCache()
+    try:
+        output = run_loop(
+            eval_set=eval_set,
+            skill_path=skill_path,
+            description_override=args.description,
+            num_workers=args.num_workers,
+            timeout=args.timeout,
+            max_iterations=args.max_iterations,
+            runs_per_query=args.runs_per_query,
+            trigger_threshold=args.trigger_threshold,
+            holdout=args.holdout,
+            model=args.model,
+            verbose=args.verbose,
+            live_report_path=live_report_path,
+            log_dir=log_dir,
+            early_stop=args.early_stop,
+            cache=cache,
+            resume=bool(args.resume),
+            beam_width=args.beam_width,
+            backend=backend,
+            max_workers=args.max_workers,
+        )
+    except ResumeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if cache:
+            cache.close()
 
     # Save JSON output
     json_output = json.dumps(output, indent=2)
@@ -0,0 +1,113 @@
+"""Persistent cache of single-run trigger results.
+
+run_loop re-evaluates the whole eval set every iteration, and the same
+description often comes round again (a repeated candidate, a re-run of the
+loop, a loop restarted after a crash). Each run's outcome is stored under a
+hash of everything that determines it, so repeating one costs a lookup
+instead of a `claude -p` call.
+"""
+
+import hashlib
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+DEFAULT_CACHE_PATH = Path(
+    os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+) / "skill-creator" / "trigger_cache.sqlite"
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+DEFAULT_MAX_ENTRIES = 100_000
+
+
+def cache_key(
+    skill_name: str,
+    description: str,
+    query: str,
+    model: str | None,
+    run_idx: int,
+    backend_tag: str = "",
+) -> str:
+    """Hash of one run's inputs; run_idx keeps repeated runs of a query distinct.
+
+    backend_tag is empty for the real CLI and set by stand-in backends, so
+    their results never answer for real ones.
+    """
+    parts = [skill_name, description, query, model or "", str(run_idx)]
+    if backend_tag:
+        parts.append(backend_tag)
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+class TriggerCache:
+    """SQLite-backed map of cache_key -> triggered, with TTL and a size cap.
+
+    Entries older than ttl_seconds are ignored on lookup and dropped by
+    evict(), which also trims the table to the max_entries most recent.
+    Every put() is committed straight away, so results survive the process
+    being killed mid-eval.
+    """
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_CACHE_PATH,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, triggered INTEGER NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS results_created_at ON results (created_at)")
+        self._db.commit()
+
+    def get(
+        self, skill_name: str, description: str, query: str, model: str | None, run_idx: int, backend_tag: str = "",
+    ) -> bool | None:
+        row = self._db.execute(
+            "SELECT triggered FROM results WHERE key = ? AND created_at >= ?",
+            (cache_key(skill_name, description, query, model, run_idx, backend_tag), time.time() - self.ttl_seconds),
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return bool(row[0])
+
+    def put(
+        self, skill_name: str, description: str, query: str, model: str | None, run_idx: int, triggered: bool,
+        backend_tag: str = "",
+    ):
+        self._db.execute(
+            "INSERT OR REPLACE INTO results (key, triggered, created_at) VALUES (?, ?, ?)",
+            (cache_key(skill_name, description, query, model, run_idx, backend_tag), int(triggered), time.time()),
+        )
+        self._db.commit()
+
+    def evict(self):
+        self._db.execute("DELETE FROM results WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+        self._db.execute(
+            "DELETE FROM results WHERE key NOT IN "
+            "(SELECT key FROM results ORDER BY created_at DESC LIMIT ?)",
+            (self.max_entries,),
+        )
+        self._db.commit()
+
+    def close(self):
+        self.evict()
+        self._db.close()
+
+    def __enter__(self) -> "TriggerCache":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
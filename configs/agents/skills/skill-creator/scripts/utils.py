@@ -1,5 +1,6 @@
 """Shared utilities for skill-creator scripts."""
 
+import json
 from pathlib import Path
 
 
@@ -45,3 +46,56 @@ def parse_skill_md(skill_path: Path) -> tuple[str, str, str]:
         i += 1
 
     return name, description, content
+
+
+class NDJSONReader:
+    """Incremental parser for newline-delimited JSON read in chunks.
+
+    Bytes accumulate in one bytearray and each feed() scans only the bytes
+    it hasn't scanned before, so the cost is linear in the stream size
+    however lines and chunks happen to align. Lines are split as bytes and
+    decoded whole: a newline byte never occurs inside a UTF-8 multibyte
+    character, so characters split across chunks come out intact.
+    Lines that aren't JSON objects are skipped.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._scanned = 0
+        self.bytes_read = 0
+
+    def _parse(self, line: memoryview) -> dict | None:
+        try:
+            event = json.loads(bytes(line))
+        except ValueError:
+            return None
+        return event if isinstance(event, dict) else None
+
+    def feed(self, chunk: bytes) -> list[dict]:
+        """Add a chunk and return the events of every line it completed."""
+        self.bytes_read += len(chunk)
+        buffer = self._buffer
+        buffer += chunk
+
+        events = []
+        start = 0
+        with memoryview(buffer) as view:
+            while True:
+                end = buffer.find(b"\n", max(start, self._scanned))
+                if end < 0:
+                    break
+                event = self._parse(view[start:end])
+                if event is not None:
+                    events.append(event)
+                start = end + 1
+        del buffer[:start]
+        self._scanned = len(buffer)
+        return events
+
+    def close(self) -> list[dict]:
+        """Events from a final line that had no trailing newline."""
+        with memoryview(self._buffer) as view:
+            event = self._parse(view) if self._buffer.strip() else None
+        self._buffer.clear()
+        self._scanned = 0
+        return [event] if event is not None else []
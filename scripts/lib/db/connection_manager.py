@@ -1,29 +1,34 @@
 #!/usr/bin/env python3
 
-import json
+import importlib
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, TextIO, Tuple
 from datetime import datetime
 import base64
 
-try:
-    import keyring
-    KEYRING_AVAILABLE = True
-except ImportError:
-    KEYRING_AVAILABLE = False
+from connection_store import (CONNECTIONS_FILE, CONNECTIONS_DB, USAGE_COMPACT_BYTES, UsageLog,
+                              open_store, migrate_json_to_sqlite)
+from health import HEALTH_TTL_SECONDS, DEFAULT_PROBE_TIMEOUT, probe_all, is_fresh
+from search import DEFAULT_RESULT_LIMIT, SearchIndex
+from transfer import EXPORT_MODES, TransferError, prompt_passphrase, read_export, write_export
 
-try:
-    from cryptography.fernet import Fernet
-    CRYPTO_AVAILABLE = True
-except ImportError:
-    CRYPTO_AVAILABLE = False
-
-DOTFILES_DATA_DIR = Path(os.environ.get("DOTFILES_DATA_DIR", Path.home() / ".dotfiles"))
-CONNECTIONS_FILE = DOTFILES_DATA_DIR / "connections" / "connections.json"
-CONNECTIONS_FILE.parent.mkdir(parents=True, exist_ok=True)
 SERVICE_NAME = "db_tool_connections"
 
+
+@lru_cache(maxsize=None)
+def _optional_module(name: str):
+    """Import an optional dependency on first use; None if it isn't installed.
+
+    keyring and cryptography each take tens of milliseconds to import, which
+    commands that never touch a secret shouldn't pay.
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
 class Colors:
     RESET = '\033[0m'
     BOLD = '\033[1m'
@@ -37,24 +42,37 @@ class Colors:
     WHITE = '\033[37m'
 
 class ConnectionManager:
-    def __init__(self):
-        self.connections_file = CONNECTIONS_FILE
-        self._ensure_file_exists()
+    # Key lookups can mean a keyring D-Bus round trip, so the key and the
+    # Fernet built from it are shared by every manager in the process until
+    # invalidate_key_cache() is called.
+    _cached_key: Optional[bytes] = None
+    _cached_cipher = None
     
-    def _ensure_file_exists(self):
-        if not self.connections_file.exists():
-            self.connections_file.parent.mkdir(parents=True, exist_ok=True)
-            self.connections_file.write_text(json.dumps({"connections": []}, indent=2))
+    def __init__(self, backend: Optional[str] = None):
+        self.store = open_store(backend)
+        self.usage = UsageLog()
+    
+    @classmethod
+    def invalidate_key_cache(cls):
+        cls._cached_key = None
+        cls._cached_cipher = None
     
     def _get_encryption_key(self) -> bytes:
-        if not CRYPTO_AVAILABLE:
+        if ConnectionManager._cached_key is None:
+            ConnectionManager._cached_key = self._load_encryption_key()
+        return ConnectionManager._cached_key
+    
+    def _load_encryption_key(self) -> bytes:
+        fernet = _optional_module("cryptography.fernet")
+        if not fernet:
             return b'dummy_key_not_encrypted'
         
-        if KEYRING_AVAILABLE:
+        keyring = _optional_module("keyring")
+        if keyring:
             try:
                 key = keyring.get_password(SERVICE_NAME, "encryption_key")
                 if not key:
-                    key = Fernet.generate_key().decode()
+                    key = fernet.Fernet.generate_key().decode()
                     keyring.set_password(SERVICE_NAME, "encryption_key", key)
                 return key.encode() if isinstance(key, str) else key
             except Exception:
@@ -63,47 +81,70 @@ class ConnectionManager:
         stored_key_file = Path.home() / ".db_encryption_key"
         if stored_key_file.exists():
             return stored_key_file.read_bytes()
-        key = Fernet.generate_key()
+        key = fernet.Fernet.generate_key()
         stored_key_file.write_bytes(key)
         os.chmod(stored_key_file, 0o600)
         return key
     
+    def _get_cipher(self):
+        if ConnectionManager._cached_cipher is None:
+            fernet = _optional_module("cryptography.fernet")
+            ConnectionManager._cached_cipher = fernet.Fernet(self._get_encryption_key())
+        return ConnectionManager._cached_cipher
+    
     def _encrypt_value(self, value: str) -> str:
-        if not CRYPTO_AVAILABLE:
-            return base64.b64encode(value.encode()).decode()
-        key = self._get_encryption_key()
-        f = Fernet(key)
-        return f.encrypt(value.encode()).decode()
+        return self.encrypt_many([value])[0]
     
     def _decrypt_value(self, encrypted_value: str) -> str:
-        if not CRYPTO_AVAILABLE:
-            try:
-                return base64.b64decode(encrypted_value.encode()).decode()
-            except:
-                return encrypted_value
-        key = self._get_encryption_key()
-        f = Fernet(key)
-        return f.decrypt(encrypted_value.encode()).decode()
-    
-    def _load_connections(self) -> Dict:
+        return self.decrypt_many([encrypted_value])[0]
+    
+    def encrypt_many(self, values: List[str]) -> List[str]:
+        if not _optional_module("cryptography.fernet"):
+            return [base64.b64encode(value.encode()).decode() for value in values]
+        cipher = self._get_cipher()
+        return [cipher.encrypt(value.encode()).decode() for value in values]
+    
+    def decrypt_many(self, encrypted_values: List[str]) -> List[str]:
+        fernet = _optional_module("cryptography.fernet")
+        if not fernet:
+            decrypted = []
+            for value in encrypted_values:
+                try:
+                    decrypted.append(base64.b64decode(value.encode()).decode())
+                except:
+                    decrypted.append(value)
+            return decrypted
+        
         try:
-            with open(self.connections_file, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            return {"connections": []}
+            cipher = self._get_cipher()
+            return [cipher.decrypt(value.encode()).decode() for value in encrypted_values]
+        except fernet.InvalidToken:
+            # The key may have been rotated by another process since we cached it.
+            self.invalidate_key_cache()
+            cipher = self._get_cipher()
+            return [cipher.decrypt(value.encode()).decode() for value in encrypted_values]
     
-    def _save_connections(self, data: Dict):
-        with open(self.connections_file, 'w') as f:
-            json.dump(data, f, indent=2)
-        os.chmod(self.connections_file, 0o600)
+    @staticmethod
+    def _connection_error(db_type: str, connection_string: str) -> Optional[str]:
+        """Why a connection of this type and string can't be stored, or None."""
+        from drivers import driver_types, get_driver
+        
+        driver = get_driver(db_type)
+        if driver is None:
+            return f"Unknown connection type '{db_type}' (available: {', '.join(driver_types())})"
+        error = driver.validate(connection_string)
+        if error:
+            return f"Invalid {driver.label or db_type} connection string: {error}"
+        return None
     
     def save_connection(self, name: str, db_type: str, connection_string: str, 
                        description: str = "", tags: List[str] = None) -> Tuple[bool, str]:
-        data = self._load_connections()
+        error = self._connection_error(db_type, connection_string)
+        if error:
+            return False, error
         
-        for conn in data["connections"]:
-            if conn["name"] == name:
-                return False, f"Connection '{name}' already exists. Use update or choose a different name."
+        if self.store.get(name):
+            return False, f"Connection '{name}' already exists. Use update or choose a different name."
         
         encrypted_conn = self._encrypt_value(connection_string)
         
@@ -118,73 +159,163 @@ class ConnectionManager:
             "use_count": 0
         }
         
-        data["connections"].append(new_connection)
-        self._save_connections(data)
+        if not self.store.insert(new_connection):
+            return False, f"Connection '{name}' already exists. Use update or choose a different name."
         
         return True, f"Connection '{name}' saved successfully"
     
     def get_connection(self, name: str) -> Optional[Dict]:
-        data = self._load_connections()
-        
-        for conn in data["connections"]:
-            if conn["name"] == name:
-                conn["connection_string"] = self._decrypt_value(conn["connection_string"])
-                
-                conn["last_used"] = datetime.now().isoformat()
-                conn["use_count"] += 1
-                
-                for c in data["connections"]:
-                    if c["name"] == name:
-                        c["last_used"] = conn["last_used"]
-                        c["use_count"] = conn["use_count"]
-                        break
-                
-                self._save_connections(data)
-                return conn
+        conn = self.store.get(name)
+        if not conn:
+            return None
         
-        return None
+        if self.usage.append(name, datetime.now().isoformat()) > USAGE_COMPACT_BYTES:
+            self.usage.compact(self.store, block=False)
+        self.usage.overlay(self.store, [conn])
+        
+        conn["connection_string"] = self._decrypt_value(conn["connection_string"])
+        return conn
     
     def list_connections(self, db_type: Optional[str] = None, 
-                        tag: Optional[str] = None) -> List[Dict]:
-        data = self._load_connections()
-        connections = data["connections"]
+                        tag: Optional[str] = None, decrypt: bool = False) -> List[Dict]:
+        connections = self.usage.overlay(self.store, self.store.list(db_type, tag))
         
-        if db_type:
-            connections = [c for c in connections if c["type"] == db_type]
-        
-        if tag:
-            connections = [c for c in connections if tag in c.get("tags", [])]
+        if decrypt:
+            plain = self.decrypt_many([c["connection_string"] for c in connections])
+            for conn, value in zip(connections, plain):
+                conn["connection_string"] = value
         
         return connections
     
     def delete_connection(self, name: str) -> Tuple[bool, str]:
-        data = self._load_connections()
-        original_count = len(data["connections"])
-        
-        data["connections"] = [c for c in data["connections"] if c["name"] != name]
-        
-        if len(data["connections"]) == original_count:
+        if not self.store.delete(name):
             return False, f"Connection '{name}' not found"
+        self.usage.forget(self.store, name)
         
-        self._save_connections(data)
         return True, f"Connection '{name}' deleted successfully"
     
     def update_connection(self, name: str, **kwargs) -> Tuple[bool, str]:
-        data = self._load_connections()
-        
-        for conn in data["connections"]:
-            if conn["name"] == name:
-                if "connection_string" in kwargs:
-                    conn["connection_string"] = self._encrypt_value(kwargs["connection_string"])
-                if "description" in kwargs:
-                    conn["description"] = kwargs["description"]
-                if "tags" in kwargs:
-                    conn["tags"] = kwargs["tags"]
-                
-                self._save_connections(data)
-                return True, f"Connection '{name}' updated successfully"
-        
-        return False, f"Connection '{name}' not found"
+        fields = {}
+        if "connection_string" in kwargs:
+            fields["connection_string"] = self._encrypt_value(kwargs["connection_string"])
+        if "description" in kwargs:
+            fields["description"] = kwargs["description"]
+        if "tags" in kwargs:
+            fields["tags"] = kwargs["tags"]
+        
+        if not self.store.update(name, fields):
+            return False, f"Connection '{name}' not found"
+        
+        return True, f"Connection '{name}' updated successfully"
+    
+    def export_connections(self, out: TextIO, mode: str = "record", passphrase: Optional[str] = None,
+                           db_type: Optional[str] = None, tag: Optional[str] = None) -> int:
+        connections = self.list_connections(db_type, tag, decrypt=True)
+        return write_export(out, connections, mode, passphrase)
+    
+    def import_connections(self, lines: Iterable[str], passphrase: Callable[[], str],
+                           replace: bool = False) -> Tuple[int, List[str], List[str]]:
+        """Read a whole export, then write it to the store in one transaction.
+        
+        Returns (written, skipped names, invalid). Existing names are skipped
+        unless replace is set; within the export, the last record for a name
+        wins. Records that save would reject (unknown type, bad connection
+        string) are not written and come back in invalid as "name: reason".
+        """
+        records = {}
+        for record in read_export(lines, passphrase):
+            records[record["name"]] = record
+        
+        invalid = []
+        for name, record in list(records.items()):
+            error = self._connection_error(record["type"], record["connection_string"])
+            if error:
+                invalid.append(f"{name}: {error}")
+                del records[name]
+        records = list(records.values())
+        
+        encrypted = self.encrypt_many([r["connection_string"] for r in records])
+        now = datetime.now().isoformat()
+        rows = [{
+            "name": r["name"],
+            "type": r["type"],
+            "connection_string": value,
+            "description": r.get("description") or "",
+            "tags": r.get("tags") or [],
+            "created_at": r.get("created_at") or now,
+            "last_used": r.get("last_used"),
+            "use_count": r.get("use_count") or 0
+        } for r, value in zip(records, encrypted)]
+        
+        written, skipped = self.store.insert_many(rows, replace)
+        return written, skipped, invalid
+    
+    def search_index(self) -> SearchIndex:
+        return SearchIndex.load_or_build(self.store)
+    
+    def find_connections(self, query: str, limit: Optional[int] = DEFAULT_RESULT_LIMIT) -> List[Tuple[Dict, float]]:
+        """Ranked (connection, score) matches on name, tags, type and description.
+        
+        Connections come back without their connection string.
+        """
+        return self.search_index().search(query, limit)
+    
+    def check_health(self, timeout: float = DEFAULT_PROBE_TIMEOUT, refresh: bool = False,
+                     ttl: float = HEALTH_TTL_SECONDS) -> List[Tuple[Dict, Dict]]:
+        """Probe saved connections in parallel, reusing results younger than ttl."""
+        connections = self.list_connections()
+        cached = self.store.load_health()
+        stale = [c for c in connections if refresh or not is_fresh(cached.get(c["name"]), ttl)]
+        
+        if stale:
+            plain = self.decrypt_many([c["connection_string"] for c in stale])
+            results = probe_all([{**c, "connection_string": p} for c, p in zip(stale, plain)], timeout)
+            self.store.save_health(results)
+            cached.update(results)
+        
+        return [(conn, cached[conn["name"]]) for conn in connections]
+    
+    def print_health_table(self, rows: List[Tuple[Dict, Dict]]):
+        if not rows:
+            print(f"{Colors.YELLOW}No connections found{Colors.RESET}")
+            return
+        
+        status_colors = {"ok": Colors.GREEN, "tcp_only": Colors.CYAN}
+        max_name = max(len(conn["name"]) for conn, _ in rows)
+        
+        print(f"\n{Colors.BOLD}{Colors.CYAN}Connection Health:{Colors.RESET}\n")
+        print(f"  {Colors.BOLD}{'Name':<{max_name}}  {'Status':<12}  {'TCP':>9}  {'Auth':>9}  Checked{Colors.RESET}")
+        print(f"  {Colors.DIM}{'-' * (max_name + 50)}{Colors.RESET}")
+        
+        for conn, result in rows:
+            color = status_colors.get(result["status"], Colors.RED)
+            tcp = f"{result['tcp_ms']:.0f} ms" if result.get("tcp_ms") is not None else "-"
+            auth = f"{result['auth_ms']:.0f} ms" if result.get("auth_ms") is not None else "-"
+            age = max(0, int(datetime.now().timestamp() - result.get("checked_at", 0)))
+            
+            print(f"  {conn['name']:<{max_name}}  {color}{result['status']:<12}{Colors.RESET}  "
+                  f"{tcp:>9}  {auth:>9}  {Colors.DIM}{age}s ago{Colors.RESET}")
+            if result.get("error"):
+                print(f"    {Colors.DIM}{result['error'].splitlines()[0][:100]}{Colors.RESET}")
+        
+        print()
+    
+    def print_search_results(self, results: List[Tuple[Dict, float]]):
+        if not results:
+            print(f"{Colors.YELLOW}No matching connections{Colors.RESET}")
+            return
+        
+        max_name = max(len(conn["name"]) for conn, _ in results)
+        max_type = max(len(conn["type"]) for conn, _ in results)
+        
+        print()
+        for conn, score in results:
+            name_color = Colors.GREEN if conn["type"] == "postgres" else Colors.CYAN
+            tags = f"  {Colors.DIM}[{', '.join(conn['tags'])}]{Colors.RESET}" if conn.get("tags") else ""
+            print(f"  {name_color}{conn['name']:<{max_name}}{Colors.RESET}  "
+                  f"{Colors.BLUE}{conn['type']:<{max_type}}{Colors.RESET}  "
+                  f"{Colors.DIM}{conn.get('description', '')[:40]}{Colors.RESET}{tags}")
+        print()
     
     def print_connections_table(self, connections: List[Dict]):
         if not connections:
@@ -228,10 +359,79 @@ class ConnectionManager:
         
         print()
 
-def main():
+def _option(args: List[str], flag: str) -> Optional[str]:
+    if flag in args and args.index(flag) + 1 < len(args):
+        return args[args.index(flag) + 1]
+    return None
+
+def export_command(manager: ConnectionManager, args: List[str]) -> bool:
     import sys
     
-    manager = ConnectionManager()
+    mode = _option(args, "--mode") or "record"
+    out_path = _option(args, "--out")
+    try:
+        passphrase = prompt_passphrase(confirm=True) if mode != "plain" else None
+        if out_path and out_path != "-":
+            import tempfile
+            from contextlib import suppress
+            
+            # Write beside the target and swap it in only once the export is
+            # complete, so a failure never truncates an earlier export.
+            target = os.path.abspath(out_path)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target),
+                                            prefix=f".{os.path.basename(target)}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as out:
+                    count = manager.export_connections(out, mode, passphrase,
+                                                       _option(args, "--type"), _option(args, "--tag"))
+                    out.flush()
+                    os.fsync(out.fileno())
+                os.replace(tmp_path, target)
+            except BaseException:
+                with suppress(FileNotFoundError):
+                    os.unlink(tmp_path)
+                raise
+        else:
+            count = manager.export_connections(sys.stdout, mode, passphrase,
+                                               _option(args, "--type"), _option(args, "--tag"))
+    except (OSError, TransferError) as e:
+        print(f"{Colors.RED}Export failed: {e}{Colors.RESET}", file=sys.stderr)
+        return False
+    
+    print(f"{Colors.GREEN}Exported {count} connection(s) ({mode}){Colors.RESET}", file=sys.stderr)
+    return True
+
+def import_command(manager: ConnectionManager, args: List[str]) -> bool:
+    import sys
+    
+    paths = [a for a in args if not a.startswith("--")]
+    if len(paths) != 1:
+        print(f"{Colors.RED}Usage: import <file|-> [--replace]{Colors.RESET}", file=sys.stderr)
+        return False
+    
+    try:
+        if paths[0] == "-":
+            written, skipped, invalid = manager.import_connections(sys.stdin, prompt_passphrase, "--replace" in args)
+        else:
+            with open(paths[0], "r") as f:
+                written, skipped, invalid = manager.import_connections(f, prompt_passphrase, "--replace" in args)
+    except (OSError, TransferError) as e:
+        print(f"{Colors.RED}Import failed: {e}{Colors.RESET}", file=sys.stderr)
+        return False
+    
+    print(f"{Colors.GREEN}Imported {written} connection(s){Colors.RESET}", file=sys.stderr)
+    if skipped:
+        shown = ", ".join(skipped[:10]) + (f" and {len(skipped) - 10} more" if len(skipped) > 10 else "")
+        print(f"{Colors.YELLOW}Skipped {len(skipped)} existing: {shown}{Colors.RESET}", file=sys.stderr)
+        print(f"{Colors.DIM}Use --replace to overwrite them{Colors.RESET}", file=sys.stderr)
+    if invalid:
+        print(f"{Colors.RED}Rejected {len(invalid)} invalid:{Colors.RESET}", file=sys.stderr)
+        for line in invalid:
+            print(f"  {line}", file=sys.stderr)
+    return not invalid
+
+def main():
+    import sys
     
     if len(sys.argv) < 2:
         print(f"{Colors.CYAN}Connection Manager{Colors.RESET}")
@@ -239,13 +439,26 @@ def main():
         print(f"Commands:")
         print(f"  {Colors.GREEN}save{Colors.RESET} <name> <type> <connection_string> [description]")
         print(f"  {Colors.GREEN}get{Colors.RESET} <name>")
-        print(f"  {Colors.GREEN}list{Colors.RESET} [--type postgres|turso] [--tag <tag>]")
+        print(f"  {Colors.GREEN}list{Colors.RESET} [--type <type>] [--tag <tag>]")
         print(f"  {Colors.GREEN}delete{Colors.RESET} <name>")
         print(f"  {Colors.GREEN}update{Colors.RESET} <name> [--conn <string>] [--desc <description>]")
+        print(f"  {Colors.GREEN}find{Colors.RESET} <query> [--limit <n>]")
+        print(f"  {Colors.GREEN}health{Colors.RESET} [--refresh] [--timeout <seconds>]")
+        print(f"  {Colors.GREEN}export{Colors.RESET} [--mode {'|'.join(EXPORT_MODES)}] [--out <file>] [--type <type>] [--tag <tag>]")
+        print(f"  {Colors.GREEN}import{Colors.RESET} <file|-> [--replace]")
+        print(f"  {Colors.GREEN}migrate{Colors.RESET}  Move connections.json into the SQLite store")
         sys.exit(1)
     
     command = sys.argv[1]
     
+    if command == "migrate":
+        copied = migrate_json_to_sqlite()
+        print(f"{Colors.GREEN}Migrated {copied} connection(s) to {CONNECTIONS_DB}{Colors.RESET}")
+        print(f"{Colors.DIM}{CONNECTIONS_FILE} was left in place as a backup{Colors.RESET}")
+        return
+    
+    manager = ConnectionManager()
+    
     if command == "save":
         if len(sys.argv) < 5:
             print(f"{Colors.RED}Usage: save <name> <type> <connection_string> [description]{Colors.RESET}")
@@ -285,6 +498,25 @@ def main():
         connections = manager.list_connections(db_type, tag)
         manager.print_connections_table(connections)
     
+    elif command == "find":
+        query = " ".join(a for i, a in enumerate(sys.argv[2:], 2)
+                         if not a.startswith("--") and sys.argv[i - 1] != "--limit")
+        limit = int(_option(sys.argv, "--limit") or DEFAULT_RESULT_LIMIT)
+        manager.print_search_results(manager.find_connections(query, limit))
+    
+    elif command == "health":
+        timeout = DEFAULT_PROBE_TIMEOUT
+        if "--timeout" in sys.argv and sys.argv.index("--timeout") + 1 < len(sys.argv):
+            timeout = float(sys.argv[sys.argv.index("--timeout") + 1])
+        
+        manager.print_health_table(manager.check_health(timeout, refresh="--refresh" in sys.argv))
+    
+    elif command == "export":
+        sys.exit(0 if export_command(manager, sys.argv[2:]) else 1)
+    
+    elif command == "import":
+        sys.exit(0 if import_command(manager, sys.argv[2:]) else 1)
+    
     elif command == "delete":
         if len(sys.argv) < 3:
             print(f"{Colors.RED}Usage: delete <name>{Colors.RESET}")
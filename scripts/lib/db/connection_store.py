@@ -0,0 +1,532 @@
+#!/usr/bin/env python3
+
+import fcntl
+import json
+import os
+import re
+import sqlite3
+from contextlib import contextmanager, suppress
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+DOTFILES_DATA_DIR = Path(os.environ.get("DOTFILES_DATA_DIR", Path.home() / ".dotfiles"))
+CONNECTIONS_DIR = DOTFILES_DATA_DIR / "connections"
+CONNECTIONS_FILE = CONNECTIONS_DIR / "connections.json"
+CONNECTIONS_DB = CONNECTIONS_DIR / "connections.db"
+USAGE_LOG = CONNECTIONS_DIR / "usage.log"
+SEARCH_INDEX = CONNECTIONS_DIR / "search_index.json"
+POOL_RUN_DIR = DOTFILES_DATA_DIR / "run"
+USAGE_COMPACT_BYTES = 64 * 1024
+
+RECORD_FIELDS = ("name", "type", "connection_string", "description", "tags",
+                 "created_at", "last_used", "use_count")
+UPDATABLE_FIELDS = ("connection_string", "description", "tags")
+TAG_SEPARATOR = "\x1f"
+
+
+class JsonConnectionStore:
+    """All connections in one JSON document, rewritten on every change.
+
+    Writes go to a temp file that is fsynced and renamed over the original,
+    so a crash leaves either the old or the new document, never a truncated
+    one. Every access holds an flock on a sidecar lock file: shared for reads,
+    exclusive across a whole load-modify-save so concurrent writers can't
+    drop each other's changes.
+    """
+
+    backend = "json"
+
+    def __init__(self, path: Path = CONNECTIONS_FILE):
+        self.path = path
+        self.lock_path = path.with_name(path.name + ".lock")
+        if not self.path.exists():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self._locked(fcntl.LOCK_EX):
+                if not self.path.exists():
+                    self._save({"connections": []})
+
+    @contextmanager
+    def _locked(self, mode: int):
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, mode)
+            yield
+        finally:
+            os.close(fd)
+
+    def _load(self) -> Dict:
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, FileNotFoundError):
+            return {"connections": []}
+
+    def _save(self, data: Dict):
+        import tempfile  # only writers pay for it
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                os.fchmod(f.fileno(), 0o600)
+                json.dump(data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            with suppress(FileNotFoundError):
+                os.unlink(tmp_path)
+            raise
+
+        dir_fd = os.open(self.path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+    def signature(self) -> str:
+        """Changes whenever the stored document does."""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return "json:missing"
+        return f"json:{st.st_mtime_ns}:{st.st_size}"
+
+    def get(self, name: str) -> Optional[Dict]:
+        with self._locked(fcntl.LOCK_SH):
+            data = self._load()
+        for conn in data["connections"]:
+            if conn["name"] == name:
+                return conn
+        return None
+
+    def list(self, db_type: Optional[str] = None, tag: Optional[str] = None) -> List[Dict]:
+        with self._locked(fcntl.LOCK_SH):
+            connections = self._load()["connections"]
+
+        if db_type:
+            connections = [c for c in connections if c["type"] == db_type]
+
+        if tag:
+            connections = [c for c in connections if tag in c.get("tags", [])]
+
+        return connections
+
+    def insert(self, record: Dict) -> bool:
+        with self._locked(fcntl.LOCK_EX):
+            data = self._load()
+            if any(c["name"] == record["name"] for c in data["connections"]):
+                return False
+            data["connections"].append(record)
+            self._save(data)
+        return True
+
+    def insert_many(self, records: List[Dict], replace: bool = False) -> Tuple[int, List[str]]:
+        """Add records in one locked rewrite; returns (written, skipped names)."""
+        with self._locked(fcntl.LOCK_EX):
+            data = self._load()
+            positions = {c["name"]: i for i, c in enumerate(data["connections"])}
+            written, skipped = 0, []
+            for record in records:
+                index = positions.get(record["name"])
+                if index is None:
+                    positions[record["name"]] = len(data["connections"])
+                    data["connections"].append(record)
+                elif replace:
+                    data["connections"][index] = record
+                else:
+                    skipped.append(record["name"])
+                    continue
+                written += 1
+            if written:
+                self._save(data)
+        return written, skipped
+
+    def update(self, name: str, fields: Dict) -> bool:
+        with self._locked(fcntl.LOCK_EX):
+            data = self._load()
+            for conn in data["connections"]:
+                if conn["name"] == name:
+                    conn.update(fields)
+                    self._save(data)
+                    return True
+        return False
+
+    def delete(self, name: str) -> bool:
+        with self._locked(fcntl.LOCK_EX):
+            data = self._load()
+            remaining = [c for c in data["connections"] if c["name"] != name]
+            if len(remaining) == len(data["connections"]):
+                return False
+            data["connections"] = remaining
+            self._save(data)
+        return True
+
+    def apply_usage(self, usage: Dict[str, Dict], mark: Optional[Dict] = None):
+        with self._locked(fcntl.LOCK_EX):
+            data = self._load()
+            for conn in data["connections"]:
+                stats = usage.get(conn["name"])
+                if stats:
+                    conn["use_count"] = conn.get("use_count", 0) + stats["count"]
+                    if stats["last_used"] > (conn.get("last_used") or ""):
+                        conn["last_used"] = stats["last_used"]
+            data["usage_mark"] = mark
+            self._save(data)
+
+    def usage_mark(self) -> Optional[Dict]:
+        with self._locked(fcntl.LOCK_SH):
+            return self._load().get("usage_mark")
+
+    def load_health(self) -> Dict[str, Dict]:
+        with self._locked(fcntl.LOCK_SH):
+            data = self._load()
+        return {c["name"]: c["health"] for c in data["connections"] if c.get("health")}
+
+    def save_health(self, results: Dict[str, Dict]):
+        with self._locked(fcntl.LOCK_EX):
+            data = self._load()
+            for conn in data["connections"]:
+                if conn["name"] in results:
+                    conn["health"] = results[conn["name"]]
+            self._save(data)
+
+
+class SqliteConnectionStore:
+    """Connections as indexed rows; every change touches only its own row.
+
+    Runs in WAL mode so readers never wait on a writer. Tags live in their
+    own table so tag filters use an index instead of scanning every row.
+    """
+
+    backend = "sqlite"
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS connections (
+            name TEXT PRIMARY KEY,
+            type TEXT NOT NULL,
+            connection_string TEXT NOT NULL,
+            description TEXT NOT NULL DEFAULT '',
+            created_at TEXT,
+            last_used TEXT,
+            use_count INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS idx_connections_type ON connections(type);
+        CREATE INDEX IF NOT EXISTS idx_connections_last_used ON connections(last_used);
+        CREATE TABLE IF NOT EXISTS connection_tags (
+            name TEXT NOT NULL REFERENCES connections(name) ON DELETE CASCADE ON UPDATE CASCADE,
+            tag TEXT NOT NULL,
+            PRIMARY KEY (name, tag)
+        );
+        CREATE INDEX IF NOT EXISTS idx_connection_tags_tag ON connection_tags(tag);
+        CREATE TABLE IF NOT EXISTS connection_health (
+            name TEXT PRIMARY KEY REFERENCES connections(name) ON DELETE CASCADE ON UPDATE CASCADE,
+            checked_at REAL NOT NULL,
+            result TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS usage_mark (
+            id INTEGER PRIMARY KEY CHECK (id = 0),
+            head TEXT NOT NULL,
+            offset INTEGER NOT NULL
+        );
+    """
+
+    SELECT = f"""
+        SELECT c.name, c.type, c.connection_string, c.description, c.created_at,
+               c.last_used, c.use_count,
+               (SELECT group_concat(t.tag, '{TAG_SEPARATOR}') FROM connection_tags t WHERE t.name = c.name) AS tags
+        FROM connections c
+    """
+
+    def __init__(self, path: Path = CONNECTIONS_DB):
+        self.path = path
+        if not self.path.exists():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            os.close(os.open(self.path, os.O_CREAT | os.O_WRONLY, 0o600))
+        self.db = sqlite3.connect(str(self.path), timeout=10, isolation_level=None)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute("PRAGMA foreign_keys=ON")
+        self.db.executescript(self.SCHEMA)
+
+    @staticmethod
+    def _to_record(row: sqlite3.Row) -> Dict:
+        record = {field: row[field] for field in RECORD_FIELDS if field != "tags"}
+        record["tags"] = row["tags"].split(TAG_SEPARATOR) if row["tags"] else []
+        return record
+
+    def _insert_row(self, record: Dict, or_ignore: bool = False) -> bool:
+        verb = "INSERT OR IGNORE" if or_ignore else "INSERT"
+        cursor = self.db.execute(
+            f"{verb} INTO connections (name, type, connection_string, description, created_at, last_used, use_count) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (record["name"], record["type"], record["connection_string"], record.get("description", ""),
+             record.get("created_at"), record.get("last_used"), record.get("use_count", 0)),
+        )
+        if cursor.rowcount:
+            self._set_tags(record["name"], record.get("tags") or [])
+        return cursor.rowcount > 0
+
+    def _set_tags(self, name: str, tags: List[str]):
+        self.db.execute("DELETE FROM connection_tags WHERE name = ?", (name,))
+        self.db.executemany("INSERT OR IGNORE INTO connection_tags (name, tag) VALUES (?, ?)",
+                            [(name, tag) for tag in tags])
+
+    def signature(self) -> str:
+        """Changes whenever a transaction commits (WAL) or is checkpointed."""
+        parts = ["sqlite"]
+        for path in (self.path, self.path.with_name(self.path.name + "-wal")):
+            try:
+                st = os.stat(path)
+                parts.append(f"{st.st_mtime_ns}:{st.st_size}")
+            except FileNotFoundError:
+                parts.append("-")
+        return ":".join(parts)
+
+    def get(self, name: str) -> Optional[Dict]:
+        row = self.db.execute(self.SELECT + " WHERE c.name = ?", (name,)).fetchone()
+        return self._to_record(row) if row else None
+
+    def list(self, db_type: Optional[str] = None, tag: Optional[str] = None) -> List[Dict]:
+        clauses, params = [], []
+        if db_type:
+            clauses.append("c.type = ?")
+            params.append(db_type)
+        if tag:
+            clauses.append("c.name IN (SELECT name FROM connection_tags WHERE tag = ?)")
+            params.append(tag)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return [self._to_record(row) for row in self.db.execute(self.SELECT + where + " ORDER BY c.rowid", params)]
+
+    def insert(self, record: Dict) -> bool:
+        try:
+            with self.db:
+                self.db.execute("BEGIN IMMEDIATE")
+                self._insert_row(record)
+        except sqlite3.IntegrityError:
+            return False
+        return True
+
+    def insert_many(self, records: List[Dict], replace: bool = False) -> Tuple[int, List[str]]:
+        """Add records in a single transaction; returns (written, skipped names)."""
+        written, skipped = 0, []
+        with self.db:
+            self.db.execute("BEGIN IMMEDIATE")
+            for record in records:
+                if replace:
+                    self.db.execute(
+                        "INSERT INTO connections (name, type, connection_string, description, created_at, last_used, use_count) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT(name) DO UPDATE SET "
+                        "type = excluded.type, connection_string = excluded.connection_string, "
+                        "description = excluded.description, created_at = excluded.created_at, "
+                        "last_used = excluded.last_used, use_count = excluded.use_count",
+                        (record["name"], record["type"], record["connection_string"], record.get("description", ""),
+                         record.get("created_at"), record.get("last_used"), record.get("use_count", 0)),
+                    )
+                    self._set_tags(record["name"], record.get("tags") or [])
+                elif not self._insert_row(record, or_ignore=True):
+                    skipped.append(record["name"])
+                    continue
+                written += 1
+        return written, skipped
+
+    def update(self, name: str, fields: Dict) -> bool:
+        columns = [f for f in UPDATABLE_FIELDS if f in fields and f != "tags"]
+        with self.db:
+            self.db.execute("BEGIN IMMEDIATE")
+            if columns:
+                assignments = ", ".join(f"{column} = ?" for column in columns)
+                cursor = self.db.execute(f"UPDATE connections SET {assignments} WHERE name = ?",
+                                         [fields[column] for column in columns] + [name])
+                found = cursor.rowcount > 0
+            else:
+                found = self.db.execute("SELECT 1 FROM connections WHERE name = ?", (name,)).fetchone() is not None
+            if found and "tags" in fields:
+                self._set_tags(name, fields["tags"] or [])
+        return found
+
+    def delete(self, name: str) -> bool:
+        with self.db:
+            cursor = self.db.execute("DELETE FROM connections WHERE name = ?", (name,))
+        return cursor.rowcount > 0
+
+    def apply_usage(self, usage: Dict[str, Dict], mark: Optional[Dict] = None):
+        with self.db:
+            self.db.execute("BEGIN IMMEDIATE")
+            self.db.executemany(
+                "UPDATE connections SET use_count = use_count + ?, "
+                "last_used = CASE WHEN last_used IS NULL OR last_used < ? THEN ? ELSE last_used END "
+                "WHERE name = ?",
+                [(stats["count"], stats["last_used"], stats["last_used"], name) for name, stats in usage.items()],
+            )
+            if mark is None:
+                self.db.execute("DELETE FROM usage_mark")
+            else:
+                self.db.execute("INSERT OR REPLACE INTO usage_mark (id, head, offset) VALUES (0, ?, ?)",
+                                (mark["head"], mark["offset"]))
+
+    def usage_mark(self) -> Optional[Dict]:
+        row = self.db.execute("SELECT head, offset FROM usage_mark WHERE id = 0").fetchone()
+        return dict(row) if row else None
+
+    def load_health(self) -> Dict[str, Dict]:
+        return {row["name"]: json.loads(row["result"])
+                for row in self.db.execute("SELECT name, result FROM connection_health")}
+
+    def save_health(self, results: Dict[str, Dict]):
+        with self.db:
+            self.db.execute("BEGIN IMMEDIATE")
+            self.db.executemany(
+                "INSERT OR REPLACE INTO connection_health (name, checked_at, result) "
+                "SELECT ?, ?, ? WHERE EXISTS (SELECT 1 FROM connections WHERE name = ?)",
+                [(name, result["checked_at"], json.dumps(result), name) for name, result in results.items()],
+            )
+
+
+class UsageLog:
+    """Append-only log of connection uses, folded into the store lazily.
+
+    Recording a use appends one short line under a shared flock, so lookups
+    never rewrite the store and parallel shells never lose each other's
+    updates. Once the log passes USAGE_COMPACT_BYTES, whoever can take the
+    exclusive lock without waiting folds it into the store and truncates it.
+
+    The store saves a high-water mark (the log's first line and how many
+    bytes of it were applied) in the same write as the counts. If the
+    process dies between that write and the truncate, the next reader skips
+    the part already applied instead of counting it twice; once truncated,
+    the first line differs and the mark no longer matches.
+    """
+
+    def __init__(self, path: Path = USAGE_LOG):
+        self.path = path
+
+    def append(self, name: str, when: str):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        line = json.dumps({"name": name, "at": when}) + "\n"
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_SH)
+            os.write(fd, line.encode())
+            size = os.fstat(fd).st_size
+        finally:
+            os.close(fd)
+        return size
+
+    def _read(self, f, mark: Optional[Dict]) -> Tuple[Dict[str, Dict], Dict]:
+        """Tally uses past the store's mark; return them with the new mark."""
+        data = f.read()
+        head = data.split(b"\n", 1)[0].decode(errors="replace")
+        start = 0
+        if mark and mark["head"] == head and mark["offset"] <= len(data):
+            start = mark["offset"]
+        usage = {}
+        for line in data[start:].splitlines():
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            stats = usage.setdefault(entry["name"], {"count": 0, "last_used": ""})
+            stats["count"] += 1
+            stats["last_used"] = max(stats["last_used"], entry["at"])
+        return usage, {"head": head, "offset": len(data)}
+
+    def pending(self, store) -> Dict[str, Dict]:
+        try:
+            with open(self.path, "rb") as f:
+                fcntl.flock(f, fcntl.LOCK_SH)
+                return self._read(f, store.usage_mark())[0]
+        except FileNotFoundError:
+            return {}
+
+    def overlay(self, store, records: List[Dict]) -> List[Dict]:
+        """Add uses not yet compacted into the store to the given records."""
+        usage = self.pending(store)
+        for record in records:
+            stats = usage.get(record["name"])
+            if stats:
+                record["use_count"] = (record.get("use_count") or 0) + stats["count"]
+                if stats["last_used"] > (record.get("last_used") or ""):
+                    record["last_used"] = stats["last_used"]
+        return records
+
+    def compact(self, store, block: bool = True, drop: Tuple[str, ...] = ()) -> bool:
+        """Fold the log into the store and truncate it.
+
+        Uses of the names in drop are discarded rather than applied.
+        """
+        try:
+            f = open(self.path, "r+b")
+        except FileNotFoundError:
+            return True
+        with f:
+            try:
+                fcntl.flock(f, fcntl.LOCK_EX if block else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return False
+            usage, mark = self._read(f, store.usage_mark())
+            for name in drop:
+                usage.pop(name, None)
+            if mark["offset"]:
+                store.apply_usage(usage, mark)
+                f.truncate(0)
+        return True
+
+    def forget(self, store, name: str):
+        """Drop uses of a deleted connection so a new one by that name starts clean."""
+        self.compact(store, drop=(name,))
+
+
+def pool_socket_dir(name: str) -> Path:
+    """Directory holding the Unix socket of a running 'db pool' for name."""
+    return POOL_RUN_DIR / f"pool-{re.sub(r'[^A-Za-z0-9_.-]', '_', name)}"
+
+
+def open_store(backend: Optional[str] = None):
+    """Pick the connection store.
+
+    DB_CONNECTIONS_BACKEND (json|sqlite) wins; otherwise SQLite is used once
+    connections.db exists (i.e. after `migrate`), and the JSON file before.
+    """
+    backend = backend or os.environ.get("DB_CONNECTIONS_BACKEND")
+    if not backend:
+        backend = "sqlite" if CONNECTIONS_DB.exists() else "json"
+
+    if backend == "sqlite":
+        return SqliteConnectionStore()
+    if backend == "json":
+        return JsonConnectionStore()
+    raise ValueError(f"Unknown connection store backend: {backend}")
+
+
+def migrate_json_to_sqlite(json_path: Path = CONNECTIONS_FILE, db_path: Path = CONNECTIONS_DB) -> int:
+    """Copy every connection from the JSON file into SQLite in one transaction.
+
+    Encrypted values are copied as-is, along with cached health results and
+    the usage log's high-water mark (see UsageLog), so uses already folded
+    into the JSON counts aren't counted again. Names already present in the
+    database are left alone, so running it twice is harmless. The JSON file
+    is kept as a backup. Returns the number of connections copied.
+    """
+    source = JsonConnectionStore(json_path)
+    target = SqliteConnectionStore(db_path)
+    health = source.load_health()
+    mark = source.usage_mark()
+    copied = 0
+
+    with target.db:
+        target.db.execute("BEGIN IMMEDIATE")
+        for record in source.list():
+            if target._insert_row(record, or_ignore=True):
+                copied += 1
+                if record["name"] in health:
+                    result = health[record["name"]]
+                    target.db.execute(
+                        "INSERT OR REPLACE INTO connection_health (name, checked_at, result) VALUES (?, ?, ?)",
+                        (record["name"], result["checked_at"], json.dumps(result)),
+                    )
+        if mark:
+            target.db.execute("INSERT OR IGNORE INTO usage_mark (id, head, offset) VALUES (0, ?, ?)",
+                              (mark["head"], mark["offset"]))
+
+    return copied
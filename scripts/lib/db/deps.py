@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+
+import hashlib
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import time
+from typing import Dict, List, Optional
+
+from connection_store import DOTFILES_DATA_DIR
+
+DEPS_CACHE_FILE = DOTFILES_DATA_DIR / "cache" / "deps.json"
+DEPS_CACHE_TTL_SECONDS = 24 * 60 * 60
+DEPS_CACHE_MAX_ENTRIES = 16
+
+# module -> (pip package, description)
+PYTHON_DEPS = {
+    "psycopg2": ("psycopg2-binary", "PostgreSQL adapter"),
+    "rich": ("rich", "Enhanced terminal UI"),
+    "keyring": ("keyring", "Secure credential storage"),
+    "cryptography": ("cryptography", "Encryption support"),
+}
+
+# command -> (description, install hint)
+CLI_DEPS = {
+    "turso": ("Turso CLI", "curl -sSfL https://get.tur.so/install.sh | bash"),
+}
+
+_probed: Optional[Dict] = None
+
+
+def _mtime(path: str) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def cache_key() -> str:
+    """Identify the environment the probe ran in.
+
+    Covers the interpreter and PATH, plus the mtimes of the import and PATH
+    directories so installing or removing a package or binary invalidates
+    the entry without anyone having to clear the cache.
+    """
+    path_dirs = os.environ.get("PATH", "").split(os.pathsep)
+    parts = [sys.executable, sys.version, os.environ.get("PATH", "")]
+    parts += [f"{entry}:{_mtime(entry)}" for entry in sys.path + path_dirs if entry]
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+def _probe_now() -> Dict:
+    # find_spec locates a module without executing it, so nothing heavy is imported.
+    return {
+        "python": {module: importlib.util.find_spec(module) is not None for module in PYTHON_DEPS},
+        "cli": {command: shutil.which(command) for command in CLI_DEPS},
+        "checked_at": time.time(),
+    }
+
+
+def _load_cache() -> Dict:
+    try:
+        with open(DEPS_CACHE_FILE, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache: Dict):
+    import tempfile
+
+    try:
+        DEPS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=DEPS_CACHE_FILE.parent, prefix=".deps.")
+        with os.fdopen(fd, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp, DEPS_CACHE_FILE)
+    except OSError:
+        pass
+
+
+def probe(refresh: bool = False) -> Dict:
+    """Availability of every known dependency, from the on-disk cache when valid."""
+    global _probed
+    if _probed is not None and not refresh:
+        return _probed
+
+    key = cache_key()
+    cache = _load_cache()
+    entry = cache.get(key)
+    if refresh or not entry or time.time() - entry.get("checked_at", 0) > DEPS_CACHE_TTL_SECONDS:
+        entry = _probe_now()
+        cache[key] = entry
+        if len(cache) > DEPS_CACHE_MAX_ENTRIES:
+            for stale in sorted(cache, key=lambda k: cache[k].get("checked_at", 0))[:-DEPS_CACHE_MAX_ENTRIES]:
+                del cache[stale]
+        _save_cache(cache)
+
+    _probed = entry
+    return entry
+
+
+def module_available(module: str) -> bool:
+    if module in PYTHON_DEPS:
+        return probe()["python"][module]
+    return importlib.util.find_spec(module) is not None
+
+
+def command_path(command: str) -> Optional[str]:
+    if command in CLI_DEPS:
+        return probe()["cli"][command]
+    return shutil.which(command)
+
+
+def missing_dependencies() -> List[Dict]:
+    result = probe()
+    missing = []
+
+    for module, (package, description) in PYTHON_DEPS.items():
+        if not result["python"][module]:
+            missing.append({
+                'type': 'python',
+                'name': description,
+                'package': package,
+                'install': f'pip install {package}'
+            })
+
+    for command, (name, install) in CLI_DEPS.items():
+        if not result["cli"][command]:
+            missing.append({
+                'type': 'cli',
+                'name': name,
+                'package': command,
+                'install': install
+            })
+
+    return missing
@@ -0,0 +1,54 @@
+"""Database backend drivers, imported only when their type is used.
+
+Built-in drivers are listed as "module:attribute" strings. Other packages
+can add backends through the "dotfiles.db_drivers" entry point group, and
+are only looked up when a type isn't built in.
+"""
+
+import importlib
+from typing import Dict, List, Optional
+
+ENTRY_POINT_GROUP = "dotfiles.db_drivers"
+
+BUILTIN_DRIVERS = {
+    "postgres": "drivers.postgres:PostgresDriver",
+    "turso": "drivers.turso:TursoDriver",
+    "mysql": "drivers.mysql:MysqlDriver",
+    "sqlite": "drivers.sqlite:SqliteDriver",
+    "redis": "drivers.redis:RedisDriver",
+}
+
+_loaded: Dict[str, object] = {}
+_plugins: Optional[Dict[str, object]] = None
+
+
+def _plugin_entry_points() -> Dict[str, object]:
+    global _plugins
+    if _plugins is None:
+        from importlib.metadata import entry_points
+        try:
+            found = entry_points(group=ENTRY_POINT_GROUP)
+        except TypeError:  # Python < 3.10
+            found = entry_points().get(ENTRY_POINT_GROUP, [])
+        _plugins = {ep.name: ep for ep in found}
+    return _plugins
+
+
+def driver_types() -> List[str]:
+    plugins = sorted(name for name in _plugin_entry_points() if name not in BUILTIN_DRIVERS)
+    return list(BUILTIN_DRIVERS) + plugins
+
+
+def get_driver(db_type: str):
+    """The driver instance for db_type, or None if no driver provides it."""
+    if db_type not in _loaded:
+        if db_type in BUILTIN_DRIVERS:
+            module, attribute = BUILTIN_DRIVERS[db_type].split(":")
+            driver_class = getattr(importlib.import_module(module), attribute)
+        else:
+            entry_point = _plugin_entry_points().get(db_type)
+            if entry_point is None:
+                return None
+            driver_class = entry_point.load()
+        _loaded[db_type] = driver_class()
+    return _loaded[db_type]
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+
+import hashlib
+import socket
+import time
+from typing import Dict, List, Optional, Tuple
+
+from drivers.base import Driver, elapsed_ms
+
+CLIENT_LONG_PASSWORD = 0x1
+CLIENT_CONNECT_WITH_DB = 0x8
+CLIENT_PROTOCOL_41 = 0x200
+CLIENT_SECURE_CONNECTION = 0x8000
+CLIENT_PLUGIN_AUTH = 0x80000
+UTF8MB4_CHARSET = 45
+
+
+class MysqlAuthError(Exception):
+    pass
+
+
+def _xor(a: bytes, b: bytes) -> bytes:
+    return bytes(x ^ y for x, y in zip(a, b))
+
+
+def _scramble(plugin: str, password: str, salt: bytes) -> bytes:
+    if not password:
+        return b""
+    secret = password.encode()
+    if plugin == "caching_sha2_password":
+        digest = hashlib.sha256(secret).digest()
+        return _xor(digest, hashlib.sha256(hashlib.sha256(digest).digest() + salt).digest())
+    digest = hashlib.sha1(secret).digest()
+    return _xor(digest, hashlib.sha1(salt + hashlib.sha1(digest).digest()).digest())
+
+
+class _Packets:
+    """Length-prefixed MySQL packets over a blocking socket."""
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.seq = 0
+
+    def _read_exact(self, n: int) -> bytes:
+        data = b""
+        while len(data) < n:
+            chunk = self.sock.recv(n - len(data))
+            if not chunk:
+                raise ConnectionError("server closed the connection")
+            data += chunk
+        return data
+
+    def read(self) -> bytes:
+        header = self._read_exact(4)
+        self.seq = header[3] + 1
+        payload = self._read_exact(int.from_bytes(header[:3], "little"))
+        if payload[:1] == b"\xff":
+            # ERR: code (2), optional '#' + SQLSTATE (6), message
+            message = payload[9:] if payload[3:4] == b"#" else payload[3:]
+            raise MysqlAuthError(message.decode(errors="replace"))
+        return payload
+
+    def write(self, payload: bytes):
+        self.sock.sendall(len(payload).to_bytes(3, "little") + bytes([self.seq & 0xFF]) + payload)
+        self.seq += 1
+
+
+class MysqlDriver(Driver):
+    name = "mysql"
+    label = "MySQL"
+    schemes = ("mysql", "mariadb")
+    default_port = 3306
+    cli = "mysql"
+    install_hint = "brew install mysql-client / apt install mysql-client"
+
+    def probe(self, url: str, timeout: float) -> Optional[float]:
+        """Log in with mysql_native_password or caching_sha2_password's fast path.
+
+        Returns None when the server insists on caching_sha2 full
+        authentication, which needs TLS or an RSA key exchange.
+        """
+        parsed = self.parse_url(url)
+        started = time.perf_counter()
+        with socket.create_connection((parsed["host"], parsed["port"]), timeout=timeout) as sock:
+            packets = _Packets(sock)
+            greeting = packets.read()
+            version_end = greeting.index(b"\0", 1)
+            rest = greeting[version_end + 1:]
+            salt = rest[4:12]
+            capabilities = int.from_bytes(rest[13:15], "little") | (int.from_bytes(rest[18:20], "little") << 16)
+            salt_len = rest[20]
+            salt += rest[31:31 + max(13, salt_len - 8)].rstrip(b"\0")
+            plugin_end = rest.find(b"\0", 31 + max(13, salt_len - 8))
+            plugin = rest[31 + max(13, salt_len - 8):plugin_end].decode() if plugin_end != -1 else "mysql_native_password"
+
+            flags = CLIENT_LONG_PASSWORD | CLIENT_PROTOCOL_41 | CLIENT_SECURE_CONNECTION | CLIENT_PLUGIN_AUTH
+            flags &= capabilities | CLIENT_PROTOCOL_41
+            if parsed["database"]:
+                flags |= CLIENT_CONNECT_WITH_DB
+            auth = _scramble(plugin, parsed["password"], salt[:20])
+            response = (flags.to_bytes(4, "little") + (1 << 24).to_bytes(4, "little")
+                        + bytes([UTF8MB4_CHARSET]) + bytes(23)
+                        + parsed["user"].encode() + b"\0"
+                        + bytes([len(auth)]) + auth)
+            if parsed["database"]:
+                response += parsed["database"].encode() + b"\0"
+            packets.write(response + plugin.encode() + b"\0")
+
+            while True:
+                reply = packets.read()
+                if reply[:1] == b"\x00":
+                    break
+                if reply[:1] == b"\xfe":
+                    # Auth switch: the server wants another plugin and salt.
+                    plugin_end = reply.index(b"\0", 1)
+                    plugin = reply[1:plugin_end].decode()
+                    packets.write(_scramble(plugin, parsed["password"], reply[plugin_end + 1:plugin_end + 21]))
+                elif reply[:2] == b"\x01\x03":
+                    continue  # caching_sha2 fast auth accepted; OK follows
+                elif reply[:2] == b"\x01\x04":
+                    return None
+                else:
+                    raise MysqlAuthError(f"unexpected reply 0x{reply[:1].hex()} during login")
+
+            packets.seq = 0
+            packets.write(b"\x01")  # COM_QUIT
+        return elapsed_ms(started)
+
+    def launch_command(self, url: str) -> Optional[Tuple[List[str], Dict[str, str]]]:
+        parsed = self.parse_url(url)
+        argv = ["mysql", "-h", parsed["host"], "-P", str(parsed["port"])]
+        if parsed["user"]:
+            argv += ["-u", parsed["user"]]
+        if parsed["database"]:
+            argv.append(parsed["database"])
+        # MYSQL_PWD keeps the password out of the process list.
+        return argv, ({"MYSQL_PWD": parsed["password"]} if parsed["password"] else {})
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+import os
+import time
+from typing import Dict, Optional, Tuple
+
+from drivers.base import Driver, elapsed_ms
+
+
+class PostgresDriver(Driver):
+    name = "postgres"
+    label = "PostgreSQL"
+    schemes = ("postgres", "postgresql")
+    default_port = 5432
+    cli = "psql"
+    install_hint = "brew install libpq / apt install postgresql-client"
+
+    def parse_url(self, url: str) -> Dict:
+        """Also accepts libpq keyword DSNs and ?host=/?port= query parameters."""
+        import pg_pool
+
+        if pg_pool.is_keyword_dsn(url):
+            params = pg_pool.parse_keyword_dsn(url)
+            port = params.get("port")
+            if port and not port.isdigit():
+                raise ValueError(f"invalid port \"{port}\"")
+            return {
+                "scheme": "",
+                "host": params.get("host"),
+                "port": int(port) if port else self.default_port,
+                "user": params.get("user", ""),
+                "password": params.get("password", ""),
+                "database": params.get("dbname", ""),
+                "query": params,
+            }
+
+        parsed = super().parse_url(url)
+        query = parsed["query"]
+        parsed["host"] = parsed["host"] or query.get("host")
+        if "port" in query and query["port"].isdigit():
+            parsed["port"] = int(query["port"])
+        return parsed
+
+    def validate(self, url: str) -> Optional[str]:
+        # Without a host libpq connects through the default unix socket
+        try:
+            self.parse_url(url)
+        except ValueError as e:
+            return str(e)
+        return None
+
+    def address(self, url: str) -> Optional[Tuple[str, int]]:
+        address = super().address(url)
+        if address and address[0].startswith("/"):
+            return None  # unix socket directory; the login probe covers it
+        return address
+
+    def probe(self, url: str, timeout: float) -> Optional[float]:
+        # Speaks the wire protocol through the pool's client code, so the
+        # probe needs no driver package and covers SCRAM, MD5 and TLS.
+        import asyncio
+        import pg_pool
+
+        async def login():
+            conn = await asyncio.wait_for(pg_pool.ServerConnection.open(pg_pool.parse_target(url)), timeout)
+            try:
+                error = await asyncio.wait_for(conn.query("SELECT 1"), timeout)
+            finally:
+                conn.close()
+            if error:
+                raise pg_pool.PoolError(error)
+
+        started = time.perf_counter()
+        asyncio.run(login())
+        return elapsed_ms(started)
+
+    def environment(self, name: str, url: str) -> Dict[str, str]:
+        from connection_store import pool_socket_dir
+
+        if pool_socket_dir(name).is_dir():
+            import pg_pool
+            url = pg_pool.running_pool_url(name, url) or url
+        return {"DATABASE_URL": url}
+
+    def launch(self, manager, name: str, url: str) -> bool:
+        from connection_manager import Colors
+
+        env = self.environment(name, url)
+        if env["DATABASE_URL"] != url:
+            print(f"{Colors.DIM}Using the running pool for '{name}'{Colors.RESET}")
+        os.environ.update(env)
+        return manager.run_postgres_manager()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+
+import socket
+import time
+from typing import Dict, List, Optional, Tuple
+
+from drivers.base import Driver, elapsed_ms
+
+
+class RedisAuthError(Exception):
+    pass
+
+
+def _command(*args: str) -> bytes:
+    parts = [f"*{len(args)}\r\n".encode()]
+    for arg in args:
+        data = arg.encode()
+        parts.append(f"${len(data)}\r\n".encode() + data + b"\r\n")
+    return b"".join(parts)
+
+
+class RedisDriver(Driver):
+    name = "redis"
+    label = "Redis"
+    schemes = ("redis", "rediss")
+    default_port = 6379
+    env_var = "REDIS_URL"
+    cli = "redis-cli"
+    install_hint = "brew install redis / apt install redis-tools"
+
+    def probe(self, url: str, timeout: float) -> Optional[float]:
+        """AUTH (when the URL has a password), then PING, over RESP."""
+        parsed = self.parse_url(url)
+        started = time.perf_counter()
+        sock = socket.create_connection((parsed["host"], parsed["port"]), timeout=timeout)
+        try:
+            if parsed["scheme"] == "rediss":
+                import ssl
+                sock = ssl.create_default_context().wrap_socket(sock, server_hostname=parsed["host"])
+            reader = sock.makefile("rb")
+
+            commands = []
+            if parsed["password"]:
+                credentials = [parsed["user"], parsed["password"]] if parsed["user"] else [parsed["password"]]
+                commands.append(_command("AUTH", *credentials))
+            commands.append(_command("PING"))
+            sock.sendall(b"".join(commands))
+
+            for _ in commands:
+                line = reader.readline()
+                if not line:
+                    raise ConnectionError("server closed the connection")
+                if line.startswith(b"-"):
+                    raise RedisAuthError(line[1:].decode(errors="replace").strip())
+            sock.sendall(_command("QUIT"))
+        finally:
+            sock.close()
+        return elapsed_ms(started)
+
+    def launch_command(self, url: str) -> Optional[Tuple[List[str], Dict[str, str]]]:
+        parsed = self.parse_url(url)
+        argv = ["redis-cli", "-h", parsed["host"], "-p", str(parsed["port"])]
+        if parsed["user"]:
+            argv += ["--user", parsed["user"]]
+        if parsed["database"]:
+            argv += ["-n", parsed["database"]]
+        if parsed["scheme"] == "rediss":
+            argv.append("--tls")
+        # REDISCLI_AUTH keeps the password out of the process list.
+        return argv, ({"REDISCLI_AUTH": parsed["password"]} if parsed["password"] else {})
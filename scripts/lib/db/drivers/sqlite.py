@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote, unquote, urlsplit
+
+from drivers.base import Driver, elapsed_ms
+
+
+class SqliteDriver(Driver):
+    """Local database files, saved as sqlite:///path, file:path or a bare path."""
+
+    name = "sqlite"
+    label = "SQLite"
+    cli = "sqlite3"
+    install_hint = "brew install sqlite / apt install sqlite3"
+
+    def parse_url(self, url: str) -> Dict:
+        parts = urlsplit(url)
+        if parts.scheme in ("sqlite", "sqlite3"):
+            # SQLAlchemy style: sqlite:///relative.db, sqlite:////absolute.db
+            path = unquote(parts.netloc + parts.path if parts.netloc else parts.path[1:])
+        elif parts.scheme == "file":
+            path = unquote(parts.path)
+        elif not parts.scheme:
+            path = url
+        else:
+            raise ValueError("expected sqlite:///path, file:path or a file path")
+        if not path:
+            raise ValueError("URL has no file path")
+        return {"scheme": "sqlite", "host": None, "port": None, "user": "", "password": "",
+                "database": os.path.expanduser(path), "query": {}}
+
+    def address(self, url: str) -> Optional[Tuple[str, int]]:
+        return None
+
+    def probe(self, url: str, timeout: float) -> Optional[float]:
+        import sqlite3
+
+        path = self.parse_url(url)["database"]
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"no such file: {path}")
+        started = time.perf_counter()
+        conn = sqlite3.connect(f"file:{quote(os.path.abspath(path))}?mode=ro", uri=True, timeout=timeout)
+        try:
+            conn.execute("SELECT count(*) FROM sqlite_master").fetchone()
+        finally:
+            conn.close()
+        return elapsed_ms(started)
+
+    def launch_command(self, url: str) -> Optional[Tuple[List[str], Dict[str, str]]]:
+        return ["sqlite3", self.parse_url(url)["database"]], {}
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+import json
+import time
+from typing import Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from drivers.base import Driver, elapsed_ms
+
+
+class TursoDriver(Driver):
+    name = "turso"
+    label = "Turso"
+    schemes = ("libsql", "https", "http", "wss", "ws")
+    default_port = 443
+    env_var = "TURSO_DATABASE_URL"
+
+    def validate(self, url: str) -> Optional[str]:
+        # A bare database name is what `db turso` and the turso CLI work with
+        if "://" not in url:
+            return None if url.strip() else "empty database name"
+        return super().validate(url)
+
+    def address(self, url: str) -> Optional[Tuple[str, int]]:
+        parts = urlsplit(url)
+        if not parts.hostname:
+            return None
+        return parts.hostname, parts.port or (80 if parts.scheme in ("http", "ws") else 443)
+
+    def probe(self, url: str, timeout: float) -> Optional[float]:
+        import ssl
+        import urllib.request
+
+        parts = urlsplit(url)
+        token = (parse_qs(parts.query).get("authToken") or [None])[0]
+        if not token:
+            return None
+
+        body = json.dumps({"requests": [
+            {"type": "execute", "stmt": {"sql": "SELECT 1"}},
+            {"type": "close"},
+        ]}).encode()
+        request = urllib.request.Request(
+            f"https://{parts.hostname}/v2/pipeline",
+            data=body,
+            headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
+        )
+        started = time.perf_counter()
+        with urllib.request.urlopen(request, timeout=timeout, context=ssl.create_default_context()) as response:
+            response.read()
+        return elapsed_ms(started)
+
+    def launch(self, manager, name: str, url: str) -> bool:
+        from connection_manager import Colors
+
+        super().launch(manager, name, url)
+        print(f"{Colors.DIM}Use with: db turso{Colors.RESET}")
+        return True
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+
+import socket
+import time
+from typing import Dict, List, Optional
+
+from drivers import get_driver
+from drivers.base import elapsed_ms
+
+HEALTH_TTL_SECONDS = 60
+DEFAULT_PROBE_TIMEOUT = 5.0
+DEFAULT_PROBE_WORKERS = 32
+
+
+def _tcp_probe(host: str, port: int, timeout: float) -> float:
+    started = time.perf_counter()
+    with socket.create_connection((host, port), timeout=timeout):
+        pass
+    return elapsed_ms(started)
+
+
+def probe_connection(conn: Dict, timeout: float = DEFAULT_PROBE_TIMEOUT) -> Dict:
+    """Measure TCP connect and, where the driver has one, a native login round trip.
+
+    conn must carry a decrypted connection_string. Status is one of ok,
+    tcp_only (reachable, no login probe available), auth_failed, unreachable
+    or invalid. Drivers for local files skip the TCP step.
+    """
+    result = {"status": "invalid", "tcp_ms": None, "auth_ms": None, "error": None,
+              "checked_at": time.time()}
+
+    url = conn["connection_string"]
+    driver = get_driver(conn["type"])
+    if driver is None:
+        result["error"] = f"no driver for type '{conn['type']}'"
+        return result
+    error = driver.validate(url)
+    if error:
+        result["error"] = error
+        return result
+
+    address = driver.address(url)
+    if address:
+        try:
+            result["tcp_ms"] = _tcp_probe(*address, timeout)
+        except OSError as e:
+            result["status"] = "unreachable"
+            result["error"] = str(e) or e.__class__.__name__
+            return result
+
+    try:
+        result["auth_ms"] = driver.probe(url, timeout)
+    except OSError as e:
+        result["status"] = "unreachable"
+        result["error"] = str(e).strip() or e.__class__.__name__
+        return result
+    except Exception as e:
+        result["status"] = "auth_failed"
+        result["error"] = str(e).strip() or e.__class__.__name__
+        return result
+
+    result["status"] = "ok" if result["auth_ms"] is not None else "tcp_only"
+    return result
+
+
+def probe_all(connections: List[Dict], timeout: float = DEFAULT_PROBE_TIMEOUT,
+              workers: int = DEFAULT_PROBE_WORKERS) -> Dict[str, Dict]:
+    """Probe every connection at once; the whole run is bounded by about one timeout.
+
+    Each probe bounds its own sockets with the timeout, but name lookups
+    aren't, so probes run on daemon threads: anything still running after
+    the shared deadline (TCP + auth, plus slack) is reported as a timeout
+    and left behind instead of holding up the command's exit.
+    """
+    import queue
+    import threading
+
+    if not connections:
+        return {}
+
+    pending = queue.SimpleQueue()
+    for conn in connections:
+        pending.put(conn)
+    finished = queue.SimpleQueue()
+
+    def worker():
+        while True:
+            try:
+                conn = pending.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                result = probe_connection(conn, timeout)
+            except Exception as e:
+                result = {"status": "invalid", "tcp_ms": None, "auth_ms": None,
+                          "error": str(e) or e.__class__.__name__, "checked_at": time.time()}
+            finished.put((conn["name"], result))
+
+    for _ in range(min(workers, len(connections))):
+        threading.Thread(target=worker, daemon=True).start()
+
+    results = {}
+    deadline = time.monotonic() + timeout * 2 + 1
+    while len(results) < len(connections):
+        try:
+            name, result = finished.get(timeout=max(0.0, deadline - time.monotonic()))
+        except queue.Empty:
+            break
+        results[name] = result
+
+    for conn in connections:
+        if conn["name"] not in results:
+            results[conn["name"]] = {"status": "timeout", "tcp_ms": None, "auth_ms": None,
+                                     "error": f"no answer within {timeout:g}s", "checked_at": time.time()}
+    return results
+
+
+def is_fresh(result: Optional[Dict], ttl: float = HEALTH_TTL_SECONDS) -> bool:
+    return bool(result) and time.time() - result.get("checked_at", 0) < ttl
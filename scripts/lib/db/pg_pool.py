@@ -0,0 +1,641 @@
+#!/usr/bin/env python3
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import os
+import re
+import socket
+import ssl
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+from connection_store import pool_socket_dir
+
+# pgbouncer's port, so a --tcp pool doesn't collide with a local server
+DEFAULT_POOL_PORT = 6432
+# Written beside the socket while a pool runs, so clients can find its port
+POOL_INFO_FILE = "pool.json"
+DEFAULT_POOL_SIZE = 10
+DEFAULT_WARM_CONNECTIONS = 2
+IDLE_TIMEOUT_SECONDS = 300
+CONNECT_TIMEOUT_SECONDS = 10
+RESET_TIMEOUT_SECONDS = 5
+
+PROTOCOL_VERSION = 196608  # 3.0
+SSL_REQUEST_CODE = 80877103
+GSSENC_REQUEST_CODE = 80877104
+CANCEL_REQUEST_CODE = 80877102
+
+# Startup parameters that pick the server session rather than configure it;
+# the proxy always logs in as the saved connection's user and database.
+SESSION_IDENTITY_PARAMS = {"user", "database", "options", "replication"}
+GUC_NAME_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_.]*$")
+
+
+class PoolError(Exception):
+    pass
+
+
+def _message(kind: bytes, payload: bytes = b"") -> bytes:
+    return kind + (len(payload) + 4).to_bytes(4, "big") + payload
+
+
+def _cstrings(*values: str) -> bytes:
+    return b"".join(value.encode() + b"\0" for value in values)
+
+
+def _error_message(message: str, code: str = "08006") -> bytes:
+    fields = b"".join(kind + value.encode() + b"\0" for kind, value in (
+        (b"S", "FATAL"), (b"V", "FATAL"), (b"C", code), (b"M", message)))
+    return _message(b"E", fields + b"\0")
+
+
+def _error_text(payload: bytes) -> str:
+    fields = {}
+    for field in payload.split(b"\0"):
+        if field:
+            fields[field[:1]] = field[1:].decode(errors="replace")
+    return fields.get(b"M", "unknown server error")
+
+
+async def _read_message(reader: asyncio.StreamReader) -> Tuple[bytes, bytes]:
+    header = await reader.readexactly(5)
+    length = int.from_bytes(header[1:], "big")
+    return header[:1], await reader.readexactly(length - 4)
+
+
+async def _read_startup(reader: asyncio.StreamReader) -> Tuple[int, bytes]:
+    length = int.from_bytes(await reader.readexactly(4), "big")
+    if not 8 <= length <= 10000:
+        raise PoolError("invalid startup packet length")
+    body = await reader.readexactly(length - 4)
+    return int.from_bytes(body[:4], "big"), body[4:]
+
+
+def is_keyword_dsn(connection_string: str) -> bool:
+    return "://" not in connection_string
+
+
+def parse_keyword_dsn(dsn: str) -> Dict[str, str]:
+    """Parse a libpq keyword/value string ("host=/tmp dbname='my db'").
+
+    Values may be single-quoted; backslash escapes the next character.
+    Raises ValueError on anything libpq would reject.
+    """
+    params: Dict[str, str] = {}
+    i, n = 0, len(dsn)
+    while True:
+        while i < n and dsn[i].isspace():
+            i += 1
+        if i >= n:
+            return params
+        start = i
+        while i < n and dsn[i] != "=" and not dsn[i].isspace():
+            i += 1
+        key = dsn[start:i]
+        while i < n and dsn[i].isspace():
+            i += 1
+        if not key or i >= n or dsn[i] != "=":
+            raise ValueError(f"missing \"=\" after \"{key or dsn[start:]}\" in connection string")
+        i += 1
+        while i < n and dsn[i].isspace():
+            i += 1
+
+        value = []
+        quoted = i < n and dsn[i] == "'"
+        if quoted:
+            i += 1
+        while i < n:
+            char = dsn[i]
+            if char == "\\" and i + 1 < n:
+                value.append(dsn[i + 1])
+                i += 2
+                continue
+            if (quoted and char == "'") or (not quoted and char.isspace()):
+                break
+            value.append(char)
+            i += 1
+        if quoted:
+            if i >= n:
+                raise ValueError("unterminated quoted string in connection string")
+            i += 1
+        params[key] = "".join(value)
+
+
+def parse_target(connection_string: str) -> Dict:
+    """Split a postgres URL or keyword DSN into what the proxy needs to open server sessions.
+
+    A host starting with "/" is a unix socket directory, as in
+    postgresql:///db?host=/var/run/postgresql.
+    """
+    if is_keyword_dsn(connection_string):
+        params = parse_keyword_dsn(connection_string)
+        user = params.get("user") or os.environ.get("USER", "postgres")
+        return {
+            "host": params.get("host") or "localhost",
+            "port": int(params.get("port") or 5432),
+            "user": user,
+            "password": params.get("password", ""),
+            "database": params.get("dbname") or user,
+            "sslmode": params.get("sslmode", "prefer"),
+            "options": params.get("options"),
+        }
+
+    parts = urlsplit(connection_string)
+    query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+    user = unquote(parts.username or "") or query.get("user") or os.environ.get("USER", "postgres")
+    return {
+        "host": parts.hostname or query.get("host") or "localhost",
+        "port": parts.port or int(query.get("port", 5432)),
+        "user": user,
+        "password": unquote(parts.password or "") or query.get("password") or "",
+        "database": unquote(parts.path.lstrip("/")) or query.get("dbname") or user,
+        "sslmode": query.get("sslmode", "prefer"),
+        "options": query.get("options"),
+    }
+
+
+async def _open_transport(target: Dict) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """Connect to the server and negotiate TLS the way libpq's sslmode does."""
+    host, port = target["host"], target["port"]
+    if host.startswith("/"):
+        return await asyncio.open_unix_connection(os.path.join(host, f".s.PGSQL.{port}"))
+
+    sslmode = target["sslmode"]
+    if sslmode in ("disable", "allow"):
+        return await asyncio.open_connection(host, port)
+
+    # The SSLRequest exchange happens in the clear on the raw socket; the
+    # stream is then opened over it with TLS already wrapped.
+    loop = asyncio.get_running_loop()
+    family, kind, proto, _, address = (await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM))[0]
+    sock = socket.socket(family, kind, proto)
+    sock.setblocking(False)
+    try:
+        await loop.sock_connect(sock, address)
+        await loop.sock_sendall(sock, (8).to_bytes(4, "big") + SSL_REQUEST_CODE.to_bytes(4, "big"))
+        answer = await loop.sock_recv(sock, 1)
+    except BaseException:
+        sock.close()
+        raise
+
+    if answer == b"S":
+        context = ssl.create_default_context()
+        if sslmode != "verify-full":
+            context.check_hostname = False
+        if sslmode not in ("verify-ca", "verify-full"):
+            context.verify_mode = ssl.CERT_NONE
+        return await asyncio.open_connection(sock=sock, ssl=context, server_hostname=host)
+    if answer != b"N" or sslmode in ("require", "verify-ca", "verify-full"):
+        sock.close()
+        raise PoolError(f"server at {host}:{port} does not support SSL")
+    return await asyncio.open_connection(sock=sock)
+
+
+class ServerConnection:
+    """One authenticated backend session owned by the pool."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.params: Dict[str, str] = {}
+        self.backend_key = b""
+        self.status = b"I"
+        self.idle_since = time.monotonic()
+
+    @classmethod
+    async def open(cls, target: Dict) -> "ServerConnection":
+        reader, writer = await _open_transport(target)
+        conn = cls(reader, writer)
+        try:
+            await conn._startup(target)
+        except BaseException:
+            conn.close()
+            raise
+        return conn
+
+    async def _startup(self, target: Dict):
+        params = {"user": target["user"], "database": target["database"],
+                  "application_name": "db-pool"}
+        if target["options"]:
+            params["options"] = target["options"]
+        body = PROTOCOL_VERSION.to_bytes(4, "big") + _cstrings(*(x for kv in params.items() for x in kv)) + b"\0"
+        self.writer.write((len(body) + 4).to_bytes(4, "big") + body)
+
+        scram = None
+        while True:
+            kind, payload = await _read_message(self.reader)
+            if kind == b"E":
+                raise PoolError(_error_text(payload))
+            if kind == b"S":
+                name, value = payload.split(b"\0")[:2]
+                self.params[name.decode()] = value.decode()
+            elif kind == b"K":
+                self.backend_key = payload
+            elif kind == b"Z":
+                self.status = payload
+                return
+            elif kind == b"R":
+                scram = self._authenticate(target, payload, scram)
+            await self.writer.drain()
+
+    def _authenticate(self, target: Dict, payload: bytes, scram: Optional[Dict]) -> Optional[Dict]:
+        code = int.from_bytes(payload[:4], "big")
+        password = target["password"]
+        if code == 0:
+            return None
+        if code == 3:
+            self.writer.write(_message(b"p", _cstrings(password)))
+        elif code == 5:
+            inner = hashlib.md5((password + target["user"]).encode()).hexdigest()
+            outer = hashlib.md5(inner.encode() + payload[4:8]).hexdigest()
+            self.writer.write(_message(b"p", _cstrings("md5" + outer)))
+        elif code == 10:
+            mechanisms = payload[4:].split(b"\0")
+            if b"SCRAM-SHA-256" not in mechanisms:
+                raise PoolError("server requires an unsupported SASL mechanism")
+            nonce = base64.b64encode(os.urandom(18)).decode()
+            first_bare = f"n=,r={nonce}"
+            first = ("n,," + first_bare).encode()
+            self.writer.write(_message(b"p", _cstrings("SCRAM-SHA-256") + len(first).to_bytes(4, "big") + first))
+            return {"nonce": nonce, "first_bare": first_bare}
+        elif code == 11:
+            server_first = payload[4:].decode()
+            attrs = dict(item.split("=", 1) for item in server_first.split(","))
+            if not attrs["r"].startswith(scram["nonce"]):
+                raise PoolError("SCRAM server nonce mismatch")
+            salted = hashlib.pbkdf2_hmac("sha256", password.encode(), base64.b64decode(attrs["s"]), int(attrs["i"]))
+            client_key = hmac.digest(salted, b"Client Key", "sha256")
+            without_proof = f"c=biws,r={attrs['r']}"
+            auth_message = f"{scram['first_bare']},{server_first},{without_proof}".encode()
+            signature = hmac.digest(hashlib.sha256(client_key).digest(), auth_message, "sha256")
+            proof = base64.b64encode(bytes(a ^ b for a, b in zip(client_key, signature))).decode()
+            self.writer.write(_message(b"p", f"{without_proof},p={proof}".encode()))
+            server_key = hmac.digest(salted, b"Server Key", "sha256")
+            scram["server_signature"] = base64.b64encode(hmac.digest(server_key, auth_message, "sha256")).decode()
+            return scram
+        elif code == 12:
+            if payload[4:].decode() != f"v={scram['server_signature']}":
+                raise PoolError("SCRAM server signature mismatch")
+        else:
+            raise PoolError(f"unsupported authentication request {code}")
+        return scram
+
+    async def query(self, sql: str) -> Optional[str]:
+        """Run a simple query to completion; return the error text, if any."""
+        self.writer.write(_message(b"Q", _cstrings(sql)))
+        await self.writer.drain()
+        error = None
+        while True:
+            kind, payload = await _read_message(self.reader)
+            if kind == b"E":
+                error = _error_text(payload)
+            elif kind == b"S":
+                name, value = payload.split(b"\0")[:2]
+                self.params[name.decode()] = value.decode()
+            elif kind == b"Z":
+                self.status = payload
+                return error
+
+    @property
+    def alive(self) -> bool:
+        return not self.writer.is_closing() and not self.reader.at_eof()
+
+    def close(self):
+        if not self.writer.is_closing():
+            if not self.reader.at_eof():
+                self.writer.write(_message(b"X"))
+            self.writer.close()
+
+
+class ConnectionPool:
+    """A bounded set of warm server sessions for a single target.
+
+    Idle sessions are kept most-recently-used first and watched while they
+    sit in the pool: anything the server sends to an idle session (usually a
+    FATAL before it hangs up) or reaching the idle timeout beyond the warm
+    minimum closes it, so acquire rarely hands out a dead socket.
+    """
+
+    def __init__(self, target: Dict, size: int = DEFAULT_POOL_SIZE, warm: int = DEFAULT_WARM_CONNECTIONS):
+        self.target = target
+        self.size = size
+        self.warm = min(warm, size)
+        self.slots = asyncio.Semaphore(size)
+        self.idle = []
+        self.watchers: Dict[ServerConnection, asyncio.Task] = {}
+        self.opened = 0
+
+    async def warm_up(self):
+        conns = await asyncio.gather(*(self.acquire() for _ in range(self.warm)))
+        for conn in conns:
+            self.release(conn, reusable=True)
+
+    async def acquire(self) -> ServerConnection:
+        await self.slots.acquire()
+        try:
+            while self.idle:
+                conn = self.idle.pop()
+                watcher = self.watchers.pop(conn)
+                watcher.cancel()
+                # Let the watcher's pending read unwind before anyone else
+                # reads from this stream.
+                await asyncio.gather(watcher, return_exceptions=True)
+                if conn.alive:
+                    return conn
+                conn.close()
+            conn = await asyncio.wait_for(ServerConnection.open(self.target), CONNECT_TIMEOUT_SECONDS)
+            self.opened += 1
+            return conn
+        except BaseException:
+            self.slots.release()
+            raise
+
+    def release(self, conn: ServerConnection, reusable: bool):
+        if reusable and conn.alive and conn.status == b"I":
+            conn.idle_since = time.monotonic()
+            self.idle.append(conn)
+            self.watchers[conn] = asyncio.create_task(self._watch_idle(conn))
+        else:
+            conn.close()
+        self.slots.release()
+
+    async def _watch_idle(self, conn: ServerConnection):
+        # Waiting on read() consumes nothing if the task is cancelled, so the
+        # session is untouched when acquire() takes it back.
+        while True:
+            try:
+                await asyncio.wait_for(conn.reader.read(1), IDLE_TIMEOUT_SECONDS)
+            except asyncio.TimeoutError:
+                if len(self.idle) <= self.warm:
+                    continue
+            break
+        self.idle.remove(conn)
+        self.watchers.pop(conn, None)
+        conn.close()
+
+    async def cancel(self, backend_key: bytes):
+        """Forward a CancelRequest for a server session to the real server."""
+        reader, writer = await _open_transport(self.target)
+        writer.write((16).to_bytes(4, "big") + CANCEL_REQUEST_CODE.to_bytes(4, "big") + backend_key)
+        await writer.drain()
+        writer.close()
+
+    def close(self):
+        for task in self.watchers.values():
+            task.cancel()
+        for conn in self.idle:
+            conn.close()
+        self.idle.clear()
+        self.watchers.clear()
+
+
+class PoolProxy:
+    """Session-pooling front end that speaks the postgres protocol to clients.
+
+    Each client gets its own server session for as long as it stays
+    connected. The proxy answers startup and authentication itself, replays
+    the server's parameters, and on Terminate resets the session with
+    DISCARD ALL and returns it to the pool instead of closing it. Clients
+    see a proxy-issued cancel key so a late cancel can never reach a session
+    that has since moved to someone else.
+    """
+
+    def __init__(self, pool: ConnectionPool, log: Callable[[str], None] = None):
+        self.pool = pool
+        self.log = log or (lambda message: print(message, file=sys.stderr))
+        self.cancel_keys: Dict[bytes, bytes] = {}
+        self.sessions = 0
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            params = await self._client_startup(reader, writer)
+            if params is not None:
+                await self._run_session(reader, writer, params)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except PoolError as e:
+            self.log(f"client rejected: {e}")
+        finally:
+            writer.close()
+
+    async def _client_startup(self, reader, writer) -> Optional[Dict[str, str]]:
+        while True:
+            code, body = await _read_startup(reader)
+            if code in (SSL_REQUEST_CODE, GSSENC_REQUEST_CODE):
+                # Local socket: no encryption between client and proxy.
+                writer.write(b"N")
+                await writer.drain()
+            elif code == CANCEL_REQUEST_CODE:
+                backend_key = self.cancel_keys.get(body[:8])
+                if backend_key:
+                    await self.pool.cancel(backend_key)
+                return None
+            elif code == PROTOCOL_VERSION:
+                items = body.split(b"\0")
+                return {items[i].decode(): items[i + 1].decode() for i in range(0, len(items) - 1, 2) if items[i]}
+            else:
+                writer.write(_error_message(f"unsupported frontend protocol {code >> 16}.{code & 0xFFFF}", "0A000"))
+                await writer.drain()
+                return None
+
+    async def _apply_client_params(self, conn: ServerConnection, params: Dict[str, str]):
+        settings = [
+            f"SET {name} TO '{value.replace(chr(39), chr(39) * 2)}'"
+            for name, value in params.items()
+            if name not in SESSION_IDENTITY_PARAMS and GUC_NAME_RE.match(name) and conn.params.get(name) != value
+        ]
+        if settings:
+            error = await conn.query("; ".join(settings))
+            if error:
+                self.log(f"ignoring client parameters: {error}")
+
+    async def _run_session(self, reader, writer, params: Dict[str, str]):
+        try:
+            conn = await self.pool.acquire()
+        except (OSError, PoolError, asyncio.TimeoutError) as e:
+            self.log(f"cannot open server connection: {e}")
+            writer.write(_error_message(f"db pool: {e}"))
+            await writer.drain()
+            return
+
+        reusable = False
+        client_key = os.urandom(8)
+        self.cancel_keys[client_key] = conn.backend_key
+        self.sessions += 1
+        try:
+            await self._apply_client_params(conn, params)
+            writer.write(_message(b"R", (0).to_bytes(4, "big"))
+                         + b"".join(_message(b"S", _cstrings(name, value)) for name, value in conn.params.items())
+                         + _message(b"K", client_key)
+                         + _message(b"Z", conn.status))
+            await writer.drain()
+            reusable = await self._pump(reader, writer, conn)
+            if reusable:
+                reusable = await self._reset(conn)
+        finally:
+            del self.cancel_keys[client_key]
+            self.pool.release(conn, reusable)
+
+    async def _pump(self, reader, writer, conn: ServerConnection) -> bool:
+        """Relay messages until either side leaves; True if the client said Terminate
+        with no request still in flight."""
+        # Every Query, Sync and FunctionCall is answered by exactly one
+        # ReadyForQuery, so this counts requests the server still owes.
+        outstanding = 0
+
+        async def client_to_server() -> bool:
+            nonlocal outstanding
+            while True:
+                try:
+                    kind, payload = await _read_message(reader)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    return False
+                if kind == b"X":
+                    return True
+                if kind in (b"Q", b"S", b"F"):
+                    outstanding += 1
+                conn.writer.write(_message(kind, payload))
+                await conn.writer.drain()
+
+        async def server_to_client():
+            nonlocal outstanding
+            while True:
+                kind, payload = await _read_message(conn.reader)
+                if kind == b"Z":
+                    outstanding -= 1
+                    conn.status = payload
+                elif kind == b"S":
+                    name, value = payload.split(b"\0")[:2]
+                    conn.params[name.decode()] = value.decode()
+                writer.write(_message(kind, payload))
+                await writer.drain()
+
+        upstream = asyncio.create_task(client_to_server())
+        downstream = asyncio.create_task(server_to_client())
+        try:
+            await asyncio.wait((upstream, downstream), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            upstream.cancel()
+            downstream.cancel()
+            await asyncio.gather(upstream, downstream, return_exceptions=True)
+
+        if not upstream.done() or upstream.cancelled() or upstream.exception():
+            return False
+        return upstream.result() and outstanding == 0
+
+    async def _reset(self, conn: ServerConnection) -> bool:
+        async def reset() -> bool:
+            if conn.status != b"I" and await conn.query("ROLLBACK"):
+                return False
+            return await conn.query("DISCARD ALL") is None
+
+        try:
+            return await asyncio.wait_for(reset(), RESET_TIMEOUT_SECONDS)
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            return False
+
+
+def client_url(target: Dict, port: int, socket_dir: Optional[Path] = None) -> str:
+    """The URL local tools should use to reach the pool instead of the server."""
+    user = quote(target["user"], safe="")
+    database = quote(target["database"], safe="")
+    if socket_dir is not None:
+        return f"postgresql://{user}@/{database}?host={quote(str(socket_dir), safe='/')}&port={port}"
+    return f"postgresql://{user}@127.0.0.1:{port}/{database}?sslmode=disable"
+
+
+def _running_pool_info(socket_dir: Path) -> Optional[Dict]:
+    """The pool.json of a pool that is still running, if any."""
+    try:
+        info = json.loads((socket_dir / POOL_INFO_FILE).read_text())
+        pid, port, tcp = int(info["pid"]), int(info["port"]), bool(info.get("tcp"))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return None
+    except PermissionError:
+        pass
+    if not tcp and not _socket_in_use(socket_dir / f".s.PGSQL.{port}"):
+        return None
+    return {"pid": pid, "port": port, "tcp": tcp}
+
+
+def running_pool_url(name: str, connection_string: str) -> Optional[str]:
+    """Client URL of a pool already serving this connection, on whatever port it was started."""
+    socket_dir = pool_socket_dir(name)
+    info = _running_pool_info(socket_dir)
+    if info is None:
+        return None
+    target = parse_target(connection_string)
+    return client_url(target, info["port"]) if info["tcp"] else client_url(target, info["port"], socket_dir)
+
+
+def _socket_in_use(path: Path) -> bool:
+    if not path.exists():
+        return False
+    with socket.socket(socket.AF_UNIX) as probe:
+        try:
+            probe.connect(str(path))
+            return True
+        except OSError:
+            return False
+
+
+async def serve(name: str, connection_string: str, port: int = DEFAULT_POOL_PORT, tcp: bool = False,
+                size: int = DEFAULT_POOL_SIZE, warm: int = DEFAULT_WARM_CONNECTIONS,
+                on_ready: Callable[[str, ConnectionPool], None] = None):
+    """Run a pool for one saved connection until cancelled.
+
+    By default it listens on a Unix socket in a 0700 directory, so only the
+    current user can reach it; with tcp=True it binds 127.0.0.1 instead,
+    where any local user can connect with the saved credentials. Either
+    way POOL_INFO_FILE in the connection's pool directory records the pid
+    and port while it runs, which is how running_pool_url finds it.
+    """
+    target = parse_target(connection_string)
+    socket_dir = pool_socket_dir(name)
+    running = _running_pool_info(socket_dir)
+    if running:
+        raise PoolError(f"a pool for '{name}' is already running (pid {running['pid']}, port {running['port']})")
+
+    pool = ConnectionPool(target, size, warm)
+    proxy = PoolProxy(pool)
+    await pool.warm_up()
+
+    socket_dir.mkdir(parents=True, exist_ok=True)
+    socket_dir.chmod(0o700)
+    socket_path = None
+    try:
+        if tcp:
+            server = await asyncio.start_server(proxy.handle_client, "127.0.0.1", port)
+            url = client_url(target, port)
+        else:
+            socket_path = socket_dir / f".s.PGSQL.{port}"
+            socket_path.unlink(missing_ok=True)
+            server = await asyncio.start_unix_server(proxy.handle_client, str(socket_path))
+            url = client_url(target, port, socket_dir)
+    except BaseException:
+        pool.close()
+        raise
+
+    info_path = socket_dir / POOL_INFO_FILE
+    info_path.write_text(json.dumps({"pid": os.getpid(), "port": port, "tcp": tcp}))
+    if on_ready:
+        on_ready(url, pool)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        pool.close()
+        if socket_path is not None:
+            socket_path.unlink(missing_ok=True)
+        info_path.unlink(missing_ok=True)
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import re
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from connection_store import SEARCH_INDEX
+
+SEARCH_INDEX_VERSION = 1
+# Weight a trigram carries when it occurs in each field; a trigram found in
+# several fields counts once, with its best weight.
+FIELD_WEIGHTS = {"name": 3, "tags": 2, "type": 2, "description": 1}
+# Share of the query's trigrams a connection must contain to be listed at
+# all, which leaves room for a typo or two.
+MIN_COVERAGE = 0.5
+DEFAULT_RESULT_LIMIT = 10
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def _windows(padded: str) -> List[str]:
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+def _doc_trigrams(text: str) -> set:
+    grams = set()
+    for token in _TOKEN_RE.findall(text.lower()):
+        grams.update(_windows(f"  {token} "))
+    return grams
+
+
+def _query_trigrams(query: str) -> List[str]:
+    # No trailing pad on query tokens, so a partial word matches as a prefix.
+    grams = []
+    for token in _TOKEN_RE.findall(query.lower()):
+        for gram in _windows(f"  {token}"):
+            if gram not in grams:
+                grams.append(gram)
+    return grams
+
+
+class SearchIndex:
+    """Trigram index over connection name, tags, type and description.
+
+    Saved next to the store together with the store's signature. Loading
+    checks the signature, so any write to the store triggers a rebuild on
+    the next search, and searches in between are a dictionary lookup per
+    query trigram rather than a scan of every connection.
+
+    Each posting list is kept as one string of `doc_id * 4 + weight`
+    numbers and only decoded when a query uses that trigram, so loading the
+    index costs little more than reading the file.
+    """
+
+    def __init__(self, signature: str, docs: List[Dict], postings: Dict[str, str]):
+        self.signature = signature
+        self.docs = docs
+        self.postings = postings
+        self._decoded: Dict[str, List[Tuple[int, int]]] = {}
+
+    @classmethod
+    def build(cls, connections: List[Dict], signature: str) -> "SearchIndex":
+        docs, postings = [], defaultdict(dict)
+        for doc_id, conn in enumerate(connections):
+            doc = {
+                "name": conn["name"],
+                "type": conn["type"],
+                "description": conn.get("description") or "",
+                "tags": conn.get("tags") or [],
+                "last_used": conn.get("last_used"),
+            }
+            docs.append(doc)
+            fields = {"name": doc["name"], "type": doc["type"], "tags": " ".join(doc["tags"]),
+                      "description": doc["description"]}
+            for field, text in fields.items():
+                for gram in _doc_trigrams(text):
+                    entry = postings[gram]
+                    entry[doc_id] = max(entry.get(doc_id, 0), FIELD_WEIGHTS[field])
+        encoded = {gram: " ".join(str(doc_id * 4 + weight) for doc_id, weight in entry.items())
+                   for gram, entry in postings.items()}
+        return cls(signature, docs, encoded)
+
+    @classmethod
+    def load_or_build(cls, store, path: Path = SEARCH_INDEX) -> "SearchIndex":
+        signature = store.signature()
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+            if data.get("version") == SEARCH_INDEX_VERSION and data.get("signature") == signature:
+                return cls(signature, data["docs"], data["postings"])
+        except (OSError, ValueError, KeyError):
+            pass
+
+        index = cls.build(store.list(), signature)
+        index.save(path)
+        return index
+
+    def save(self, path: Path = SEARCH_INDEX):
+        import tempfile
+
+        data = {"version": SEARCH_INDEX_VERSION, "signature": self.signature,
+                "docs": self.docs, "postings": self.postings}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def _posting(self, gram: str) -> List[Tuple[int, int]]:
+        if gram not in self._decoded:
+            raw = self.postings.get(gram, "")
+            self._decoded[gram] = [divmod(int(value), 4) for value in raw.split()]
+        return self._decoded[gram]
+
+    def search(self, query: str, limit: Optional[int] = DEFAULT_RESULT_LIMIT) -> List[Tuple[Dict, float]]:
+        """Best matches first; an empty query lists the most recently used."""
+        query = query.strip().lower()
+        recency = lambda doc: doc.get("last_used") or ""
+        if not query:
+            docs = sorted(self.docs, key=lambda d: d["name"])
+            docs.sort(key=recency, reverse=True)
+            return [(doc, 0.0) for doc in docs[:limit]]
+
+        grams = _query_trigrams(query)
+        if not grams:
+            return []
+
+        weights, hits = defaultdict(int), defaultdict(int)
+        for gram in grams:
+            for doc_id, weight in self._posting(gram):
+                weights[doc_id] += weight
+                hits[doc_id] += 1
+
+        ranked = []
+        best_possible = FIELD_WEIGHTS["name"] * len(grams)
+        for doc_id, weight in weights.items():
+            if hits[doc_id] / len(grams) < MIN_COVERAGE:
+                continue
+            doc = self.docs[doc_id]
+            score = weight / best_possible
+            lowered = doc["name"].lower()
+            if lowered == query:
+                score += 1.0
+            elif lowered.startswith(query):
+                score += 0.5
+            elif query in lowered:
+                score += 0.25
+            ranked.append((doc, round(score, 3)))
+
+        # Stable sorts: score first, then most recently used, then name.
+        ranked.sort(key=lambda item: item[0]["name"])
+        ranked.sort(key=lambda item: recency(item[0]), reverse=True)
+        ranked.sort(key=lambda item: item[1], reverse=True)
+        return ranked[:limit]
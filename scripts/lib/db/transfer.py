@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+
+import base64
+import hashlib
+import json
+import os
+from typing import Callable, Dict, Iterable, Iterator, Optional, TextIO
+
+from connection_store import RECORD_FIELDS
+
+EXPORT_FORMAT = "db-connections"
+EXPORT_VERSION = 1
+EXPORT_MODES = ("record", "bundle", "plain")
+KDF_ITERATIONS = 600_000
+BUNDLE_CHUNK_RECORDS = 100
+PASSPHRASE_ENV = "DB_EXPORT_PASSPHRASE"
+
+
+class TransferError(Exception):
+    pass
+
+
+def _fernet_module():
+    try:
+        from cryptography import fernet
+    except ImportError:
+        raise TransferError("encrypted export needs the cryptography package (pip install cryptography)")
+    return fernet
+
+
+def _cipher(passphrase: str, salt: bytes, iterations: int):
+    """Fernet keyed from a passphrase, so an export opens on any machine."""
+    if not passphrase:
+        raise TransferError("a passphrase is required for encrypted exports")
+    key = hashlib.pbkdf2_hmac("sha256", passphrase.encode(), salt, iterations)
+    return _fernet_module().Fernet(base64.urlsafe_b64encode(key))
+
+
+def write_export(out: TextIO, records: Iterable[Dict], mode: str = "record",
+                 passphrase: Optional[str] = None) -> int:
+    """Stream records to out as NDJSON, one header line first.
+
+    record: one line per connection, only connection_string encrypted, so
+        names and tags stay greppable.
+    bundle: records are encrypted in chunks of BUNDLE_CHUNK_RECORDS lines,
+        hiding everything while still streaming in bounded memory.
+    plain: nothing encrypted.
+    """
+    if mode not in EXPORT_MODES:
+        raise TransferError(f"unknown export mode '{mode}' (use one of: {', '.join(EXPORT_MODES)})")
+
+    header = {"format": EXPORT_FORMAT, "version": EXPORT_VERSION, "encryption": mode}
+    cipher = None
+    if mode != "plain":
+        salt = os.urandom(16)
+        header["kdf"] = {"name": "pbkdf2-sha256", "salt": base64.b64encode(salt).decode(),
+                         "iterations": KDF_ITERATIONS}
+        cipher = _cipher(passphrase, salt, KDF_ITERATIONS)
+    out.write(json.dumps(header) + "\n")
+
+    count = 0
+    chunk = []
+    for record in records:
+        record = {field: record.get(field) for field in RECORD_FIELDS}
+        count += 1
+        if mode == "bundle":
+            chunk.append(json.dumps(record))
+            if len(chunk) == BUNDLE_CHUNK_RECORDS:
+                out.write(json.dumps({"chunk": cipher.encrypt("\n".join(chunk).encode()).decode()}) + "\n")
+                chunk = []
+            continue
+        if cipher:
+            record["connection_string"] = cipher.encrypt(record["connection_string"].encode()).decode()
+        out.write(json.dumps(record) + "\n")
+
+    if chunk:
+        out.write(json.dumps({"chunk": cipher.encrypt("\n".join(chunk).encode()).decode()}) + "\n")
+    return count
+
+
+def prompt_passphrase(confirm: bool = False) -> str:
+    """Passphrase from $DB_EXPORT_PASSPHRASE, else asked for on the terminal."""
+    passphrase = os.environ.get(PASSPHRASE_ENV)
+    if passphrase:
+        return passphrase
+
+    import getpass
+    passphrase = getpass.getpass("Export passphrase: ")
+    if confirm and getpass.getpass("Repeat passphrase: ") != passphrase:
+        raise TransferError("passphrases do not match")
+    return passphrase
+
+
+def _validated(record: Dict, line_no: int) -> Dict:
+    missing = [field for field in ("name", "type", "connection_string") if not record.get(field)]
+    if missing:
+        raise TransferError(f"line {line_no}: record is missing {', '.join(missing)}")
+    return record
+
+
+def read_export(lines: Iterable[str], passphrase: Callable[[], str]) -> Iterator[Dict]:
+    """Yield plain records from an export, decrypting as it goes.
+
+    passphrase is only called if the header says the export is encrypted.
+    """
+    lines = iter(lines)
+    line_no = 0
+    header = None
+    for line in lines:
+        line_no += 1
+        if line.strip():
+            try:
+                header = json.loads(line)
+            except json.JSONDecodeError:
+                pass
+            break
+    if not isinstance(header, dict) or header.get("format") != EXPORT_FORMAT:
+        raise TransferError("not a connections export (missing header line)")
+    if header.get("version") != EXPORT_VERSION:
+        raise TransferError(f"unsupported export version {header.get('version')}")
+
+    mode = header.get("encryption")
+    if mode not in EXPORT_MODES:
+        raise TransferError(f"unknown export encryption '{mode}'")
+    cipher = None
+    if mode != "plain":
+        kdf = header["kdf"]
+        cipher = _cipher(passphrase(), base64.b64decode(kdf["salt"]), kdf["iterations"])
+    invalid_token = _fernet_module().InvalidToken if cipher else ()
+
+    for line in lines:
+        line_no += 1
+        if not line.strip():
+            continue
+        try:
+            entry = json.loads(line)
+            if mode == "bundle":
+                for record_line in cipher.decrypt(entry["chunk"].encode()).decode().split("\n"):
+                    yield _validated(json.loads(record_line), line_no)
+                continue
+            if cipher:
+                entry["connection_string"] = cipher.decrypt(entry["connection_string"].encode()).decode()
+        except invalid_token:
+            raise TransferError("wrong passphrase or corrupted export")
+        except (json.JSONDecodeError, KeyError, AttributeError) as e:
+            raise TransferError(f"line {line_no}: malformed entry ({e})")
+        yield _validated(entry, line_no)
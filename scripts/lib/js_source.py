@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+
+import re
+from functools import lru_cache
+
+# Characters that can change lexer state; everything between them is copied
+# through untouched, so the scan jumps from one interesting character to the
+# next instead of walking the source one character at a time.
+_SPECIAL = re.compile(r"[/'\"`{}]")
+_STRING_BODY = {
+    "'": re.compile(r"(?:[^'\\\n]|\\[\s\S])*"),
+    '"': re.compile(r'(?:[^"\\\n]|\\[\s\S])*'),
+}
+_TEMPLATE_BODY = re.compile(r"(?:[^`\\$]|\\[\s\S]|\$(?!\{))*")
+_REGEX_BODY = re.compile(r"(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])*")
+_NON_NEWLINE = re.compile(r"[^\n]")
+
+# A string literal keeps its contents only when it sits where a module
+# specifier goes: after `from`, a bare `import`, or inside the argument list
+# of require()/import()/require.context()/import.meta.glob(), including
+# later entries of a glob pattern array.
+_SPECIFIER_CONTEXT = re.compile(
+    r"(?:\bfrom|\bimport|(?:\brequire|\bimport|\brequire\.context|\bimport\.meta\.glob)\s*\("
+    r"\s*(?:\[\s*(?:(?:'[^'\n]*'|\"[^\"\n]*\")\s*,\s*)*)?)\s*$"
+)
+# require.context(dir, recursive, /filter/) keeps its filter regex.
+_REGEX_KEEP_CONTEXT = re.compile(r"\brequire\.context\s*\([^()]*,\s*$")
+_LOOKBEHIND = 256
+
+# After these, a `/` starts a regex literal rather than a division. `}` is
+# left out: in JSX/TSX, `<Foo bar={x} />` closes a tag after a brace, which
+# is far more common than a regex right after a block.
+_REGEX_PREFIX_CHARS = set("(,=:[!&|?{;+-*%~^")
+_REGEX_PREFIX_WORDS = re.compile(r"\b(?:return|typeof|instanceof|in|of|new|delete|void|throw|case|do|else|yield|await)\s*$")
+
+
+def _blank(text: str) -> str:
+    return _NON_NEWLINE.sub(" ", text)
+
+
+def _keeps_specifier(source: str, start: int) -> bool:
+    return _SPECIFIER_CONTEXT.search(source, max(0, start - _LOOKBEHIND), start) is not None
+
+
+def _regex_allowed(source: str, start: int) -> bool:
+    i = start - 1
+    while i >= 0 and source[i] in " \t\r\n":
+        i -= 1
+    if i < 0 or source[i] in _REGEX_PREFIX_CHARS:
+        return True
+    return _REGEX_PREFIX_WORDS.search(source, max(0, i - 16), i + 1) is not None
+
+
+def strip_comments_and_strings(source: str) -> str:
+    """Blank out comments and string/template/regex contents in JS/TS source.
+
+    Single linear pass. Every removed character becomes a space and newlines
+    are kept, so offsets and line numbers in the result match the input.
+    Quotes and backticks stay in place, and literals in module-specifier
+    position keep their text so import/export matchers still see paths.
+    """
+    out = []
+    pos = 0
+    n = len(source)
+    # One [brace depth, keep] entry per open `${` inside a template literal.
+    templates = []
+
+    def scan_template(start: int, keep: bool) -> int:
+        """Copy a template body from start; return where code resumes."""
+        match = _TEMPLATE_BODY.match(source, start)
+        end = match.end()
+        body = source[start:end]
+        out.append(body if keep else _blank(body))
+        if end >= n:
+            return n
+        if source[end] == "`":
+            out.append("`")
+            return end + 1
+        out.append("${")
+        templates.append([0, keep])
+        return end + 2
+
+    while pos < n:
+        match = _SPECIAL.search(source, pos)
+        if not match:
+            out.append(source[pos:])
+            break
+
+        i = match.start()
+        ch = source[i]
+        out.append(source[pos:i])
+
+        if ch == "{":
+            if templates:
+                templates[-1][0] += 1
+            out.append(ch)
+            pos = i + 1
+        elif ch == "}":
+            out.append(ch)
+            if templates and templates[-1][0] == 0:
+                _, keep = templates.pop()
+                pos = scan_template(i + 1, keep)
+            else:
+                if templates:
+                    templates[-1][0] -= 1
+                pos = i + 1
+        elif ch == "`":
+            out.append(ch)
+            pos = scan_template(i + 1, _keeps_specifier(source, i))
+        elif ch in "'\"":
+            end = _STRING_BODY[ch].match(source, i + 1).end()
+            body = source[i + 1:end]
+            out.append(ch)
+            out.append(body if _keeps_specifier(source, i) else _blank(body))
+            if end < n and source[end] == ch:
+                out.append(ch)
+                end += 1
+            pos = end
+        else:
+            nxt = source[i + 1:i + 2]
+            if nxt == "/":
+                end = source.find("\n", i)
+                end = n if end == -1 else end
+                out.append(_blank(source[i:end]))
+                pos = end
+            elif nxt == "*":
+                end = source.find("*/", i + 2)
+                end = n if end == -1 else end + 2
+                out.append(_blank(source[i:end]))
+                pos = end
+            elif _regex_allowed(source, i):
+                end = _REGEX_BODY.match(source, i + 1).end()
+                body = source[i + 1:end]
+                keep = _REGEX_KEEP_CONTEXT.search(source, max(0, i - _LOOKBEHIND), i) is not None
+                out.append("/")
+                out.append(body if keep else _blank(body))
+                if end < n and source[end] == "/":
+                    out.append("/")
+                    end += 1
+                pos = end
+            else:
+                out.append(ch)
+                pos = i + 1
+
+    return "".join(out)
+
+
+_TEMPLATE_EXPR = re.compile(r"\$\{[^}]*\}")
+_GLOB_TOKEN = re.compile(r"\*\*/|\*\*|\*|\?|\{[^{}]*\}|[^*?{]+")
+
+
+def template_to_glob(template: str) -> str:
+    """Turn a template-literal path like `./pages/${name}.tsx` into a glob."""
+    return _TEMPLATE_EXPR.sub("*", template)
+
+
+def glob_literal_prefix(pattern: str) -> str:
+    """Directory part of a glob before its first wildcard, with trailing slash."""
+    cut = len(pattern)
+    for ch in "*?{[":
+        idx = pattern.find(ch)
+        if idx != -1:
+            cut = min(cut, idx)
+    head = pattern[:cut]
+    return head[:head.rfind("/") + 1]
+
+
+@lru_cache(maxsize=1024)
+def glob_to_regex(pattern: str, star_crosses_dirs: bool = False) -> "re.Pattern":
+    """Compile a Vite/webpack style glob (`*`, `**`, `?`, `{a,b}`) to a regex.
+
+    With star_crosses_dirs, a single `*` also spans `/`, matching how bundlers
+    treat the expression parts of template-literal imports.
+    """
+    star = ".*" if star_crosses_dirs else "[^/]*"
+    parts = []
+    for token in _GLOB_TOKEN.findall(pattern):
+        if token == "**/":
+            parts.append("(?:.*/)?")
+        elif token == "**":
+            parts.append(".*")
+        elif token == "*":
+            parts.append(star)
+        elif token == "?":
+            parts.append("[^/]")
+        elif token.startswith("{") and token.endswith("}"):
+            parts.append("(?:" + "|".join(re.escape(alt) for alt in token[1:-1].split(",")) + ")")
+        else:
+            parts.append(re.escape(token))
+    return re.compile("".join(parts) + r"\Z")
@@ -5,16 +5,34 @@ import sys
 import re
 import json
 import argparse
+import hashlib
 import shutil
+import subprocess
+import time
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Set, Tuple, Optional
+from bisect import bisect_left
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Set, Tuple, Optional, Iterable, Iterator, Callable
+
+from js_source import strip_comments_and_strings, template_to_glob, glob_literal_prefix, glob_to_regex
 
 VERSION = "1.0.0"
 
-DEFAULT_EXCLUDE_DIRS = {"dist", "build", "tmp", ".next", "buildmodules", "node_modules", ".git", ".unused", ".unused_backups"}
+DEFAULT_EXCLUDE_DIRS = {"dist", "build", "tmp", ".next", "buildmodules", "node_modules", ".git", ".unused", ".unused_backups", ".unused_cache"}
 BACKUP_DIR = ".unused_backups"
 QUARANTINE_DIR = ".unused"
+# Snapshots live outside the scanned tree so they never show up as files to
+# scan or as untracked changes; ".unused_cache" above is where older
+# versions kept them.
+CACHE_ROOT = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "unused"
+SNAPSHOT_FILE = "graph.json"
+SNAPSHOT_VERSION = 2
+SCAN_WINDOW_PER_WORKER = 64
+PARALLEL_MIN_FILES = 64
+EXIT_UNUSED_FOUND = 1
+EXIT_ERROR = 2
 
 def print_welcome():
     print("\033[36m\033[1m")
@@ -44,9 +62,13 @@ def parse_args():
     parser.add_argument("--exclude-file", action="append", default=[], help="Exclude specific file names")
     parser.add_argument("--exclude-dir", action="append", default=[], help="Exclude directory names")
     parser.add_argument("--exclude-pattern", action="append", default=[], help="Exclude patterns (regex)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Parallel parse workers")
+    parser.add_argument("--since", metavar="REV", help="Re-parse only files changed since a git revision")
+    parser.add_argument("--changed", action="store_true", help="Re-parse only files changed since the last snapshot")
     parser.add_argument("--dry-run", action="store_true", help="Report only, no deletions")
     parser.add_argument("--no-interactive", action="store_true", help="Disable interactive prompts")
     parser.add_argument("--json", action="store_true", help="Output JSON report")
+    parser.add_argument("--ndjson", action="store_true", help="Stream findings as newline-delimited JSON")
     parser.add_argument("--report", help="Save report to JSON file")
     parser.add_argument("--revert", nargs="?", const="latest", help="Revert last deletion")
     parser.add_argument("--version", action="store_true", help="Show version")
@@ -67,9 +89,14 @@ OPTIONS:
     --exclude-file <name>     Exclude specific file by name (can repeat)
     --exclude-dir <name>      Exclude directory by name (can repeat)
     --exclude-pattern <regex> Exclude pattern (regex, can repeat)
+    --jobs <n>                Parallel parse workers (default: CPU count, 1 = serial)
+    --since <rev>             Incremental: re-parse only files changed since <rev>
+    --changed                 Incremental: re-parse only files changed since the last run
+                              Both reuse the import graph cached in $XDG_CACHE_HOME/unused/
     --dry-run                 Report only, no deletions
     --no-interactive          Disable prompts, just output report
-    --json                    Print JSON report
+    --json                    Print JSON report (progress goes to stderr)
+    --ndjson                  Stream one JSON finding per line, then a summary line
     --report <file.json>      Save results to file
     --revert [timestamp]      Revert last deletion (or specific timestamp)
                               Must be run from the same directory where files were deleted
@@ -80,131 +107,412 @@ EXAMPLES:
     unused
     unused --path ./src --ext ts,tsx,js
     unused --exclude-dir tests --dry-run
+    unused --changed --no-interactive        # Fast pre-commit check
+    unused --since origin/main --json        # Only re-parse what the branch touched
     unused --revert                          # Revert in current directory
     unused --revert --path ./src             # Revert in specific directory
+
+EXIT CODES:
+    0    No unused files (or interactive run)
+    1    Unused files found (with --json, --ndjson or --no-interactive)
+    2    Error (bad path, incremental mode outside a git checkout)
     """
     print(help_text)
 
-def find_files(base_path: str, extensions: List[str], exclude_dirs: Set[str], 
-               exclude_files: List[str], exclude_patterns: List[str]) -> List[Path]:
-    base = Path(base_path).resolve()
-    files = []
-    
+def make_file_filter(extensions: List[str], exclude_dirs: Set[str],
+                     exclude_files: List[str], exclude_patterns: List[str]) -> Callable[[str], bool]:
+    """Build the predicate deciding whether a base-relative path is analyzed.
+
+    Shared by the directory walk and the git-driven incremental mode so both
+    agree on which files belong to the graph.
+    """
+    suffixes = tuple(f".{ext}" for ext in extensions)
     compiled_patterns = [re.compile(pattern) for pattern in exclude_patterns]
     
+    def accepts(rel_path: str) -> bool:
+        filename = os.path.basename(rel_path)
+        if filename in exclude_files or not filename.endswith(suffixes):
+            return False
+        if any(part in exclude_dirs for part in Path(rel_path).parts[:-1]):
+            return False
+        return not any(pattern.search(rel_path) for pattern in compiled_patterns)
+    
+    return accepts
+
+def iter_files(base_path: str, exclude_dirs: Set[str], accepts: Callable[[str], bool]) -> Iterator[Path]:
+    base = Path(base_path).resolve()
+    cache_root = CACHE_ROOT.resolve()
+    
     for root, dirs, filenames in os.walk(base):
-        dirs[:] = [d for d in dirs if d not in exclude_dirs]
+        dirs[:] = [d for d in dirs if d not in exclude_dirs and Path(root, d) != cache_root]
         
         for filename in filenames:
-            if filename in exclude_files:
-                continue
-                
             file_path = Path(root) / filename
-            rel_path = file_path.relative_to(base)
-            
-            if any(pattern.search(str(rel_path)) for pattern in compiled_patterns):
-                continue
-            
-            if any(filename.endswith(f".{ext}") for ext in extensions):
-                files.append(file_path)
-    
-    return files
+            if accepts(str(file_path.relative_to(base))):
+                yield file_path
 
-def extract_exports(file_path: Path) -> Dict[str, List[str]]:
-    try:
-        content = file_path.read_text(encoding="utf-8")
-    except:
-        return {"default": [], "named": [], "star": []}
-    
+# One alternation per concern so each file is scanned once for exports and
+# once for imports, instead of once per pattern.
+EXPORT_RE = re.compile(
+    r'export\s+(?:'
+    r'(?P<default>default)\s'
+    r'|(?:const|let|var|function|class|type|interface|enum)\s+(?P<named>\w+)'
+    r'|\{(?P<braces>[^}]+)\}'
+    r'|\*\s+from\s+["\'](?P<star>[^"\']+)["\']'
+    r')'
+)
+
+IMPORT_RE = re.compile(
+    r'import\s+.*?\s+from\s+["\']([^"\']+)["\']'
+    r'|require\s*\(\s*["\']([^"\']+)["\']\s*\)'
+    r'|import\s*\(\s*["\']([^"\']+)["\']\s*\)'
+)
+
+# Edges that name a set of files rather than one: Vite globs, template-literal
+# dynamic imports/requires and webpack require.context().
+GLOB_IMPORT_RE = re.compile(
+    r'import\.meta\.glob\s*\(\s*(?P<globs>\[[^\]]*\]|["\'][^"\']*["\'])'
+    r'|(?:import|require)\s*\(\s*`(?P<template>[^`]*)`\s*\)'
+    r'|require\.context\s*\(\s*["\'](?P<context>[^"\']+)["\']'
+    r'(?:\s*,\s*(?P<recursive>true|false))?'
+    r'(?:\s*,\s*/(?P<filter>(?:[^/\\\n]|\\.)+)/[a-z]*)?'
+)
+QUOTED_RE = re.compile(r'["\']([^"\']*)["\']')
+
+def extract_exports(content: str) -> Dict[str, List[str]]:
     exports = {"default": [], "named": [], "star": []}
     
-    export_default = re.findall(r'export\s+default\s+', content)
-    if export_default:
-        exports["default"].append("default")
-    
-    named_exports = re.findall(r'export\s+(?:const|let|var|function|class|type|interface|enum)\s+(\w+)', content)
-    exports["named"].extend(named_exports)
-    
-    export_braces = re.findall(r'export\s+\{([^}]+)\}', content)
-    for match in export_braces:
-        names = [n.strip().split()[0] for n in match.split(",")]
-        exports["named"].extend(names)
-    
-    star_exports = re.findall(r'export\s+\*\s+from\s+["\']([^"\']+)["\']', content)
-    exports["star"].extend(star_exports)
+    for match in EXPORT_RE.finditer(content):
+        if match.group("default"):
+            if not exports["default"]:
+                exports["default"].append("default")
+        elif match.group("named"):
+            exports["named"].append(match.group("named"))
+        elif match.group("braces"):
+            names = [n.strip().split()[0] for n in match.group("braces").split(",") if n.strip()]
+            exports["named"].extend(names)
+        else:
+            exports["star"].append(match.group("star"))
     
     return exports
 
-def find_imports(base_path: Path, target_file: Path, all_files: List[Path]) -> Set[str]:
-    imports = set()
-    rel_target = target_file.relative_to(base_path)
-    
-    target_no_ext = str(rel_target.with_suffix(""))
-    possible_imports = [
-        target_no_ext,
-        f"./{target_no_ext}",
-        f"../{target_no_ext}",
-    ]
+def find_imports(content: str) -> List[str]:
+    return [next(g for g in match.groups() if g) for match in IMPORT_RE.finditer(content)]
+
+def find_glob_imports(content: str) -> List[Dict]:
+    """Collect many-file edges as unresolved {kind, pattern, filter} entries."""
+    edges = []
+    
+    for match in GLOB_IMPORT_RE.finditer(content):
+        if match.group("globs"):
+            for pattern in QUOTED_RE.findall(match.group("globs")):
+                if pattern and not pattern.startswith("!"):
+                    edges.append({"kind": "glob", "pattern": pattern, "filter": None})
+        elif match.group("template") is not None:
+            template = match.group("template")
+            kind = "template" if "${" in template else "static"
+            edges.append({"kind": kind, "pattern": template_to_glob(template), "filter": None})
+        else:
+            recursive = match.group("recursive") != "false"
+            pattern = match.group("context").rstrip("/") + ("/**/*" if recursive else "/*")
+            edges.append({"kind": "context", "pattern": pattern, "filter": match.group("filter")})
+    
+    return edges
+
+def resolve_specifier(base: str, importing_dir: str, spec: str) -> Optional[str]:
+    """Resolve a specifier to a base-relative path, or None if it leaves the tree."""
+    spec = spec.replace("\\", "/")
+    if spec.startswith("/"):
+        resolved = os.path.normpath(os.path.join(base, spec.lstrip("/")))
+    else:
+        resolved = os.path.normpath(os.path.join(importing_dir, spec))
+    rel = os.path.relpath(resolved, base)
+    return None if rel.startswith("..") else rel
+
+def scan_file(task: Tuple[str, str]) -> Dict:
+    """Parse one file into a combined export/import record.
+
+    Runs inside worker processes, so it takes and returns plain data only.
+    Comments and non-specifier string contents are blanked first, so imports
+    quoted in JSDoc or template strings don't become edges. Import specifiers
+    are resolved against the importing file and kept as base-relative paths
+    when they land inside the scanned tree.
+    """
+    base, path = task
+    record = {
+        "file": os.path.relpath(path, base),
+        "exports": {"default": [], "named": [], "star": []},
+        "imports": [],
+        "globs": [],
+    }
     
-    for file in all_files:
-        if file == target_file:
+    try:
+        with open(path, encoding="utf-8") as f:
+            content = f.read()
+    except (OSError, UnicodeDecodeError):
+        return record
+    
+    content = strip_comments_and_strings(content)
+    record["exports"] = extract_exports(content)
+    
+    importing_dir = os.path.dirname(path)
+    for spec in find_imports(content):
+        rel = resolve_specifier(base, importing_dir, spec)
+        if rel:
+            record["imports"].append(rel)
+    
+    for edge in find_glob_imports(content):
+        if not edge["pattern"].startswith((".", "/")):
             continue
-        
-        try:
-            content = file.read_text(encoding="utf-8")
-        except:
+        pattern = resolve_specifier(base, importing_dir, edge["pattern"])
+        if not pattern:
             continue
+        if edge["kind"] == "static":
+            record["imports"].append(pattern)
+        else:
+            edge["pattern"] = pattern
+            record["globs"].append(edge)
+    
+    return record
+
+def scan_files(base_path: Path, paths: Iterable[Path], jobs: int) -> Iterator[Dict]:
+    """Stream scan records for paths as the walker produces them.
+
+    Paths are handed to a process pool while the walk is still running and
+    records are yielded in walk order, keeping at most a bounded window of
+    files in flight so memory stays flat on large trees.
+    """
+    base = str(base_path)
+    tasks = ((base, str(path)) for path in paths)
+    
+    if jobs <= 1:
+        yield from map(scan_file, tasks)
+        return
+    
+    max_in_flight = jobs * SCAN_WINDOW_PER_WORKER
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for task in tasks:
+            pending.append(executor.submit(scan_file, task))
+            while pending and (len(pending) >= max_in_flight or pending[0].done()):
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def build_import_graph(records: Iterable[Dict]) -> Tuple[Dict[str, Dict], Dict[str, Set[str]]]:
+    """Aggregate scan records into a file index and a reverse import map."""
+    index = {}
+    imported_by = defaultdict(set)
+    update_import_graph(index, imported_by, [], records)
+    return index, imported_by
+
+def update_import_graph(index: Dict[str, Dict], imported_by: Dict[str, Set[str]],
+                        removed: Iterable[str], records: Iterable[Dict]):
+    """Patch the graph in place: drop edges of removed/replaced files, add new records."""
+    for rel in removed:
+        old = index.pop(rel, None)
+        if old:
+            for target in old["imports"]:
+                imported_by[target].discard(rel)
+    
+    for record in records:
+        rel = record["file"]
+        old = index.get(rel)
+        if old:
+            for target in old["imports"]:
+                imported_by[target].discard(rel)
+        index[rel] = record
+        for target in record["imports"]:
+            if target != rel:
+                imported_by[target].add(rel)
+
+def git(base_path: Path, *args: str) -> List[str]:
+    result = subprocess.run(["git", "-C", str(base_path), *args],
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or f"git {' '.join(args)} failed")
+    return [line for line in result.stdout.splitlines() if line]
+
+def git_changed_files(base_path: Path, rev: Optional[str]) -> Set[str]:
+    """Base-relative paths that differ from rev in the working tree, plus untracked files."""
+    toplevel = Path(git(base_path, "rev-parse", "--show-toplevel")[0])
+    changed = git(base_path, "diff", "--name-only", "--no-renames", rev or "HEAD", "--", ".")
+    untracked = git(base_path, "ls-files", "--others", "--exclude-standard", "--full-name", "--", ".")
+    
+    paths = set()
+    for name in changed + untracked:
+        rel = os.path.relpath(toplevel / name, base_path)
+        if not rel.startswith(".."):
+            paths.add(rel)
+    return paths
+
+def snapshot_options(extensions: List[str], exclude_dirs: Set[str], exclude_files: List[str],
+                     exclude_patterns: List[str]) -> Dict:
+    return {
+        "version": SNAPSHOT_VERSION,
+        "extensions": sorted(extensions),
+        "exclude_dirs": sorted(exclude_dirs),
+        "exclude_files": sorted(exclude_files),
+        "exclude_patterns": sorted(exclude_patterns),
+    }
+
+def snapshot_dir(base_path: Path) -> Path:
+    """Cache directory for the snapshot of one scanned tree."""
+    return CACHE_ROOT / hashlib.sha256(str(base_path).encode()).hexdigest()[:16]
+
+def load_snapshot(base_path: Path, options: Dict) -> Optional[Dict]:
+    snapshot_path = snapshot_dir(base_path) / SNAPSHOT_FILE
+    try:
+        with open(snapshot_path) as f:
+            snapshot = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    
+    if snapshot.get("options") != options or snapshot.get("base_path") != str(base_path):
+        return None
+    return snapshot
+
+def save_snapshot(base_path: Path, options: Dict, head: str, dirty: Set[str], index: Dict[str, Dict]):
+    cache_path = snapshot_dir(base_path)
+    cache_path.mkdir(parents=True, exist_ok=True)
+    snapshot = {
+        "base_path": str(base_path),
+        "options": options,
+        "head": head,
+        "dirty": sorted(dirty),
+        "records": list(index.values()),
+    }
+    tmp_path = cache_path / f"{SNAPSHOT_FILE}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(snapshot, f, separators=(",", ":"))
+    os.replace(tmp_path, cache_path / SNAPSHOT_FILE)
+
+def incremental_scan(base_path: Path, since: Optional[str], options: Dict, exclude_dirs: Set[str],
+                     accepts: Callable[[str], bool], jobs: int) -> Tuple[Dict[str, Dict], Dict[str, Set[str]], int]:
+    """Build the import graph from the cached snapshot, re-parsing only changed files.
+
+    The snapshot remembers the HEAD it was taken at and which files were dirty
+    then, so files edited and later reverted are re-parsed as well. Without a
+    usable snapshot this falls back to a full scan and writes one.
+
+    Returns the file index, the reverse import map and the number of files parsed.
+    """
+    head = git(base_path, "rev-parse", "HEAD")[0]
+    dirty = git_changed_files(base_path, None)
+    snapshot = load_snapshot(base_path, options)
+    
+    if snapshot is None:
+        index, imported_by = build_import_graph(
+            scan_files(base_path, iter_files(str(base_path), exclude_dirs, accepts), jobs)
+        )
+        parsed = len(index)
+    else:
+        index, imported_by = build_import_graph(snapshot["records"])
+        changed = set(snapshot["dirty"]) | dirty
+        if since or snapshot["head"] != head:
+            changed |= git_changed_files(base_path, since or snapshot["head"])
         
-        import_patterns = [
-            r'import\s+.*?\s+from\s+["\']([^"\']+)["\']',
-            r'require\s*\(\s*["\']([^"\']+)["\']\s*\)',
-            r'import\s*\(\s*["\']([^"\']+)["\']\s*\)',
-        ]
+        candidates = {rel for rel in changed if accepts(rel)}
+        present = [rel for rel in candidates if (base_path / rel).is_file()]
+        removed = candidates.difference(present)
         
-        for pattern in import_patterns:
-            matches = re.findall(pattern, content)
-            for match in matches:
-                normalized = match.replace("\\", "/")
-                
-                try:
-                    importing_dir = file.parent
-                    resolved = (importing_dir / match).resolve()
-                    target_resolved = target_file.resolve()
-                    
-                    if resolved == target_resolved or resolved == target_resolved.with_suffix(""):
-                        imports.add(str(file.relative_to(base_path)))
-                except:
-                    pass
-    
-    return imports
-
-def analyze_files(base_path: Path, files: List[Path]) -> Tuple[List[Dict], List[Dict]]:
+        if len(present) < PARALLEL_MIN_FILES:
+            jobs = 1
+        update_import_graph(index, imported_by, removed,
+                            scan_files(base_path, (base_path / rel for rel in sorted(present)), jobs))
+        parsed = len(present)
+    
+    save_snapshot(base_path, options, head, dirty, index)
+    return index, imported_by, parsed
+
+def expand_glob_edges(index: Dict[str, Dict]) -> Dict[str, Set[str]]:
+    """Resolve glob, template and require.context edges against the file index.
+
+    Matching runs over the already-scanned paths, narrowed by each pattern's
+    literal directory prefix, so lazily loaded chunks are found without
+    touching the filesystem again.
+    """
+    files = sorted(index)
+    imported_by = defaultdict(set)
+    
+    for rel, record in index.items():
+        for edge in record.get("globs", ()):
+            pattern = edge["pattern"]
+            prefix = glob_literal_prefix(pattern)
+            regex = glob_to_regex(pattern, star_crosses_dirs=edge["kind"] == "template")
+            try:
+                context_filter = re.compile(edge["filter"]) if edge["filter"] else None
+            except re.error:
+                context_filter = None
+            
+            for target in files[bisect_left(files, prefix):]:
+                if not target.startswith(prefix):
+                    break
+                if target == rel:
+                    continue
+                if not (regex.match(target) or regex.match(os.path.splitext(target)[0])):
+                    continue
+                if context_filter and not context_filter.search("./" + target[len(prefix):]):
+                    continue
+                imported_by[target].add(rel)
+    
+    return imported_by
+
+def analyze_files(index: Dict[str, Dict], imported_by: Dict[str, Set[str]]) -> Tuple[List[Dict], List[Dict]]:
     unused = []
     uncertain = []
+    glob_imported_by = expand_glob_edges(index)
     
-    for file in files:
-        if file.name == "index.ts" or file.name == "index.tsx":
+    for rel, record in index.items():
+        if os.path.basename(rel) in ("index.ts", "index.tsx"):
             continue
         
-        exports = extract_exports(file)
-        imports = find_imports(base_path, file, files)
+        exports = record["exports"]
+        imports = (imported_by.get(rel, set()) | imported_by.get(os.path.splitext(rel)[0], set())
+                   | glob_imported_by.get(rel, set()))
         
         has_exports = (exports["default"] or exports["named"] or exports["star"])
         
         if not imports and has_exports:
             unused.append({
-                "file": str(file.relative_to(base_path)),
-                "exports": exports
+                "file": rel,
+                "exports": exports,
+                "imported_by": [],
+                "reason": "No imports found"
             })
         elif imports and has_exports:
             uncertain.append({
-                "file": str(file.relative_to(base_path)),
+                "file": rel,
                 "exports": exports,
-                "imported_by": list(imports)
+                "imported_by": sorted(imports),
+                "reason": "Imported, exports need manual review"
             })
     
     return unused, uncertain
 
+def build_report(unused: List[Dict], uncertain: List[Dict], stats: Dict) -> Dict:
+    return {
+        "unused": unused,
+        "uncertain": uncertain,
+        "stats": stats,
+        "timestamp": datetime.now().isoformat()
+    }
+
+def stream_ndjson(unused: List[Dict], uncertain: List[Dict], stats: Dict):
+    """Write one finding per line as soon as it is serialized, then a summary line."""
+    out = sys.stdout
+    for kind, items in (("unused", unused), ("uncertain", uncertain)):
+        for item in items:
+            out.write(json.dumps({"type": kind, **item}) + "\n")
+    out.write(json.dumps({
+        "type": "summary",
+        "unused": len(unused),
+        "uncertain": len(uncertain),
+        **stats,
+        "timestamp": datetime.now().isoformat()
+    }) + "\n")
+    out.flush()
+
 def print_report(unused: List[Dict], uncertain: List[Dict]):
     print("\n" + "="*60)
     print("📊 ANALYSIS REPORT")
@@ -371,46 +679,60 @@ def main():
     
     base_path = Path(args.path).resolve()
     
+    machine = args.json or args.ndjson
+    log = sys.stderr if machine else sys.stdout
+    
     if not base_path.exists():
-        print(f"❌ Path not found: {args.path}")
-        sys.exit(1)
+        print(f"❌ Path not found: {args.path}", file=log)
+        sys.exit(EXIT_ERROR)
     
     extensions = [e.strip() for e in args.ext.split(",")]
     exclude_dirs = DEFAULT_EXCLUDE_DIRS | set(args.exclude_dir)
     
-    print(f"🔍 Scanning {base_path}...")
-    print(f"📁 Extensions: {', '.join(extensions)}")
-    print(f"🚫 Excluding dirs: {', '.join(sorted(exclude_dirs))}\n")
+    print(f"🔍 Scanning {base_path}...", file=log)
+    print(f"📁 Extensions: {', '.join(extensions)}", file=log)
+    print(f"🚫 Excluding dirs: {', '.join(sorted(exclude_dirs))}\n", file=log)
     
-    files = find_files(
-        str(base_path),
-        extensions,
-        exclude_dirs,
-        args.exclude_file,
-        args.exclude_pattern
-    )
+    accepts = make_file_filter(extensions, exclude_dirs, args.exclude_file, args.exclude_pattern)
+    timings = {}
+    started = time.perf_counter()
+    
+    if args.since or args.changed:
+        options = snapshot_options(extensions, exclude_dirs, args.exclude_file, args.exclude_pattern)
+        try:
+            index, imported_by, parsed = incremental_scan(base_path, args.since, options,
+                                                          exclude_dirs, accepts, args.jobs)
+        except (RuntimeError, FileNotFoundError) as e:
+            print(f"❌ Incremental mode needs a git checkout: {e}", file=log)
+            sys.exit(EXIT_ERROR)
+        print(f"📄 Analyzed {len(index)} files ({parsed} re-parsed)...\n", file=log)
+    else:
+        files = iter_files(str(base_path), exclude_dirs, accepts)
+        index, imported_by = build_import_graph(scan_files(base_path, files, args.jobs))
+        parsed = len(index)
+        print(f"📄 Analyzed {len(index)} files...\n", file=log)
     
-    print(f"📄 Found {len(files)} files to analyze...\n")
+    timings["graph_ms"] = round((time.perf_counter() - started) * 1000, 1)
     
-    unused, uncertain = analyze_files(base_path, files)
+    phase_started = time.perf_counter()
+    unused, uncertain = analyze_files(index, imported_by)
+    timings["analyze_ms"] = round((time.perf_counter() - phase_started) * 1000, 1)
+    timings["total_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    
+    stats = {"files": len(index), "parsed": parsed, "timings": timings}
+    exit_code = EXIT_UNUSED_FOUND if unused else 0
+    
+    if args.ndjson:
+        stream_ndjson(unused, uncertain, stats)
+        sys.exit(exit_code)
     
     if args.json:
-        report = {
-            "unused": unused,
-            "uncertain": uncertain,
-            "timestamp": datetime.now().isoformat()
-        }
-        print(json.dumps(report, indent=2))
-        return
+        print(json.dumps(build_report(unused, uncertain, stats), indent=2))
+        sys.exit(exit_code)
     
     if args.report:
-        report = {
-            "unused": unused,
-            "uncertain": uncertain,
-            "timestamp": datetime.now().isoformat()
-        }
         with open(args.report, "w") as f:
-            json.dump(report, f, indent=2)
+            json.dump(build_report(unused, uncertain, stats), f, indent=2)
         print(f"📊 Report saved to {args.report}")
     
     print_report(unused, uncertain)
@@ -419,6 +741,9 @@ def main():
         interactive_menu(base_path, unused, args.dry_run)
     elif args.dry_run and unused:
         print("🔍 DRY RUN: No changes made.")
+    
+    if args.no_interactive:
+        sys.exit(exit_code)
 
 if __name__ == "__main__":
     main()
@@ -15,6 +15,8 @@ from dataclasses import dataclass
 from collections import defaultdict
 from datetime import datetime
 
+from js_source import strip_comments_and_strings, template_to_glob, glob_to_regex
+
 VERSION = "3.0.0"
 
 DEFAULT_EXCLUDE_DIRS = {
@@ -46,6 +48,11 @@ EXCLUDED_PACKAGES = {
 BACKUP_DIR = ".unused_backups"
 QUARANTINE_DIR = ".unused"
 
+# Import kinds that load modules without binding a name; the glob-like ones
+# carry a glob pattern in import_path instead of a single module path.
+NAMELESS_IMPORT_TYPES = {'side-effect', 'dynamic', 'dynamic-template', 'glob', 'require-context'}
+GLOB_IMPORT_TYPES = {'dynamic-template', 'glob', 'require-context'}
+
 SUPPORTED_EXTENSIONS = {
     'typescript': ['ts', 'tsx'],
     'javascript': ['js', 'jsx', 'mjs', 'cjs'],
@@ -634,6 +641,7 @@ class JavaScriptAnalyzer:
         except Exception:
             return []
         
+        content = strip_comments_and_strings(content)
         imports = []
         lines = content.split('\n')
         
@@ -643,6 +651,10 @@ class JavaScriptAnalyzer:
             (r"import\s+\*\s+as\s+(\w+)\s+from\s+['\"]([^'\"]+)['\"]", 'namespace'),
             (r"import\s+['\"]([^'\"]+)['\"]", 'side-effect'),
             (r"(?:const|let|var)\s+(\w+)\s*=\s*require\s*\(\s*['\"]([^'\"]+)['\"]\s*\)", 'require'),
+            (r"import\s*\(\s*['\"]([^'\"]+)['\"]\s*\)", 'dynamic'),
+            (r"(?:import|require)\s*\(\s*`([^`]+)`\s*\)", 'dynamic-template'),
+            (r"import\.meta\.glob\s*\(\s*(\[[^\]]*\]|['\"][^'\"]*['\"])", 'glob'),
+            (r"require\.context\s*\(\s*['\"]([^'\"]+)['\"](?:\s*,\s*(true|false))?", 'require-context'),
         ]
         
         for line_num, line in enumerate(lines, 1):
@@ -663,14 +675,25 @@ class JavaScriptAnalyzer:
                                 import_type=import_type,
                                 line_number=line_num
                             ))
-                    elif import_type == 'side-effect':
-                        imports.append(ImportInfo(
-                            source_file=file_path,
-                            imported_name='',
-                            import_path=match.group(1),
-                            import_type=import_type,
-                            line_number=line_num
-                        ))
+                    elif import_type in NAMELESS_IMPORT_TYPES:
+                        if import_type == 'glob':
+                            paths = [p for p in re.findall(r"['\"]([^'\"]*)['\"]", match.group(1))
+                                     if p and not p.startswith('!')]
+                        elif import_type == 'dynamic-template':
+                            paths = [template_to_glob(match.group(1))]
+                        elif import_type == 'require-context':
+                            recursive = match.group(2) != 'false'
+                            paths = [match.group(1).rstrip('/') + ('/**/*' if recursive else '/*')]
+                        else:
+                            paths = [match.group(1)]
+                        for module_path in paths:
+                            imports.append(ImportInfo(
+                                source_file=file_path,
+                                imported_name='',
+                                import_path=module_path,
+                                import_type=import_type,
+                                line_number=line_num
+                            ))
                     else:
                         imports.append(ImportInfo(
                             source_file=file_path,
@@ -689,6 +712,7 @@ class JavaScriptAnalyzer:
         except Exception:
             return []
         
+        content = strip_comments_and_strings(content)
         exports = []
         lines = content.split('\n')
         
@@ -1137,7 +1161,7 @@ class UnusedAnalyzer:
                 imports = JavaScriptAnalyzer.extract_imports_detailed(file_path)
                 
                 for import_info in imports:
-                    if import_info.import_type == 'side-effect':
+                    if import_info.import_type in NAMELESS_IMPORT_TYPES:
                         continue
                     
                     usages = JavaScriptAnalyzer.find_usage_in_file(file_path, import_info.imported_name)
@@ -1244,6 +1268,12 @@ class UnusedAnalyzer:
                 for import_info in imports:
                     if import_info.import_path in possible_import_paths:
                         return True
+                    if import_info.import_type in GLOB_IMPORT_TYPES and import_info.import_path.startswith('.'):
+                        pattern = os.path.relpath(
+                            os.path.normpath(file_path.parent / import_info.import_path), self.base_path)
+                        regex = glob_to_regex(pattern, star_crosses_dirs=import_info.import_type == 'dynamic-template')
+                        if regex.match(str(rel_target)) or regex.match(target_without_ext):
+                            return True
         
         return False
 
@@ -0,0 +1,92 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+repo_root="$(cd -- "$(dirname -- "${BASH_SOURCE[0]}")/../.." && pwd)"
+db_lib="$repo_root/scripts/lib/db"
+
+tmp_dir="$(mktemp -d)"
+trap 'rm -rf "$tmp_dir"' EXIT
+
+# Runs 'db pool' against a fake trust-auth postgres server on a non-default
+# port: the pool must be discoverable on that port, and two client sessions
+# in a row must share one server session, reset with DISCARD ALL between.
+DOTFILES_DATA_DIR="$tmp_dir" PYTHONPATH="$db_lib" python3 - <<'PY'
+import asyncio
+
+import pg_pool
+from pg_pool import _cstrings, _message, _read_message, _read_startup
+
+POOL_PORT = 6543
+startups = 0
+queries = []
+
+
+async def fake_server(reader, writer):
+    global startups
+    code, _ = await _read_startup(reader)
+    assert code == pg_pool.PROTOCOL_VERSION, code
+    startups += 1
+    writer.write(_message(b"R", (0).to_bytes(4, "big"))
+                 + _message(b"S", _cstrings("server_version", "16.0"))
+                 + _message(b"K", (startups).to_bytes(4, "big") + b"key!")
+                 + _message(b"Z", b"I"))
+    await writer.drain()
+    try:
+        while True:
+            kind, payload = await _read_message(reader)
+            if kind == b"X":
+                break
+            if kind == b"Q":
+                queries.append(payload.rstrip(b"\0").decode())
+                writer.write(_message(b"C", _cstrings("SELECT 1")) + _message(b"Z", b"I"))
+                await writer.drain()
+    except asyncio.IncompleteReadError:
+        pass
+    writer.close()
+
+
+async def client_session(socket_path):
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+    body = pg_pool.PROTOCOL_VERSION.to_bytes(4, "big") + _cstrings("user", "app", "database", "app") + b"\0"
+    writer.write((len(body) + 4).to_bytes(4, "big") + body)
+    while (await _read_message(reader))[0] != b"Z":
+        pass
+    writer.write(_message(b"Q", _cstrings("SELECT 1")))
+    while (await _read_message(reader))[0] != b"Z":
+        pass
+    writer.write(_message(b"X"))
+    await writer.drain()
+    writer.close()
+
+
+async def main():
+    server = await asyncio.start_server(fake_server, "127.0.0.1", 0)
+    server_port = server.sockets[0].getsockname()[1]
+    url = f"postgresql://app@127.0.0.1:{server_port}/app?sslmode=disable"
+
+    ready = asyncio.Event()
+    pool_task = asyncio.create_task(pg_pool.serve("demo", url, port=POOL_PORT, size=1, warm=1,
+                                                  on_ready=lambda *_: ready.set()))
+    await asyncio.wait_for(ready.wait(), 5)
+
+    pool_url = pg_pool.running_pool_url("demo", url)
+    assert pool_url and f"port={POOL_PORT}" in pool_url, pool_url
+
+    socket_path = str(pg_pool.pool_socket_dir("demo") / f".s.PGSQL.{POOL_PORT}")
+    for _ in range(2):
+        await client_session(socket_path)
+        for _ in range(50):
+            if queries and queries[-1] == "DISCARD ALL":
+                break
+            await asyncio.sleep(0.02)
+
+    assert startups == 1, f"expected one reused server session, got {startups}"
+    assert queries == ["SELECT 1", "DISCARD ALL"] * 2, queries
+
+    pool_task.cancel()
+    await asyncio.gather(pool_task, return_exceptions=True)
+    assert pg_pool.running_pool_url("demo", url) is None
+    server.close()
+
+asyncio.run(main())
+PY
@@ -0,0 +1,29 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+repo_root="$(cd -- "$(dirname -- "${BASH_SOURCE[0]}")/../.." && pwd)"
+db_lib="$repo_root/scripts/lib/db"
+
+# libpq keyword DSNs and socket-directory URIs must still validate, and the
+# pool must resolve them to the same server the client would.
+PYTHONPATH="$db_lib" python3 - <<'PY'
+from drivers import get_driver
+import pg_pool
+
+driver = get_driver("postgres")
+
+keyword_dsn = "host=db.internal port=6432 dbname='app db' user=svc"
+assert driver.validate(keyword_dsn) is None, driver.validate(keyword_dsn)
+assert driver.address(keyword_dsn) == ("db.internal", 6432)
+target = pg_pool.parse_target(keyword_dsn)
+assert (target["host"], target["port"], target["database"], target["user"]) == ("db.internal", 6432, "app db", "svc"), target
+
+socket_uri = "postgresql:///mydb?host=/var/run/postgresql"
+assert driver.validate(socket_uri) is None, driver.validate(socket_uri)
+assert driver.address(socket_uri) is None
+target = pg_pool.parse_target(socket_uri)
+assert (target["host"], target["database"]) == ("/var/run/postgresql", "mydb"), target
+
+assert driver.validate("host") is not None
+assert driver.validate("mysql://localhost/app") is not None
+PY
@@ -0,0 +1,24 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+repo_root="$(cd -- "$(dirname -- "${BASH_SOURCE[0]}")/../.." && pwd)"
+db_lib="$repo_root/scripts/lib/db"
+
+# Turso connections may be saved as a bare database name, as `db turso`
+# uses them; only values with a scheme are checked as URLs.
+PYTHONPATH="$db_lib" python3 - <<'PY'
+from drivers import get_driver
+
+driver = get_driver("turso")
+
+assert driver.validate("my-turso-db") is None, driver.validate("my-turso-db")
+assert driver.address("my-turso-db") is None
+assert driver.probe("my-turso-db", 1.0) is None
+
+assert driver.validate("libsql://my-db-org.turso.io?authToken=t") is None
+assert driver.address("libsql://my-db-org.turso.io") == ("my-db-org.turso.io", 443)
+
+assert driver.validate("postgres://host/db") is not None
+assert driver.validate("libsql://") is not None
+assert driver.validate("") is not None
+PY
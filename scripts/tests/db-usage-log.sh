@@ -0,0 +1,70 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+repo_root="$(cd -- "$(dirname -- "${BASH_SOURCE[0]}")/../.." && pwd)"
+db_lib="$repo_root/scripts/lib/db"
+tmp="$(mktemp -d)"
+trap 'rm -rf "$tmp"' EXIT
+
+# Uses applied to the store right before a crash must not be counted again,
+# and a deleted connection's pending uses must not leak into a new one.
+PYTHONPATH="$db_lib" python3 - "$tmp" <<'PY'
+import sys
+from pathlib import Path
+
+from connection_store import JsonConnectionStore, SqliteConnectionStore, UsageLog
+
+tmp = Path(sys.argv[1])
+record = {"name": "app", "type": "postgres", "connection_string": "x", "description": "",
+          "tags": [], "created_at": "2024-01-01T00:00:00", "last_used": None, "use_count": 0}
+
+for store in (JsonConnectionStore(tmp / "c.json"), SqliteConnectionStore(tmp / "c.db")):
+    log = UsageLog(tmp / f"{store.backend}.log")
+    store.insert(dict(record))
+    for i in range(3):
+        log.append("app", f"2024-01-02T00:00:0{i}")
+
+    # Die after the store write, before the truncate.
+    usage, mark = log._read(open(log.path, "rb"), store.usage_mark())
+    store.apply_usage(usage, mark)
+    assert store.get("app")["use_count"] == 3
+    assert log.overlay(store, [store.get("app")])[0]["use_count"] == 3, store.backend
+
+    log.append("app", "2024-01-03T00:00:00")
+    log.compact(store)
+    assert store.get("app")["use_count"] == 4, store.backend
+    assert log.path.stat().st_size == 0
+
+    log.append("app", "2024-01-04T00:00:00")
+    store.delete("app")
+    log.forget(store, "app")
+    store.insert(dict(record))
+    log.compact(store)
+    assert log.overlay(store, [store.get("app")])[0]["use_count"] == 0, store.backend
+PY
+
+# Migrating to SQLite right after such a crash keeps the mark, and the
+# cached health results come along.
+PYTHONPATH="$db_lib" python3 - "$tmp" <<'PY'
+import sys
+from pathlib import Path
+
+from connection_store import JsonConnectionStore, SqliteConnectionStore, UsageLog, migrate_json_to_sqlite
+
+tmp = Path(sys.argv[1]) / "migrate"
+tmp.mkdir()
+source = JsonConnectionStore(tmp / "c.json")
+source.insert({"name": "app", "type": "postgres", "connection_string": "x", "description": "",
+               "tags": [], "created_at": "2024-01-01T00:00:00", "last_used": None, "use_count": 0})
+source.save_health({"app": {"status": "ok", "checked_at": 1.0}})
+log = UsageLog(tmp / "usage.log")
+log.append("app", "2024-01-02T00:00:00")
+usage, mark = log._read(open(log.path, "rb"), source.usage_mark())
+source.apply_usage(usage, mark)
+
+assert migrate_json_to_sqlite(tmp / "c.json", tmp / "c.db") == 1
+target = SqliteConnectionStore(tmp / "c.db")
+assert target.load_health() == {"app": {"status": "ok", "checked_at": 1.0}}
+log.compact(target)
+assert target.get("app")["use_count"] == 1
+PY
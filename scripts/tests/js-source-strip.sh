@@ -0,0 +1,35 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+repo_root="$(cd -- "$(dirname -- "${BASH_SOURCE[0]}")/../.." && pwd)"
+lib="$repo_root/scripts/lib"
+
+PYTHONPATH="$lib" python3 - <<'PY'
+from js_source import strip_comments_and_strings as strip
+
+def check(source, kept, blanked=()):
+    out = strip(source)
+    assert len(out) == len(source) and out.count("\n") == source.count("\n"), out
+    for text in kept:
+        assert text in out, f"{text!r} lost in {out!r}"
+    for text in blanked:
+        assert text not in out, f"{text!r} not blanked in {out!r}"
+
+# Comments, strings and regexes are blanked; specifiers survive.
+check(
+    "// import a from './commented'\nimport b from './real'; const s = 'import c from \"./str\"';\n",
+    ["'./real'"],
+    ["./commented", "./str"],
+)
+check("const re = /from '.\\/x'/; import y from './y';", ["'./y'"], ["./x"])
+
+# JSX self-closing tags after an attribute expression are not regexes.
+check(
+    "const a = <Foo bar={x} />; import Bar from './bar';\n",
+    ["<Foo bar={x} />", "'./bar'"],
+)
+check(
+    "export const App = () => <Layout {...props} title={t} /> ; import('./lazy');\n",
+    ["/>", "'./lazy'"],
+)
+PY
@@ -0,0 +1,105 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+repo_root="$(cd -- "$(dirname -- "${BASH_SOURCE[0]}")/../.." && pwd)"
+skill_creator="$repo_root/configs/agents/skills/skill-creator"
+tmp="$(mktemp -d)"
+trap 'rm -rf "$tmp"' EXIT
+
+# Drive run_eval and run_loop end to end with the offline fake backend:
+# early stopping, the trigger cache, failed runs and journal resume.
+cd "$tmp"
+mkdir skill
+cat > skill/SKILL.md <<'MD'
+---
+name: demo
+description: Demo skill for tests
+---
+
+body
+MD
+cat > evals.json <<'JSON'
+[{"query": "a yes", "should_trigger": true}, {"query": "b yes", "should_trigger": true},
+ {"query": "c no", "should_trigger": false}, {"query": "d no", "should_trigger": false},
+ {"query": "e maybe", "should_trigger": true}, {"query": "f yes", "should_trigger": false}]
+JSON
+
+export PYTHONPATH="$skill_creator" XDG_CACHE_HOME="$tmp/cache"
+
+run_eval() {
+  python3 -m scripts.run_eval --eval-set evals.json --skill-path skill --num-workers 6 --runs-per-query 5 "$@" 2>/dev/null
+}
+run_loop() {
+  python3 -m scripts.run_loop --eval-set evals.json --skill-path skill --backend fake --model m \
+    --report none --no-cache --max-iterations 2 --runs-per-query 3 --num-workers 4 "$@"
+}
+
+run_eval --backend fake --no-cache --early-stop off > full.json
+run_eval --backend fake --no-cache --early-stop exact > exact.json
+run_eval --backend fake:error_rate=1 > errors.json
+run_eval --backend fake > first.json
+run_eval --backend fake > second.json
+
+run_loop --results-dir runs > loop.json 2>/dev/null
+run_dir="$(echo runs/*)"
+cp -r "$run_dir" resumed
+# Keep the first iteration and part of the second, then tear the last line
+# the way a crash mid-write would.
+python3 - resumed/logs/journal.jsonl <<'PY'
+import json
+import sys
+
+lines = open(sys.argv[1]).read().splitlines()
+improve = next(i for i, line in enumerate(lines) if json.loads(line)["event"] == "improve")
+open(sys.argv[1], "w").write("\n".join(lines[:improve + 6]) + '\n{"event": "run", "qu')
+PY
+run_loop --resume resumed > resumed.json 2>/dev/null
+if run_loop --resume "$run_dir" --backend fake:seed=1 > /dev/null 2> mismatch.err; then
+  echo "resume with a different backend should fail" >&2
+  exit 1
+fi
+
+python3 - "$run_dir" <<'PY'
+import json
+import sys
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)
+
+def without_timing(value):
+    if isinstance(value, dict):
+        return {k: without_timing(v) for k, v in value.items() if k != "timing"}
+    if isinstance(value, list):
+        return [without_timing(v) for v in value]
+    return value
+
+# "exact" stops early but must reach the same verdicts as doing every run.
+full, exact = load("full.json"), load("exact.json")
+assert full["summary"]["runs"] == 6 * 5, full["summary"]
+assert exact["summary"]["runs"] < full["summary"]["runs"], exact["summary"]
+assert [r["pass"] for r in exact["results"]] == [r["pass"] for r in full["results"]]
+
+# Failed runs are retried, counted, kept out of the rate and never cached.
+errors = load("errors.json")
+assert errors["summary"]["runs_failed"] > 0 and errors["summary"]["retries"] > 0, errors["summary"]
+for result in errors["results"]:
+    assert result["errors"] > 0 and result["trigger_rate"] is None and not result["pass"], result
+
+# The first clean run misses the cache; the second answers from it.
+first, second = load("first.json"), load("second.json")
+assert first["summary"]["cache_hits"] == 0, first["summary"]
+assert second["summary"]["cache_hits"] == first["summary"]["runs"], second["summary"]
+assert [r["pass"] for r in second["results"]] == [r["pass"] for r in first["results"]]
+
+# Resuming a torn journal replays the recorded runs and reaches the same result.
+assert without_timing(load("resumed.json")) == without_timing(load("loop.json"))
+def run_events(path):
+    with open(path) as f:
+        return sum(1 for line in f if '"event": "run"' in line)
+recorded = run_events(f"{sys.argv[1]}/logs/journal.jsonl")
+assert recorded and run_events("resumed/logs/journal.jsonl") == recorded
+
+err = open("mismatch.err").read().strip()
+assert err.startswith("Error: Cannot resume") and "\n" not in err, err
+PY
@@ -0,0 +1,37 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+repo_root="$(cd -- "$(dirname -- "${BASH_SOURCE[0]}")/../.." && pwd)"
+unused="$repo_root/bin/unused"
+tool="$repo_root/scripts/lib/tools/remove-unused-files.py"
+tmp="$(mktemp -d)"
+trap 'rm -rf "$tmp"' EXIT
+
+# The --changed snapshot must not land in the scanned tree, where it would
+# dirty the checkout and be scanned on the next run.
+mkdir -p "$tmp/app"
+cd "$tmp/app"
+git init -q
+printf "import { a } from './a'\nconsole.log(a)\n" > index.ts
+printf "export const a = 1\n" > a.ts
+git add . && git -c user.name=t -c user.email=t@t commit -qm init
+
+XDG_CACHE_HOME="$tmp/app/.cache" "$unused" --changed --dry-run --no-interactive --json >/dev/null 2>&1 || [ $? -eq 1 ]
+XDG_CACHE_HOME="$tmp/app/.cache" "$unused" --changed --dry-run --no-interactive --json >/dev/null 2>&1 || [ $? -eq 1 ]
+
+[ ! -e .unused_cache ]
+ls .cache/unused/*/graph.json >/dev/null
+
+# Even when the cache directory sits inside the tree, it is never scanned.
+printf "export const stray = 1\n" > .cache/unused/stray.ts
+XDG_CACHE_HOME="$tmp/app/.cache" PYTHONPATH="$repo_root/scripts/lib" python3 - "$tool" <<'PY'
+import importlib.util
+import sys
+
+spec = importlib.util.spec_from_file_location("unused", sys.argv[1])
+unused = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(unused)
+files = {p.name for p in unused.iter_files(".", {".git"}, lambda rel: True)}
+assert "stray.ts" not in files and "graph.json" not in files, files
+assert {"index.ts", "a.ts"} <= files, files
+PY